@@ -51,6 +51,10 @@ st.markdown("""
 def load_orchestrator():
     try:
         from src.orchestrator_agents import OrquestradorBancoAgil
+        from src.services.exchange_service import get_rate_refresher
+
+        # Cotacoes mantidas em memoria (uma vez por processo)
+        get_rate_refresher().iniciar()
         return OrquestradorBancoAgil(verbose=False)
     except FileNotFoundError as e:
         st.error(f"Arquivo nao encontrado: {str(e)}")
@@ -76,6 +80,8 @@ if "session_id" not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4())
 if "message_count" not in st.session_state:
     st.session_state.message_count = 0
+if "metricas_turno" not in st.session_state:
+    st.session_state.metricas_turno = None
 
 # ==============================================================================
 # 2. FUNCOES AUXILIARES
@@ -90,6 +96,7 @@ def nova_conversa():
     # Nova sessão para o Langfuse
     st.session_state.session_id = str(uuid.uuid4())
     st.session_state.message_count = 0
+    st.session_state.metricas_turno = None
 
 # ==============================================================================
 # 3. LAYOUT DA APLICACAO
@@ -132,6 +139,17 @@ with st.sidebar:
 
     st.markdown("---")
 
+    # Tempo da última resposta (streaming)
+    if st.session_state.metricas_turno:
+        metricas = st.session_state.metricas_turno
+        ttft = metricas.get("ttft_ms")
+        st.metric(
+            "⚡ Primeiro token",
+            f"{ttft / 1000:.2f} s" if ttft is not None else "N/A",
+            help=f"Resposta completa em {metricas['total_ms'] / 1000:.2f} s"
+        )
+        st.markdown("---")
+
     # Serviços disponíveis
     with st.expander("ℹ️ Serviços"):
         st.markdown("""
@@ -201,141 +219,126 @@ if user_input:
 
     # Processar com o orquestrador simples
     with st.chat_message("assistant"):
-        with st.spinner("Processando..."):
-            try:
-                # Importar ferramentas de observabilidade
-                from src.utils.observability import get_langfuse_client, sanitize_cpf
-
-                # Obter cliente Langfuse para criar trace
-                langfuse = get_langfuse_client()
-
-                # Definir session_id no estado para o orquestrador
-                st.session_state.estado["session_id"] = st.session_state.session_id
-
-                # Criar span para esta mensagem usando o SDK nativo
-                span_context = None
-                if langfuse:
-                    try:
-                        user_id = "anonymous"
-                        if st.session_state.authenticated and st.session_state.estado.get("cpf"):
-                            user_id = sanitize_cpf(st.session_state.estado.get("cpf"))
-
-                        span_context = langfuse.start_as_current_span(
-                            name=f"message_{st.session_state.message_count}",
-                            input={"user_message": user_input},
-                            metadata={
-                                "authenticated": st.session_state.authenticated,
-                                "total_messages": len(st.session_state.messages),
-                                "agente_atual": st.session_state.estado.get("agente_atual")
-                            }
-                        )
-                        span_context.__enter__()
-
-                        # Atualizar trace com user_id e session_id
-                        langfuse.update_current_trace(
-                            user_id=user_id,
-                            session_id=st.session_state.session_id
-                        )
-                    except Exception:
-                        span_context = None
-
-                # Processar mensagem (orquestrador atualizará o span)
-                resposta, novo_estado = orquestrador.processar(
-                    user_input,
-                    st.session_state.estado
-                )
-
-                # Verificar se agente mudou
-                agente_anterior = st.session_state.estado.get("agente_atual")
-                agente_novo = novo_estado.get("agente_atual")
-                mudou_agente = (agente_anterior != agente_novo)
-
-                # Atualizar estado
-                st.session_state.estado = novo_estado
-
-                # Exibir resposta
-                st.container(border=True).markdown(resposta)
-
-                # Salvar no histórico
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": resposta
-                })
-
-                # Atualizar dados do cliente se autenticado
-                if novo_estado.get("autenticado"):
-                    st.session_state.authenticated = True
-                    st.session_state.client_data = {
-                        "nome": novo_estado.get("nome"),
-                        "cpf": novo_estado.get("cpf"),
-                        "limite_credito": novo_estado.get("limite"),
-                        "score_credito": novo_estado.get("score")
-                    }
-
-                # AUTO-CONTINUAR se mudou de agente E não tem pergunta
-                if mudou_agente and "?" not in resposta:
-                    # Processar continuação automática
-                    with st.spinner("Continuando..."):
-                        resposta_cont, novo_estado_cont = orquestrador.processar(
-                            "[CONTINUACAO]",  # Mensagem interna
-                            st.session_state.estado
-                        )
-
-                        # Atualizar estado novamente
-                        st.session_state.estado = novo_estado_cont
-
-                        # Exibir resposta de continuação
-                        st.container(border=True).markdown(resposta_cont)
-
-                        # Salvar no histórico
-                        st.session_state.messages.append({
-                            "role": "assistant",
-                            "content": resposta_cont
-                        })
-
-                        # Atualizar dados do cliente
-                        if novo_estado_cont.get("autenticado"):
-                            st.session_state.client_data = {
-                                "nome": novo_estado_cont.get("nome"),
-                                "cpf": novo_estado_cont.get("cpf"),
-                                "limite_credito": novo_estado_cont.get("limite"),
-                                "score_credito": novo_estado_cont.get("score")
-                            }
-
-                # Finalizar span
-                if span_context:
-                    try:
-                        langfuse.update_current_span(
-                            output={
-                                "assistant_response": resposta,
-                                "response_length": len(resposta)
-                            },
-                            metadata={
-                                "agente_usado": agente_anterior,
-                                "agente_final": novo_estado.get("agente_atual"),
-                                "auto_continuou": mudou_agente and "?" not in resposta
-                            }
-                        )
-                        span_context.__exit__(None, None, None)
-                    except Exception:
-                        pass
-
-            except Exception as e:
-                import traceback
-                error_msg = f"Erro ao processar: {str(e)}"
-                st.container(border=True).error(error_msg)
-                st.code(traceback.format_exc())  # Debug
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": "Desculpe, ocorreu um erro. Tente novamente."
-                })
-
-                # Garantir que span seja fechado em caso de erro
-                if span_context:
-                    try:
-                        span_context.__exit__(type(e), e, e.__traceback__)
-                    except Exception:
-                        pass
+        try:
+            # Importar ferramentas de observabilidade
+            from src.utils.observability import get_langfuse_client, sanitize_cpf
+
+            # Obter cliente Langfuse para criar trace
+            langfuse = get_langfuse_client()
+
+            # Definir session_id no estado para o orquestrador
+            st.session_state.estado["session_id"] = st.session_state.session_id
+
+            # Criar span para esta mensagem usando o SDK nativo
+            span_context = None
+            if langfuse:
+                try:
+                    user_id = "anonymous"
+                    if st.session_state.authenticated and st.session_state.estado.get("cpf"):
+                        user_id = sanitize_cpf(st.session_state.estado.get("cpf"))
+
+                    span_context = langfuse.start_as_current_span(
+                        name=f"message_{st.session_state.message_count}",
+                        input={"user_message": user_input},
+                        metadata={
+                            "authenticated": st.session_state.authenticated,
+                            "total_messages": len(st.session_state.messages),
+                            "agente_atual": st.session_state.estado.get("agente_atual")
+                        }
+                    )
+                    span_context.__enter__()
+
+                    # Atualizar trace com user_id e session_id
+                    langfuse.update_current_trace(
+                        user_id=user_id,
+                        session_id=st.session_state.session_id
+                    )
+                except Exception:
+                    span_context = None
+
+            # Processar mensagem em streaming (orquestrador atualizará o span)
+            aviso = st.empty()
+            aviso.caption("Processando...")
+            fim = {}
+
+            def tokens():
+                """Texto da resposta à medida que chega; tools aparecem no aviso."""
+                for evento in orquestrador.processar_stream(user_input, st.session_state.estado):
+                    if evento["tipo"] == "token":
+                        if not fim.get("primeiro_token"):
+                            fim["primeiro_token"] = True
+                            aviso.empty()
+                        yield evento["conteudo"]
+                    elif evento["tipo"] == "tool" and evento["fase"] == "inicio":
+                        aviso.caption(f"🔧 Consultando {evento['nome']}...")
+                    elif evento["tipo"] == "fim":
+                        fim.update(evento)
+
+            st.container(border=True).write_stream(tokens())
+            aviso.empty()
+
+            resposta, novo_estado = fim["resposta"], fim["estado"]
+            st.session_state.metricas_turno = fim["metricas"]
+
+            # Verificar se agente mudou
+            agente_anterior = st.session_state.estado.get("agente_atual")
+            agente_novo = novo_estado.get("agente_atual")
+            mudou_agente = (agente_anterior != agente_novo)
+
+            # Atualizar estado
+            st.session_state.estado = novo_estado
+
+            # Salvar no histórico
+            st.session_state.messages.append({
+                "role": "assistant",
+                "content": resposta
+            })
+
+            # Atualizar dados do cliente se autenticado
+            if novo_estado.get("autenticado"):
+                st.session_state.authenticated = True
+                st.session_state.client_data = {
+                    "nome": novo_estado.get("nome"),
+                    "cpf": novo_estado.get("cpf"),
+                    "limite_credito": novo_estado.get("limite"),
+                    "score_credito": novo_estado.get("score")
+                }
+
+            # Finalizar span
+            if span_context:
+                try:
+                    langfuse.update_current_span(
+                        output={
+                            "assistant_response": resposta,
+                            "response_length": len(resposta)
+                        },
+                        metadata={
+                            "agente_usado": agente_anterior,
+                            "agente_final": novo_estado.get("agente_atual"),
+                            "mudou_agente": mudou_agente,
+                            **fim["metricas"]
+                        }
+                    )
+                    span_context.__exit__(None, None, None)
+                except Exception:
+                    pass
+
+        except Exception as e:
+            import traceback
+            error_msg = f"Erro ao processar: {str(e)}"
+            st.container(border=True).error(error_msg)
+            st.code(traceback.format_exc())  # Debug
+            st.session_state.messages.append({
+                "role": "assistant",
+                "content": "Desculpe, ocorreu um erro. Tente novamente."
+            })
+
+            # Garantir que span seja fechado em caso de erro
+            if span_context:
+                try:
+                    span_context.__exit__(type(e), e, e.__traceback__)
+                except Exception:
+                    pass
 
     # Rerun para atualizar
     st.rerun()
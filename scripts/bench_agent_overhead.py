@@ -0,0 +1,116 @@
+"""
+Benchmark do custo por turno dos agentes (sem OpenAI).
+
+Usa um LLM falso que responde na hora, de modo que o tempo medido é só
+o overhead do LangChain em cada mensagem:
+- antes: prompt, agente e AgentExecutor recriados a cada mensagem, com o
+  system prompt formatado com o estado do turno
+- depois: AgentePadrao com executor montado uma vez e o estado passado
+  como variáveis do prompt
+
+Uso:
+    pipenv run python scripts/bench_agent_overhead.py --turnos 300
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from langchain.agents import AgentExecutor, create_openai_functions_agent
+from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+from src.agentes import AgentePadrao
+from src.config.prompts import CREDITO_SYSTEM_PROMPT, credito_prompt_variables, format_credito_prompt
+from src.tools.common_tools import end_conversation, get_help
+from src.tools.credit_tools import check_max_limit_for_score, get_credit_limit, request_limit_increase
+from src.utils.fake_llm import FakeChatModel
+
+
+TOOLS = [get_credit_limit, request_limit_increase, check_max_limit_for_score, end_conversation, get_help]
+
+ESTADO = {
+    "cpf_cliente": "12345678900",
+    "nome_cliente": "Ana Silva",
+    "limite_credito": 5000.0,
+    "score_credito": 650,
+    "voltou_da_entrevista": False
+}
+
+HISTORICO = [
+    ("user", "Ola"),
+    ("assistant", "Ola! Como posso ajudar?"),
+    ("user", "Qual meu limite?"),
+    ("assistant", "Seu limite atual e R$ 5.000,00."),
+]
+
+
+def processar_antes(llm, mensagem: str) -> dict:
+    """Reproduz o fluxo antigo: tudo reconstruído a cada mensagem."""
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", format_credito_prompt(ESTADO)),
+        MessagesPlaceholder(variable_name="historico"),
+        ("human", "{mensagem}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+    agent = create_openai_functions_agent(llm=llm, tools=TOOLS, prompt=prompt_template)
+    executor = AgentExecutor(
+        agent=agent,
+        tools=TOOLS,
+        return_intermediate_steps=True,
+        max_iterations=10,
+        handle_parsing_errors=True
+    )
+    return executor.invoke({"mensagem": mensagem, "historico": HISTORICO})
+
+
+def medir(nome: str, executar, num_turnos: int) -> float:
+    """Executa os turnos e imprime média/p50/p95 em ms; retorna a média."""
+    executar()  # Aquecimento (imports preguiçosos, caches)
+
+    latencias = []
+    for _ in range(num_turnos):
+        inicio = time.perf_counter()
+        executar()
+        latencias.append((time.perf_counter() - inicio) * 1000)
+
+    latencias.sort()
+    media = statistics.mean(latencias)
+    print(
+        f"{nome:<34} media={media:7.3f}ms  "
+        f"p50={latencias[len(latencias) // 2]:7.3f}ms  "
+        f"p95={latencias[int(len(latencias) * 0.95)]:7.3f}ms"
+    )
+    return media
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turnos", type=int, default=300, help="Mensagens por cenario")
+    args = parser.parse_args()
+
+    llm = FakeChatModel(responder=lambda mensagens: "Posso ajudar com seu limite.")
+    agente = AgentePadrao("credito", llm, TOOLS, CREDITO_SYSTEM_PROMPT)
+    variaveis = credito_prompt_variables(ESTADO)
+
+    print("Banco Agil - Overhead por turno dos agentes (LLM falso)\n")
+    antes = medir(
+        "antes (executor por mensagem)",
+        lambda: processar_antes(llm, "Quero aumentar meu limite"),
+        args.turnos
+    )
+    depois = medir(
+        "depois (executor reutilizado)",
+        lambda: agente.processar("Quero aumentar meu limite", HISTORICO, variaveis),
+        args.turnos
+    )
+    print(f"\nReducao do overhead por turno: {antes / depois:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
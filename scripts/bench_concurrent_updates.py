@@ -0,0 +1,127 @@
+"""
+Benchmark de atualizações concorrentes no DataService (CSV).
+
+Dispara N threads e depois N processos atualizando scores de clientes
+disjuntos e verifica, ao final, se alguma atualização foi perdida.
+
+Uso:
+    pipenv run python scripts/bench_concurrent_updates.py --workers 8 --updates 50
+"""
+
+import argparse
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.services.data_service import DataService
+
+
+CLIENTES_POR_WORKER = 5
+
+
+def criar_base(data_dir: Path, num_workers: int) -> None:
+    """Cria um clientes.csv com CLIENTES_POR_WORKER clientes por worker."""
+    total = num_workers * CLIENTES_POR_WORKER
+    df = pd.DataFrame({
+        "cpf": [f"{i:011d}" for i in range(1, total + 1)],
+        "nome": [f"Cliente {i}" for i in range(1, total + 1)],
+        "data_nascimento": ["01/01/1980"] * total,
+        "limite_credito": [1000.0] * total,
+        "score_credito": [0] * total
+    })
+    df.to_csv(data_dir / "clientes.csv", index=False)
+
+
+def cpfs_do_worker(worker_id: int) -> list[str]:
+    """CPFs atualizados exclusivamente por um worker."""
+    inicio = worker_id * CLIENTES_POR_WORKER + 1
+    return [f"{i:011d}" for i in range(inicio, inicio + CLIENTES_POR_WORKER)]
+
+
+def worker(data_dir: str, worker_id: int, num_updates: int) -> None:
+    """Atualiza os scores dos seus clientes; o último valor é num_updates."""
+    service = DataService(Path(data_dir))
+    cpfs = cpfs_do_worker(worker_id)
+
+    for n in range(1, num_updates + 1):
+        service.update_client_score(cpfs[n % len(cpfs)], n)
+
+    # Última rodada: todos os clientes do worker terminam com num_updates
+    for cpf in cpfs:
+        service.update_client_score(cpf, num_updates)
+
+
+def contar_perdidas(data_dir: Path, num_workers: int, num_updates: int) -> int:
+    """Conta clientes cujo score final não é o último valor gravado."""
+    df = pd.read_csv(data_dir / "clientes.csv", dtype={"cpf": str})
+    scores = dict(zip(df["cpf"], df["score_credito"]))
+
+    return sum(
+        1
+        for worker_id in range(num_workers)
+        for cpf in cpfs_do_worker(worker_id)
+        if scores.get(cpf) != num_updates
+    )
+
+
+def executar(modo: str, num_workers: int, num_updates: int) -> None:
+    """Executa um cenário (threads ou processos) e imprime o resultado."""
+    data_dir = Path(tempfile.mkdtemp(prefix="bench_updates_"))
+
+    try:
+        criar_base(data_dir, num_workers)
+
+        if modo == "threads":
+            workers = [
+                threading.Thread(target=worker, args=(str(data_dir), i, num_updates))
+                for i in range(num_workers)
+            ]
+        else:
+            workers = [
+                multiprocessing.Process(target=worker, args=(str(data_dir), i, num_updates))
+                for i in range(num_workers)
+            ]
+
+        inicio = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        duracao = time.perf_counter() - inicio
+
+        total = num_workers * (num_updates + CLIENTES_POR_WORKER)
+        perdidas = contar_perdidas(data_dir, num_workers, num_updates)
+
+        print(
+            f"{modo:<10} workers={num_workers:<3} updates={total:<6} "
+            f"tempo={duracao:7.2f}s  vazao={total / duracao:8.1f} upd/s  "
+            f"perdidas={perdidas}"
+        )
+
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8, help="Numero de threads/processos")
+    parser.add_argument("--updates", type=int, default=50, help="Atualizacoes por worker")
+    args = parser.parse_args()
+
+    print("Banco Agil - Benchmark de atualizacoes concorrentes\n")
+    executar("threads", args.workers, args.updates)
+    executar("processos", args.workers, args.updates)
+
+
+if __name__ == "__main__":
+    main()
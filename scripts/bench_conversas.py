@@ -0,0 +1,253 @@
+"""
+Benchmark de conversas completas com LLM roteirizado (sem OpenAI).
+
+Reproduz conversas de vários turnos (autenticação -> limite -> entrevista
+-> câmbio) pelo OrquestradorBancoAgil, com um LLM falso que devolve
+chamadas de tools e respostas predeterminadas. Assim o tempo medido é só
+o do próprio sistema, dividido por etapa em cada turno:
+- prompt:   montagem das mensagens do prompt (ChatPromptTemplate)
+- llm:      chamadas ao modelo (falso: ~0)
+- tools:    execução das tools (inclui o I/O de dados)
+- dados:    chamadas ao DataService (CSV/SQLite)
+- orquestr: o restante (roteamento, executor, histórico, estado)
+
+A montagem dos executores acontece uma vez, na criação do orquestrador,
+e é mostrada à parte.
+
+Roda sobre uma cópia temporária de data/ (a entrevista altera o score) e
+com a API de câmbio desligada: as cotações vêm de um snapshot local.
+
+Uso:
+    pipenv run python scripts/bench_conversas.py --repeticoes 20
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+# Ambiente isolado: configurado antes de importar src (settings lê o ambiente)
+_tmp_dir = Path(tempfile.mkdtemp(prefix="bench_conversas_"))
+shutil.copytree(root_dir / "data", _tmp_dir / "data", ignore=shutil.ignore_patterns("*.json", "*.db"))
+(_tmp_dir / "cotacoes.json").write_text(json.dumps({
+    "salvo_em": datetime.now().isoformat(),
+    "cotacoes": {
+        "USD-BRL": {"taxa": 5.25, "data_hora": datetime.now().isoformat()},
+        "EUR-BRL": {"taxa": 5.70, "data_hora": datetime.now().isoformat()},
+    }
+}))
+os.environ.update({
+    "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "sk-benchmark"),
+    "FAKE_LLM_SCRIPT": "",
+    "STORAGE_BACKEND": "csv",
+    "CSV_DATA_PATH": str(_tmp_dir / "data"),
+    "EXCHANGE_API_URL": "http://127.0.0.1:9/json/last",  # Porta fechada: sem rede
+    "EXCHANGE_MAX_RETRIES": "0",
+    "EXCHANGE_CACHE_TTL": "86400",
+    "EXCHANGE_SNAPSHOT_PATH": str(_tmp_dir / "cotacoes.json"),
+    "LANGFUSE_ENABLED": "false",
+})
+
+from langchain_core.tracers.context import collect_runs
+
+from src.orchestrator_agents import OrquestradorBancoAgil, criar_estado_inicial
+from src.services.data_service import get_data_service
+from src.utils.fake_llm import FakeChatModel, RespostasRoteirizadas
+
+
+CPF = "12345678900"
+
+# Cada turno: (mensagem do cliente, passos do LLM nesse turno). Turnos
+# atendidos pelo caminho rápido não consomem os passos.
+CONVERSAS = {
+    "completa": [
+        ("Olá", ["Olá! Bem-vindo ao Banco Ágil. Qual o seu CPF?"]),
+        (CPF, ["Obrigado! Qual a sua data de nascimento?"]),
+        ("15/03/1985", [
+            {"tool": "authenticate_client", "args": {"cpf": CPF, "data_nascimento": "15/03/1985"}},
+            "Autenticado com sucesso, João! Como posso ajudar?",
+        ]),
+        ("Qual meu limite?", [
+            {"tool": "get_credit_limit", "args": {"cpf": CPF}},
+            "Seu limite atual é de R$ 5.000,00.",
+        ]),
+        ("Preciso de um limite de 15000", [
+            {"tool": "request_limit_increase", "args": {"cpf": CPF, "novo_limite": 15000}},
+            "Seu score atual não permite esse limite. Gostaria de fazer uma entrevista para atualizar seu score?",
+        ]),
+        ("Sim, quero", [
+            "Ótimo! Vamos iniciar a entrevista de crédito.",
+            "Qual é a sua renda mensal?",
+        ]),
+        ("Ganho 8000 por mês", ["Qual o seu tipo de emprego: formal, autônomo ou desempregado?"]),
+        ("formal", ["Quais são suas despesas fixas mensais?"]),
+        ("2000", ["Quantos dependentes você tem?"]),
+        ("1", ["Você possui dívidas em aberto?"]),
+        ("Não tenho dívidas", [
+            {"tool": "calculate_new_score", "args": {
+                "cpf": CPF, "renda_mensal": 8000, "tipo_emprego": "formal",
+                "despesas_fixas": 2000, "num_dependentes": 1, "tem_dividas": "nao"
+            }},
+            {"tool": "update_client_score", "args": {"cpf": CPF, "novo_score": 780}},
+            "Seu score foi atualizado para 780. Vamos continuar a análise do seu limite.",
+            "Com o novo score, posso reavaliar seu pedido. Deseja tentar o aumento novamente?",
+        ]),
+        ("Qual a cotação do dólar?", [
+            {"tool": "get_exchange_rate", "args": {"moeda": "USD"}},
+            "A cotação atual do dólar é R$ 5,25.",
+        ]),
+        ("Converter 100 euros para reais", [
+            {"tool": "convert_currency", "args": {"valor": 100, "moeda_origem": "EUR"}},
+            "100 EUR equivalem a R$ 570,00.",
+        ]),
+        ("Obrigado, pode encerrar", [
+            {"tool": "end_conversation", "args": {"motivo": "Cliente encerrou"}},
+            "Foi um prazer ajudar! Até logo.",
+        ]),
+    ],
+    "rapida": [
+        ("Oi, meu CPF é 12345678900 e nasci em 15/03/1985", [
+            {"tool": "authenticate_client", "args": {"cpf": CPF, "data_nascimento": "15/03/1985"}},
+            "Autenticado com sucesso! Como posso ajudar?",
+        ]),
+        ("Qual meu limite?", [
+            {"tool": "get_credit_limit", "args": {"cpf": CPF}},
+            "Seu limite atual é de R$ 5.000,00.",
+        ]),
+        ("Quanto está o euro?", [
+            {"tool": "get_exchange_rate", "args": {"moeda": "EUR"}},
+            "A cotação atual do euro é R$ 5,70.",
+        ]),
+        ("Obrigado", ["Por nada! Posso ajudar com mais alguma coisa?"]),
+    ],
+}
+
+ETAPAS = ["total", "prompt", "llm", "tools", "dados", "orquestr"]
+
+
+class CronometroDados:
+    """Soma o tempo gasto nos métodos públicos do DataService (sem contar chamadas aninhadas)."""
+
+    METODOS = [
+        "authenticate_client", "get_client_by_cpf", "update_client_score",
+        "update_client_limit", "create_limit_request", "process_limit_request",
+        "get_max_limit_for_score", "get_all_score_limits",
+    ]
+
+    def __init__(self, servico):
+        self.total = 0.0
+        self._local = threading.local()
+        for nome in self.METODOS:
+            setattr(servico, nome, self._cronometrar(getattr(servico, nome)))
+
+    def _cronometrar(self, metodo):
+        @wraps(metodo)
+        def wrapper(*args, **kwargs):
+            profundidade = getattr(self._local, "profundidade", 0)
+            self._local.profundidade = profundidade + 1
+            inicio = time.perf_counter()
+            try:
+                return metodo(*args, **kwargs)
+            finally:
+                self._local.profundidade = profundidade
+                if profundidade == 0:
+                    self.total += time.perf_counter() - inicio
+        return wrapper
+
+
+def somar_runs(runs, tempos: dict) -> None:
+    """Acumula a duração (ms) dos runs de prompt, llm e tool, recursivamente."""
+    for run in runs:
+        if run.end_time is not None:
+            duracao = (run.end_time - run.start_time).total_seconds() * 1000
+            if run.run_type == "prompt":
+                tempos["prompt"] += duracao
+            elif run.run_type in ("llm", "chat_model"):
+                tempos["llm"] += duracao
+            elif run.run_type == "tool":
+                tempos["tools"] += duracao
+                continue  # Runs internos da tool já estão nesse tempo
+        somar_runs(run.child_runs, tempos)
+
+
+def percentil(valores: list, p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=20, help="Vezes que cada conversa e reproduzida")
+    parser.add_argument("--conversa", choices=sorted(CONVERSAS), help="Reproduzir apenas uma conversa")
+    parser.add_argument("--sem-caminho-rapido", action="store_true", help="Desliga o caminho rapido (FAST_PATH_ENABLED)")
+    args = parser.parse_args()
+
+    from src.config.settings import settings
+    settings.fast_path_enabled = not args.sem_caminho_rapido
+
+    roteiro = RespostasRoteirizadas()
+    inicio = time.perf_counter()
+    # Com um llm próprio, o resumo do histórico é feito sem LLM e não
+    # consome os passos do roteiro
+    orquestrador = OrquestradorBancoAgil(llm=FakeChatModel(responder=roteiro))
+    montagem_ms = (time.perf_counter() - inicio) * 1000
+
+    dados = CronometroDados(get_data_service())
+    conversas = {args.conversa: CONVERSAS[args.conversa]} if args.conversa else CONVERSAS
+
+    print("Banco Agil - Conversas completas com LLM roteirizado\n")
+    print(f"Montagem dos executores (uma vez): {montagem_ms:.1f}ms")
+    print(f"Dados em: {_tmp_dir}\n")
+
+    amostras = {etapa: [] for etapa in ETAPAS}
+    turnos = 0
+
+    try:
+        for _ in range(args.repeticoes):
+            for turnos_conversa in conversas.values():
+                estado = criar_estado_inicial()
+
+                for mensagem, passos in turnos_conversa:
+                    roteiro.carregar(passos)
+                    dados.total = 0.0
+                    tempos = dict.fromkeys(ETAPAS, 0.0)
+
+                    with collect_runs() as coletor:
+                        inicio = time.perf_counter()
+                        _, estado = orquestrador.processar(mensagem, estado)
+                        tempos["total"] = (time.perf_counter() - inicio) * 1000
+
+                    somar_runs(coletor.traced_runs, tempos)
+                    tempos["dados"] = dados.total * 1000
+                    tempos["orquestr"] = max(0.0, tempos["total"] - tempos["prompt"] - tempos["llm"] - tempos["tools"])
+
+                    for etapa in ETAPAS:
+                        amostras[etapa].append(tempos[etapa])
+                    turnos += 1
+    finally:
+        shutil.rmtree(_tmp_dir, ignore_errors=True)
+
+    rapidos = orquestrador.fast_path_stats()
+    print(f"Turnos: {turnos} ({rapidos['fracao_rapida']:.0%} pelo caminho rapido)\n")
+    print(f"{'etapa':<10} {'p50':>9} {'p95':>9} {'p99':>9}   (ms por turno)")
+    for etapa in ETAPAS:
+        valores = amostras[etapa]
+        print(
+            f"{etapa:<10} {percentil(valores, 0.50):9.3f} "
+            f"{percentil(valores, 0.95):9.3f} {percentil(valores, 0.99):9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
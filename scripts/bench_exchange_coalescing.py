@@ -0,0 +1,131 @@
+"""
+Benchmark de requisições à API de câmbio sob consultas simultâneas.
+
+Sobe um servidor HTTP local que imita a AwesomeAPI (com latência
+configurável) e dispara várias threads pedindo cotações ao mesmo tempo:
+- antes: cada consulta faz sua própria requisição
+- depois: ExchangeService.get_rate, que agrupa consultas simultâneas
+  (mesmo par: uma requisição; pares diferentes: uma URL multi-par)
+
+O cache de cotações é desligado para que toda consulta chegue à API.
+
+Uso:
+    pipenv run python scripts/bench_exchange_coalescing.py --threads 50 --rodadas 20
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.settings import settings
+from src.services.exchange_service import (
+    ExchangeService,
+    reset_exchange_cache,
+    reset_exchange_coalescer
+)
+
+
+MOEDAS = ["USD", "EUR", "GBP", "BTC"]
+
+
+class StubAwesomeAPI(BaseHTTPRequestHandler):
+    """Responde como a AwesomeAPI, contando as requisições recebidas."""
+
+    protocol_version = "HTTP/1.1"  # Permite keep-alive
+    disable_nagle_algorithm = True
+    latencia = 0.05
+    requisicoes = 0
+    _lock = threading.Lock()
+
+    def do_GET(self):
+        with StubAwesomeAPI._lock:
+            StubAwesomeAPI.requisicoes += 1
+
+        time.sleep(StubAwesomeAPI.latencia)
+
+        pares = self.path.rsplit("/", 1)[-1].split(",")
+        body = json.dumps({
+            par.replace("-", ""): {"bid": "5.25"} for par in pares
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def medir(nome: str, consultar, num_threads: int, rodadas: int) -> None:
+    """Dispara rodadas de consultas simultâneas e imprime requisições e tempo."""
+    StubAwesomeAPI.requisicoes = 0
+    consultas = 0
+    inicio = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for _ in range(rodadas):
+            moedas = [random.choice(MOEDAS) for _ in range(num_threads)]
+            list(executor.map(consultar, moedas))
+            consultas += len(moedas)
+
+    decorrido = time.perf_counter() - inicio
+    print(
+        f"{nome:<28} consultas={consultas:<6} "
+        f"requisicoes={StubAwesomeAPI.requisicoes:<6} "
+        f"tempo={decorrido:6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=50, help="Consultas simultaneas por rodada")
+    parser.add_argument("--rodadas", type=int, default=20, help="Numero de rodadas")
+    parser.add_argument("--latencia", type=float, default=0.05, help="Latencia da API simulada (s)")
+    parser.add_argument("--janela", type=float, default=0.01, help="EXCHANGE_COALESCE_WINDOW (0 = so deduplica)")
+    args = parser.parse_args()
+
+    StubAwesomeAPI.latencia = args.latencia
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), StubAwesomeAPI)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{servidor.server_address[1]}/json/last"
+
+    # Sem cache: toda consulta deve ir ao agrupador/API
+    settings.exchange_cache_ttl = 0
+    settings.exchange_pool_size = args.threads
+    settings.exchange_coalesce_window = args.janela
+    reset_exchange_cache()
+    reset_exchange_coalescer()
+    service = ExchangeService(api_url)
+
+    print("Banco Agil - Benchmark de agrupamento de consultas de cambio\n")
+    medir(
+        "antes (uma req. por consulta)",
+        lambda moeda: service._buscar_pares([moeda])[moeda],
+        args.threads,
+        args.rodadas
+    )
+    medir(
+        "depois (agrupado)",
+        service.get_rate,
+        args.threads,
+        args.rodadas
+    )
+    print(f"\n{service.coalescing_stats()}")
+
+    servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
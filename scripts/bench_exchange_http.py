@@ -0,0 +1,111 @@
+"""
+Benchmark de latência por cotação: requests.get avulso vs. sessão com pool.
+
+Sobe um servidor HTTP local que imita a AwesomeAPI e mede a latência de
+N consultas feitas:
+- antes: com requests.get (nova conexão a cada chamada)
+- depois: com ExchangeService, que reutiliza conexões da sessão compartilhada
+
+O cache de cotações é desligado para que toda consulta vá ao servidor, e
+o agrupador de consultas é contornado: mede-se só a requisição HTTP.
+
+Uso:
+    pipenv run python scripts/bench_exchange_http.py --requisicoes 500
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.settings import settings
+from src.services.exchange_service import ExchangeService, reset_exchange_cache
+
+
+class StubAwesomeAPI(BaseHTTPRequestHandler):
+    """Responde como a AwesomeAPI para qualquer par pedido."""
+
+    protocol_version = "HTTP/1.1"  # Permite keep-alive
+    disable_nagle_algorithm = True  # Evita atraso de ACK em conexões reutilizadas
+    conexoes = 0
+
+    def setup(self):
+        super().setup()
+        StubAwesomeAPI.conexoes += 1
+
+    def do_GET(self):
+        pares = self.path.rsplit("/", 1)[-1].split(",")
+        body = json.dumps({
+            par.replace("-", ""): {"bid": "5.25"} for par in pares
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def medir(nome: str, consultar, num_requisicoes: int) -> None:
+    """Executa as consultas e imprime p50/p95/média e conexões abertas."""
+    StubAwesomeAPI.conexoes = 0
+    latencias = []
+
+    for _ in range(num_requisicoes):
+        inicio = time.perf_counter()
+        consultar()
+        latencias.append((time.perf_counter() - inicio) * 1000)
+
+    latencias.sort()
+    print(
+        f"{nome:<28} media={statistics.mean(latencias):6.3f}ms  "
+        f"p50={latencias[len(latencias) // 2]:6.3f}ms  "
+        f"p95={latencias[int(len(latencias) * 0.95)]:6.3f}ms  "
+        f"conexoes={StubAwesomeAPI.conexoes}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requisicoes", type=int, default=500, help="Consultas por cenario")
+    args = parser.parse_args()
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), StubAwesomeAPI)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{servidor.server_address[1]}/json/last"
+
+    # Sem cache: toda consulta deve ir ao servidor
+    settings.exchange_cache_ttl = 0
+    reset_exchange_cache()
+    service = ExchangeService(api_url)
+
+    print("Banco Agil - Benchmark HTTP da API de cambio\n")
+    medir(
+        "antes (requests.get)",
+        lambda: requests.get(f"{api_url}/USD-BRL", timeout=10).json(),
+        args.requisicoes
+    )
+    medir(
+        "depois (sessao com pool)",
+        lambda: service._buscar_pares(["USD"])["USD"],
+        args.requisicoes
+    )
+
+    servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark do caminho rápido (intent_router) à frente do LLM.
+
+Roda um corpus de mensagens típicas de clientes autenticados por um
+orquestrador com LLM falso (que simula a latência do modelo) e mostra
+a fração de turnos atendidos sem o LLM e a latência de cada caminho.
+As mensagens de SEMPRE_LLM mencionam o limite ou a cotação sem pedir o
+valor; se alguma delas for pelo caminho rápido, o script falha.
+
+As cotações usam a API de câmbio configurada (ou o snapshot local); se
+ela estiver indisponível, esses turnos seguem pelo LLM.
+
+Uso:
+    pipenv run python scripts/bench_fast_path.py --latencia-llm 0.8
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.orchestrator_agents import OrquestradorBancoAgil, criar_estado_inicial
+from src.services.data_service import get_data_service
+from src.utils.fake_llm import FakeChatModel
+
+
+CORPUS = [
+    "Qual meu limite?",
+    "Qual é o meu limite de crédito?",
+    "qual a cotação do dólar?",
+    "Quanto está o euro hoje",
+    "cotação da libra",
+    "Quero aumentar meu limite",
+    "Quero aumentar meu limite para 8000",
+    "Converter 100 dólares para reais",
+    "O dólar subiu essa semana?",
+    "Cotação do dólar e do euro",
+    "Obrigado, era só isso",
+    "Não quero ver o limite, quero a cotação do iene",
+]
+
+# Citam o limite mas não pedem o valor: precisam do LLM
+SEMPRE_LLM = [
+    "como funciona o limite?",
+    "por que meu limite é tão baixo?",
+    "meu limite foi aprovado?",
+    "limite de saque",
+    "limite não",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latencia-llm", type=float, default=0.5, help="Segundos simulados por chamada ao LLM")
+    parser.add_argument("--rodadas", type=int, default=3, help="Passadas pelo corpus")
+    args = parser.parse_args()
+
+    def responder(mensagens):
+        time.sleep(args.latencia_llm)
+        return "Resposta do modelo."
+
+    data_service = get_data_service()
+    cliente = data_service.get_client_by_cpf(next(iter(data_service._indice_clientes())))
+    orquestrador = OrquestradorBancoAgil(llm=FakeChatModel(responder=responder))
+
+    print("Banco Agil - Caminho rapido do roteador de intencoes\n")
+
+    latencias = {"rapido": [], "llm": []}
+    indevidas = set()
+    for _ in range(args.rodadas):
+        for mensagem in CORPUS + SEMPRE_LLM:
+            estado = {
+                **criar_estado_inicial(),
+                "agente_atual": "triagem",
+                "autenticado": True,
+                "cpf": cliente.cpf,
+                "nome": cliente.nome,
+                "limite": cliente.limite_credito,
+                "score": cliente.score_credito,
+            }
+            rapidos_antes = orquestrador.fast_path_stats()["rapidos"]
+
+            inicio = time.perf_counter()
+            orquestrador.processar(mensagem, estado)
+            decorrido = (time.perf_counter() - inicio) * 1000
+
+            caminho = "rapido" if orquestrador.fast_path_stats()["rapidos"] > rapidos_antes else "llm"
+            latencias[caminho].append(decorrido)
+            if caminho == "rapido" and mensagem in SEMPRE_LLM:
+                indevidas.add(mensagem)
+
+    stats = orquestrador.fast_path_stats()
+    print(f"Turnos:          {stats['turnos']}")
+    print(f"Caminho rapido:  {stats['rapidos']} ({stats['fracao_rapida']:.0%})")
+    for intencao, total in sorted(stats["por_intencao"].items()):
+        print(f"  - {intencao}: {total}")
+
+    print()
+    for caminho, valores in latencias.items():
+        if valores:
+            print(f"Latencia {caminho:<7} media={statistics.mean(valores):8.2f}ms  n={len(valores)}")
+
+    if indevidas:
+        print()
+        for mensagem in sorted(indevidas):
+            print(f"[ERRO] Deveria ir para o LLM: {mensagem!r}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
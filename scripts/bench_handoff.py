@@ -0,0 +1,106 @@
+"""
+Benchmark da latência dos turnos com troca de agente (LLM falso).
+
+Compara, para mensagens que mudam de agente:
+- antes: o agente atual responde ("o atendimento continuará"), e o app
+  chama processar("[CONTINUACAO]") de novo para o agente de destino
+  (duas chamadas ao modelo)
+- depois: processar() escolhe o agente de destino antes do LLM, ou
+  encadeia a continuação na mesma chamada, devolvendo uma só resposta
+
+O LLM falso dorme --latencia-llm segundos por chamada, como o modelo real.
+
+Uso:
+    pipenv run python scripts/bench_handoff.py --latencia-llm 0.5 --rodadas 5
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.settings import settings
+from src.orchestrator_agents import MENSAGEM_CONTINUACAO, OrquestradorBancoAgil, criar_estado_inicial
+from src.services.data_service import get_data_service
+from src.utils.fake_llm import FakeChatModel
+
+
+# (agente atual, mensagem que leva a outro agente)
+TROCAS = [
+    ("triagem", "Quero aumentar meu limite de credito"),
+    ("triagem", "Preciso converter reais para euro"),
+    ("credito", "Agora me fala do cambio de hoje"),
+    ("cambio", "E sobre meu score de credito?"),
+]
+
+
+def processar_antes(orquestrador: OrquestradorBancoAgil, mensagem: str, estado: dict) -> str:
+    """Fluxo antigo do app: troca só no fim do turno + segunda chamada."""
+    resposta, novo_estado = orquestrador.processar(mensagem, estado, transicao_no_turno=False)
+
+    if novo_estado.get("agente_atual") != estado.get("agente_atual") and "?" not in resposta:
+        resposta, novo_estado = orquestrador.processar(
+            MENSAGEM_CONTINUACAO, novo_estado, transicao_no_turno=False
+        )
+    return resposta
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latencia-llm", type=float, default=0.5, help="Segundos simulados por chamada ao LLM")
+    parser.add_argument("--rodadas", type=int, default=3, help="Passadas pelas mensagens de troca")
+    args = parser.parse_args()
+
+    chamadas = threading.local()
+
+    def responder(mensagens):
+        chamadas.total = getattr(chamadas, "total", 0) + 1
+        time.sleep(args.latencia_llm)
+        return "Claro, o atendimento continuara."
+
+    # Só o roteamento entre agentes importa aqui
+    settings.fast_path_enabled = False
+
+    data_service = get_data_service()
+    cliente = data_service.get_client_by_cpf(next(iter(data_service._indice_clientes())))
+    orquestrador = OrquestradorBancoAgil(llm=FakeChatModel(responder=responder))
+
+    print("Banco Agil - Latencia dos turnos com troca de agente (LLM falso)\n")
+
+    for nome, executar in [
+        ("antes (segunda chamada no app)", lambda m, e: processar_antes(orquestrador, m, e)),
+        ("depois (troca no mesmo turno)", lambda m, e: orquestrador.processar(m, e)[0]),
+    ]:
+        latencias = []
+        chamadas.total = 0
+
+        for _ in range(args.rodadas):
+            for agente, mensagem in TROCAS:
+                estado = {
+                    **criar_estado_inicial(),
+                    "agente_atual": agente,
+                    "autenticado": True,
+                    "cpf": cliente.cpf,
+                    "nome": cliente.nome,
+                    "limite": cliente.limite_credito,
+                    "score": cliente.score_credito,
+                }
+                inicio = time.perf_counter()
+                executar(mensagem, estado)
+                latencias.append((time.perf_counter() - inicio) * 1000)
+
+        print(
+            f"{nome:<32} media={statistics.mean(latencias):8.1f}ms  "
+            f"max={max(latencias):8.1f}ms  "
+            f"chamadas ao LLM por turno={chamadas.total / len(latencias):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
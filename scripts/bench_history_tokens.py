@@ -0,0 +1,100 @@
+"""
+Benchmark dos tokens de histórico por turno em conversas longas.
+
+Simula uma conversa de N turnos com um LLM falso e mostra, em alguns
+turnos, os tokens de contexto enviados ao agente (mensagem + resumo +
+histórico) e o tempo do turno:
+- antes: histórico completo a cada turno (HISTORY_MAX_TURNS=0, sem limite)
+- depois: janela de turnos + resumo incremental (em lotes) + limite de tokens
+
+Uso:
+    pipenv run python scripts/bench_history_tokens.py --turnos 100
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from langchain_core.messages import SystemMessage
+
+from src.config.prompts import RESUMO_HISTORICO_PROMPT
+from src.config.settings import settings
+from src.orchestrator_agents import OrquestradorBancoAgil, criar_estado_inicial
+from src.utils.fake_llm import FakeChatModel
+
+
+RESPOSTA = (
+    "Entendi sua solicitacao. Verifiquei as informacoes da sua conta e posso "
+    "ajudar com isso agora mesmo. Deseja que eu siga com a analise?"
+)
+
+
+def responder(mensagens):
+    """Respostas de tamanho fixo; resumos curtos quando pedidos."""
+    if isinstance(mensagens[0], SystemMessage) and mensagens[0].content == RESUMO_HISTORICO_PROMPT:
+        return "Cliente consultou limite e cotacoes; nenhuma pendencia."
+    return RESPOSTA
+
+
+def simular(num_turnos: int, marcos: list[int]) -> dict:
+    """Roda a conversa e retorna {turno: (tokens, ms)} nos marcos."""
+    orquestrador = OrquestradorBancoAgil(
+        llm=FakeChatModel(responder=responder),
+        llm_resumo=FakeChatModel(responder=responder)
+    )
+    estado = {
+        **criar_estado_inicial(),
+        "agente_atual": "credito",
+        "autenticado": True,
+        "cpf": "12345678900",
+        "nome": "Cliente Teste",
+        "limite": 5000.0,
+        "score": 650,
+    }
+
+    resultado = {}
+    for turno in range(1, num_turnos + 1):
+        inicio = time.perf_counter()
+        _, estado = orquestrador.processar(f"Pergunta numero {turno} sobre meu credito", estado)
+        decorrido = (time.perf_counter() - inicio) * 1000
+
+        if turno in marcos:
+            resultado[turno] = (estado["tokens_turno"]["total"], decorrido)
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turnos", type=int, default=100, help="Turnos da conversa")
+    args = parser.parse_args()
+
+    marcos = sorted({m for m in (1, 5, 10, 25, 50, 100, 200, args.turnos) if m <= args.turnos})
+    settings.fast_path_enabled = False
+
+    print("Banco Agil - Tokens de historico por turno (LLM falso)\n")
+
+    janela = (settings.history_max_turns, settings.history_max_tokens)
+    settings.history_max_turns, settings.history_max_tokens = 0, 0
+    antes = simular(args.turnos, marcos)
+    settings.history_max_turns, settings.history_max_tokens = janela
+    depois = simular(args.turnos, marcos)
+
+    print(
+        f"Janela: {janela[0]} turnos (resumo a cada {settings.history_summary_batch}), "
+        f"limite de {janela[1]} tokens\n"
+    )
+    print(f"{'turno':>6} | {'antes tokens':>12} {'ms':>7} | {'depois tokens':>13} {'ms':>7}")
+    for turno in marcos:
+        print(
+            f"{turno:>6} | {antes[turno][0]:>12} {antes[turno][1]:>7.1f} | "
+            f"{depois[turno][0]:>13} {depois[turno][1]:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark e verificação do cache de respostas entre clientes.
+
+Roda, com um LLM falso (que simula a latência do modelo), o mesmo
+conjunto de perguntas para vários clientes autenticados diferentes e
+mostra a taxa de acerto do cache e a latência com e sem ele.
+
+Também verifica as duas garantias do cache:
+- perguntas que não dependem do cliente ("como funciona o aumento de
+  limite") são respondidas do cache para clientes diferentes;
+- respostas com dados do cliente (score, limite) nunca são servidas a
+  outro cliente.
+Se alguma falhar, o script termina com erro.
+
+Uso:
+    pipenv run python scripts/bench_response_cache.py --latencia-llm 0.2
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.settings import settings
+from src.orchestrator_agents import OrquestradorBancoAgil, criar_estado_inicial
+from src.services.data_service import get_data_service
+from src.utils.fake_llm import FakeChatModel
+
+
+# Perguntas gerais: a resposta é a mesma para qualquer cliente
+GERAIS = [
+    "Como funciona o aumento de limite?",
+    "como funciona o aumento de limite",
+    "Quais serviços vocês oferecem?",
+    "O que é o score de crédito?",
+]
+
+# Pergunta cuja resposta cita o score do próprio cliente
+PESSOAL = "Qual é o meu score?"
+
+RESPOSTAS_GERAIS = {
+    "aumento": "O aumento depende do seu score: fazemos a análise na hora.",
+    "servicos": "Oferecemos consulta e aumento de limite e cotações de câmbio.",
+    "score": "O score é uma nota de 0 a 1000 que resume seu histórico de crédito.",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latencia-llm", type=float, default=0.2, help="Segundos simulados por chamada ao LLM")
+    args = parser.parse_args()
+
+    def responder(mensagens):
+        time.sleep(args.latencia_llm)
+        pergunta = mensagens[-1].content.lower()
+        if "meu score" in pergunta:
+            score = re.search(r"Score: (\S+)", mensagens[0].content).group(1)
+            return f"Seu score atual é {score} pontos."
+        for chave, resposta in RESPOSTAS_GERAIS.items():
+            if chave in pergunta.replace("ç", "c"):
+                return resposta
+        return "Posso ajudar com crédito e câmbio."
+
+    settings.response_cache_enabled = True
+    settings.fast_path_enabled = False
+
+    data_service = get_data_service()
+    clientes = [data_service.get_client_by_cpf(cpf) for cpf in sorted(data_service._indice_clientes())]
+    orquestrador = OrquestradorBancoAgil(llm=FakeChatModel(responder=responder))
+
+    print("Banco Agil - Cache de respostas entre clientes\n")
+
+    latencias = {"cache": [], "llm": []}
+    erros = []
+
+    for cliente in clientes:
+        for mensagem in GERAIS + [PESSOAL]:
+            estado = {
+                **criar_estado_inicial(),
+                "agente_atual": "credito",
+                "autenticado": True,
+                "cpf": cliente.cpf,
+                "nome": cliente.nome,
+                "limite": cliente.limite_credito,
+                "score": cliente.score_credito,
+            }
+            acertos_antes = orquestrador.response_cache_stats()["acertos"]
+
+            inicio = time.perf_counter()
+            resposta, _ = orquestrador.processar(mensagem, estado)
+            decorrido = (time.perf_counter() - inicio) * 1000
+
+            do_cache = orquestrador.response_cache_stats()["acertos"] > acertos_antes
+            latencias["cache" if do_cache else "llm"].append(decorrido)
+
+            if mensagem == PESSOAL and str(cliente.score_credito) not in resposta:
+                erros.append(f"{cliente.cpf} recebeu o score de outro cliente: {resposta!r}")
+            if mensagem in GERAIS and cliente is not clientes[0] and not do_cache:
+                erros.append(f"{cliente.cpf}: pergunta geral sem acerto no cache: {mensagem!r}")
+
+    stats = orquestrador.response_cache_stats()
+    print(f"Clientes:        {len(clientes)}")
+    print(f"Consultas:       {stats['consultas']}")
+    print(
+        f"Acertos:         {stats['acertos']} ({stats['taxa_acerto']:.0%}; "
+        f"{stats['acertos_exatos']} exatos, {stats['acertos_normalizados']} normalizados)"
+    )
+    print(f"Guardadas:       {stats['guardadas']}")
+
+    print()
+    for caminho, valores in latencias.items():
+        if valores:
+            print(f"Latencia {caminho:<6} media={statistics.mean(valores):8.2f}ms  n={len(valores)}")
+
+    if erros:
+        print()
+        for erro in erros:
+            print(f"[ERRO] {erro}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark do cálculo de score em lote (vetorizado) vs. escalar.
+
+Gera N linhas aleatórias de dados financeiros, calcula todos os scores
+com ScoreService.calculate_scores_batch e compara com calculate_score
+(linha a linha) em uma amostra, verificando que os resultados são
+idênticos.
+
+Uso:
+    pipenv run python scripts/bench_score_batch.py --linhas 1000000 --amostra 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.models.schemas import DadosFinanceiros
+from src.services.score_service import ScoreService
+
+
+def gerar_dados(num_linhas: int, seed: int = 42) -> pd.DataFrame:
+    """Gera dados financeiros aleatórios (incluindo casos de borda)."""
+    rng = np.random.default_rng(seed)
+
+    renda = np.round(rng.uniform(100, 50000, num_linhas), 2)
+    # Parte das despesas igual ou maior que a renda (componente_renda = 0)
+    despesas = np.round(renda * rng.uniform(0, 1.3, num_linhas), 2)
+    despesas[rng.random(num_linhas) < 0.05] = 0.0
+
+    return pd.DataFrame({
+        "renda_mensal": renda,
+        "despesas_fixas": despesas,
+        "tipo_emprego": rng.choice(list(ScoreService.PESO_EMPREGO), num_linhas),
+        "num_dependentes": rng.integers(0, 6, num_linhas),
+        "tem_dividas": rng.random(num_linhas) < 0.4,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--linhas", type=int, default=1_000_000, help="Linhas no batch")
+    parser.add_argument("--amostra", type=int, default=50_000, help="Linhas comparadas com o escalar")
+    args = parser.parse_args()
+
+    print("Banco Agil - Benchmark de score em lote\n")
+
+    df = gerar_dados(args.linhas)
+
+    inicio = time.perf_counter()
+    scores = ScoreService.calculate_scores_batch(df)
+    tempo_batch = time.perf_counter() - inicio
+
+    amostra = df.head(args.amostra)
+    inicio = time.perf_counter()
+    scores_escalar = [
+        ScoreService.calculate_score(DadosFinanceiros(**row))
+        for row in amostra.to_dict(orient="records")
+    ]
+    tempo_escalar = time.perf_counter() - inicio
+
+    divergencias = int(np.sum(scores[:len(amostra)] != np.asarray(scores_escalar)))
+    por_linha_escalar = tempo_escalar / len(amostra)
+
+    print(f"Batch vetorizado:  {args.linhas:>9,} linhas em {tempo_batch:8.3f}s "
+          f"({args.linhas / tempo_batch:,.0f} linhas/s)")
+    print(f"Escalar (amostra): {len(amostra):>9,} linhas em {tempo_escalar:8.3f}s "
+          f"({1 / por_linha_escalar:,.0f} linhas/s)")
+    print(f"Escalar estimado para {args.linhas:,} linhas: {por_linha_escalar * args.linhas:.1f}s")
+    print(f"Speedup: {por_linha_escalar * args.linhas / tempo_batch:,.0f}x")
+    print(f"Divergencias na amostra: {divergencias}")
+
+    if divergencias:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
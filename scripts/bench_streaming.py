@@ -0,0 +1,75 @@
+"""
+Benchmark do tempo até o primeiro token (TTFT) com e sem streaming.
+
+Usa um LLM falso que gera a resposta palavra a palavra (--atraso-token
+segundos por palavra), como o modelo real em streaming:
+- processar(): o texto só aparece quando a resposta termina
+  (TTFT = latência total)
+- processar_stream(): o primeiro token chega assim que é gerado
+
+Uso:
+    pipenv run python scripts/bench_streaming.py --atraso-token 0.03 --turnos 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.settings import settings
+from src.orchestrator_agents import OrquestradorBancoAgil, criar_estado_inicial
+from src.utils.fake_llm import FakeChatModel
+
+
+RESPOSTA = (
+    "Claro! Para solicitar o aumento do seu limite preciso saber qual valor "
+    "voce deseja. Com base no seu score atual, posso verificar na hora se o "
+    "pedido pode ser aprovado. Qual seria o novo limite?"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--atraso-token", type=float, default=0.03, help="Segundos por palavra gerada")
+    parser.add_argument("--turnos", type=int, default=10, help="Mensagens por cenario")
+    args = parser.parse_args()
+
+    settings.fast_path_enabled = False
+    llm = FakeChatModel(responder=lambda mensagens: RESPOSTA, streaming=True, atraso_token=args.atraso_token)
+    orquestrador = OrquestradorBancoAgil(llm=llm)
+    estado = {
+        **criar_estado_inicial(),
+        "agente_atual": "credito",
+        "autenticado": True,
+        "cpf": "12345678900",
+        "nome": "Cliente Teste",
+        "limite": 5000.0,
+        "score": 650,
+    }
+
+    print("Banco Agil - Tempo ate o primeiro token (LLM falso)\n")
+
+    sem_streaming = []
+    for _ in range(args.turnos):
+        inicio = time.perf_counter()
+        orquestrador.processar("Quero aumentar meu limite", estado)
+        sem_streaming.append((time.perf_counter() - inicio) * 1000)
+
+    ttft, total = [], []
+    for _ in range(args.turnos):
+        for evento in orquestrador.processar_stream("Quero aumentar meu limite", estado):
+            if evento["tipo"] == "fim":
+                ttft.append(evento["metricas"]["ttft_ms"])
+                total.append(evento["metricas"]["total_ms"])
+
+    print(f"processar()        ttft={statistics.mean(sem_streaming):8.1f}ms  total={statistics.mean(sem_streaming):8.1f}ms")
+    print(f"processar_stream() ttft={statistics.mean(ttft):8.1f}ms  total={statistics.mean(total):8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Script para importar os CSVs de dados para o banco SQLite.
+
+Pode ser rodado de novo: clientes já existentes no banco são mantidos
+(use --sobrescrever-clientes para voltar limite e score aos do CSV) e
+solicitações já importadas não são duplicadas.
+
+Uso:
+    pipenv run python scripts/import_csv_to_sqlite.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.settings import settings
+from src.services.sqlite_data_service import SQLiteDataService
+
+
+def import_csv_to_sqlite(sobrescrever_clientes: bool = False):
+    """Importa clientes, faixas de score e solicitacoes para o SQLite."""
+
+    print("Banco Agil - Importacao CSV -> SQLite\n")
+    print("=" * 50)
+    print(f"Diretorio de dados: {settings.data_path}")
+    print(f"Banco SQLite:       {settings.sqlite_path}\n")
+
+    service = SQLiteDataService()
+    totais = service.import_from_csv(sobrescrever_clientes=sobrescrever_clientes)
+
+    for tabela, total in totais.items():
+        print(f"[OK] {tabela}: {total} linhas importadas")
+
+    print("\n" + "=" * 50)
+    print("Importacao concluida com sucesso!")
+    print("\nPara usar o banco, defina STORAGE_BACKEND=sqlite no .env")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sobrescrever-clientes",
+        action="store_true",
+        help="Substitui os clientes ja existentes pelos dados do CSV"
+    )
+    args = parser.parse_args()
+    import_csv_to_sqlite(sobrescrever_clientes=args.sobrescrever_clientes)
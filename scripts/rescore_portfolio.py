@@ -0,0 +1,146 @@
+"""
+Job de recálculo de score da carteira de clientes.
+
+Lê um CSV de dados financeiros em blocos (streaming), calcula os scores
+de cada bloco com ScoreService.calculate_scores_batch, cruza por CPF com
+a base de clientes e grava a coluna score_credito em uma única operação
+ao final.
+
+O arquivo de entrada deve ter as colunas:
+    cpf, renda_mensal, despesas_fixas, tipo_emprego, num_dependentes, tem_dividas
+
+A memória usada não depende do tamanho da entrada: cada bloco é
+descartado após o cálculo e só são mantidos os scores de clientes
+existentes na base (no máximo um por cliente; a última linha vence).
+
+Uso:
+    pipenv run python scripts/rescore_portfolio.py dados_financeiros.csv
+    pipenv run python scripts/rescore_portfolio.py dados.csv --chunksize 50000 --dry-run
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.services.data_service import get_data_service
+from src.services.score_service import ScoreService
+
+
+VALORES_SIM = ["sim", "s", "true", "1", "yes"]
+
+
+def preparar_bloco(bloco: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normaliza tipos de um bloco e descarta linhas inválidas.
+
+    Returns:
+        DataFrame apenas com linhas válidas, pronto para o cálculo
+    """
+    bloco = bloco.dropna(subset=["cpf", *ScoreService.COLUNAS_BATCH])
+
+    preparado = pd.DataFrame({
+        "cpf": bloco["cpf"].astype(str).str.replace(r"\D", "", regex=True),
+        "renda_mensal": pd.to_numeric(bloco["renda_mensal"], errors="coerce"),
+        "despesas_fixas": pd.to_numeric(bloco["despesas_fixas"], errors="coerce"),
+        "tipo_emprego": bloco["tipo_emprego"].astype(str).str.strip().str.lower(),
+        "num_dependentes": pd.to_numeric(bloco["num_dependentes"], errors="coerce"),
+    })
+
+    # tem_dividas: aceita booleano ou texto ("sim"/"nao"), como a entrevista
+    if pd.api.types.is_bool_dtype(bloco["tem_dividas"]):
+        preparado["tem_dividas"] = bloco["tem_dividas"]
+    else:
+        preparado["tem_dividas"] = (
+            bloco["tem_dividas"].astype(str).str.strip().str.lower().isin(VALORES_SIM)
+        )
+
+    # Dependentes precisam ser inteiros
+    dependentes = preparado["num_dependentes"]
+    preparado = preparado[
+        dependentes.notna() & (dependentes == dependentes.round()) &
+        preparado["renda_mensal"].notna() & preparado["despesas_fixas"].notna() &
+        (preparado["cpf"].str.len() == 11)
+    ].astype({"num_dependentes": "int64"})
+
+    return preparado[ScoreService.validate_batch(preparado)]
+
+
+def rescore(entrada: Path, chunksize: int, dry_run: bool) -> None:
+    """Executa o job e imprime o progresso e o resumo."""
+    data_service = get_data_service()
+
+    scores: dict[str, int] = {}
+    total_lidas = 0
+    total_validas = 0
+    total_sem_cliente = 0
+
+    inicio = time.perf_counter()
+
+    for num_bloco, bloco in enumerate(
+        pd.read_csv(entrada, dtype={"cpf": str}, chunksize=chunksize),
+        start=1
+    ):
+        total_lidas += len(bloco)
+
+        preparado = preparar_bloco(bloco)
+        total_validas += len(preparado)
+
+        if not preparado.empty:
+            novos = ScoreService.calculate_scores_batch(preparado)
+            existentes = data_service.existing_cpfs(preparado["cpf"].unique())
+
+            for cpf, score in zip(preparado["cpf"], novos):
+                if cpf in existentes:
+                    scores[cpf] = int(score)
+                else:
+                    total_sem_cliente += 1
+
+        decorrido = time.perf_counter() - inicio
+        print(
+            f"[bloco {num_bloco}] {total_lidas:,} linhas lidas | "
+            f"{total_lidas / decorrido:,.0f} linhas/s | "
+            f"{len(scores):,} clientes a atualizar"
+        )
+
+    tempo_calculo = time.perf_counter() - inicio
+
+    if dry_run:
+        atualizados = 0
+        tempo_escrita = 0.0
+    else:
+        inicio_escrita = time.perf_counter()
+        atualizados = data_service.update_client_scores_bulk(scores)
+        tempo_escrita = time.perf_counter() - inicio_escrita
+
+    print("\n" + "=" * 50)
+    print(f"Linhas lidas:          {total_lidas:,}")
+    print(f"Linhas invalidas:      {total_lidas - total_validas:,}")
+    print(f"Linhas sem cliente:    {total_sem_cliente:,}")
+    print(f"Clientes atualizados:  {atualizados:,}" + (" (dry-run)" if dry_run else ""))
+    print(f"Tempo de calculo:      {tempo_calculo:.2f}s")
+    print(f"Tempo de escrita:      {tempo_escrita:.2f}s")
+    if tempo_calculo > 0:
+        print(f"Vazao:                 {total_lidas / tempo_calculo:,.0f} linhas/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("entrada", type=Path, help="CSV com dados financeiros por CPF")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Linhas por bloco")
+    parser.add_argument("--dry-run", action="store_true", help="Calcula sem gravar")
+    args = parser.parse_args()
+
+    print("Banco Agil - Recalculo de score da carteira\n")
+    print("=" * 50)
+    rescore(args.entrada, args.chunksize, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
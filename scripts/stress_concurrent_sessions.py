@@ -0,0 +1,145 @@
+"""
+Teste de estresse: várias sessões simultâneas em um único orquestrador.
+
+Cria UM OrquestradorBancoAgil (como o st.cache_resource do app) com um
+LLM falso e roda N conversas em threads paralelas, cada uma com um
+cliente diferente. O LLM falso:
+- lê o CPF do system prompt que recebeu e o repete na resposta;
+- no agente de crédito, chama get_credit_limit com esse CPF e repete o
+  limite retornado pela tool.
+
+Se algum dado de outra sessão vazar para o prompt (ou para a tool), a
+resposta traz o CPF/limite errado e o script termina com erro.
+
+Uso:
+    pipenv run python scripts/stress_concurrent_sessions.py --sessoes 32 --turnos 6
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Adicionar diretorio raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from langchain_core.messages import AIMessage, FunctionMessage, SystemMessage
+
+from src.config.settings import settings
+from src.orchestrator_agents import OrquestradorBancoAgil, criar_estado_inicial
+from src.services.data_service import get_data_service
+from src.utils.fake_llm import FakeChatModel
+
+
+# Mensagens que alternam entre os agentes de crédito e câmbio
+MENSAGENS = [
+    "Qual meu limite?",
+    "E a cotacao do dolar?",
+    "Quero ver meu limite de credito",
+    "Quanto esta o euro?",
+    "Voltando ao limite, qual e?",
+    "Obrigado",
+]
+
+
+def responder(mensagens) -> AIMessage:
+    """LLM falso: repete o CPF do system prompt (e o limite, no crédito)."""
+    sistema = next(m.content for m in mensagens if isinstance(m, SystemMessage))
+    cpf = re.search(r"CPF: (\S+)", sistema).group(1)
+
+    # Pequena espera para intercalar as threads
+    time.sleep(random.uniform(0, 0.003))
+
+    if isinstance(mensagens[-1], FunctionMessage):
+        dados = json.loads(mensagens[-1].content)["data"]
+        return AIMessage(content=f"CPF={cpf} LIMITE={dados['limite_atual']}")
+
+    if "Agente de Crédito" in sistema:
+        return AIMessage(
+            content="",
+            additional_kwargs={"function_call": {
+                "name": "get_credit_limit",
+                "arguments": json.dumps({"cpf": cpf})
+            }}
+        )
+
+    return AIMessage(content=f"CPF={cpf}")
+
+
+def conversar(orquestrador: OrquestradorBancoAgil, cliente, num_turnos: int) -> list[str]:
+    """Executa uma conversa e retorna as violações de isolamento encontradas."""
+    estado = {
+        **criar_estado_inicial(),
+        "agente_atual": "credito",
+        "autenticado": True,
+        "cpf": cliente.cpf,
+        "nome": cliente.nome,
+        "limite": cliente.limite_credito,
+        "score": cliente.score_credito,
+    }
+    erros = []
+
+    for turno in range(num_turnos):
+        mensagem = MENSAGENS[turno % len(MENSAGENS)]
+        resposta, estado = orquestrador.processar(mensagem, estado)
+
+        if f"CPF={cliente.cpf}" not in resposta:
+            erros.append(f"{cliente.cpf} turno {turno}: {resposta!r}")
+        elif "LIMITE=" in resposta and f"LIMITE={cliente.limite_credito}" not in resposta:
+            erros.append(f"{cliente.cpf} turno {turno}: limite errado {resposta!r}")
+
+        if estado.get("cpf") != cliente.cpf:
+            erros.append(f"{cliente.cpf} turno {turno}: estado com CPF {estado.get('cpf')}")
+
+    return erros
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessoes", type=int, default=32, help="Conversas simultaneas")
+    parser.add_argument("--turnos", type=int, default=6, help="Mensagens por conversa")
+    args = parser.parse_args()
+
+    data_service = get_data_service()
+    clientes = [
+        data_service.get_client_by_cpf(cpf)
+        for cpf in data_service._indice_clientes()
+    ]
+    if len(clientes) < 2:
+        print("Sao necessarios pelo menos 2 clientes (execute scripts/setup_data.py)")
+        sys.exit(1)
+
+    # Todos os turnos precisam passar pelo LLM (e pelo prompt da sessão)
+    settings.fast_path_enabled = False
+    orquestrador = OrquestradorBancoAgil(llm=FakeChatModel(responder=responder))
+
+    print("Banco Agil - Estresse de sessoes simultaneas\n")
+    inicio = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.sessoes) as executor:
+        resultados = list(executor.map(
+            lambda i: conversar(orquestrador, clientes[i % len(clientes)], args.turnos),
+            range(args.sessoes)
+        ))
+
+    decorrido = time.perf_counter() - inicio
+    erros = [erro for resultado in resultados for erro in resultado]
+
+    print(f"Sessoes:  {args.sessoes} ({len(clientes)} clientes distintos)")
+    print(f"Turnos:   {args.sessoes * args.turnos}")
+    print(f"Tempo:    {decorrido:.2f}s")
+    print(f"Violacoes de isolamento: {len(erros)}")
+
+    for erro in erros[:10]:
+        print(f"  - {erro}")
+
+    sys.exit(1 if erros else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,15 +10,37 @@ Cada agente é uma instância simples de Agente com:
 NÃO usa LangGraph, NÃO usa herança complexa.
 """
 
-from typing import List, Dict, Any, Annotated
+import contextvars
+import queue
+import threading
+from typing import List, Dict, Any, Annotated, Iterator, Optional
 from langchain_openai import ChatOpenAI
 from langchain.agents import create_openai_functions_agent, AgentExecutor
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.tools import BaseTool
 
 from src.config.settings import get_langfuse_callback
 
 
+class _EventosParaFila(BaseCallbackHandler):
+    """Repassa tokens do LLM e início/fim de tools para uma fila."""
+
+    def __init__(self, fila: queue.Queue):
+        self.fila = fila
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        # Chunks de function_call chegam com token vazio
+        if token:
+            self.fila.put({"tipo": "token", "conteudo": token})
+
+    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        self.fila.put({"tipo": "tool", "fase": "inicio", "nome": (serialized or {}).get("name", "")})
+
+    def on_tool_end(self, output: Any, **kwargs: Any) -> None:
+        self.fila.put({"tipo": "tool", "fase": "fim", "nome": kwargs.get("name", "")})
+
+
 class AgentePadrao:
     """
     Classe base para agentes bancários simples.
@@ -39,25 +61,65 @@ class AgentePadrao:
             nome: Nome do agente (triagem, credito, entrevista, cambio)
             llm: Instância do ChatOpenAI
             tools: Lista de tools do LangChain
-            system_prompt: Prompt do sistema
+            system_prompt: Template do prompt do sistema; as variáveis
+                           ({nome_cliente}, ...) são preenchidas a cada turno
             verbose: Se True, mostra logs
         """
         self.nome = nome
         self.llm = llm
         self.tools = tools
-        self.system_prompt = system_prompt
+        self._system_prompt = system_prompt
         self.verbose = verbose
 
-        # Vamos criar executor dinamicamente em processar()
-        self.executor = None
+        # Prompt, agente e executor são montados uma única vez: as tools são
+        # convertidas para o schema de funções da OpenAI aqui, e o estado de
+        # cada turno entra como variáveis do prompt (veja processar)
+        self.prompt_template = ChatPromptTemplate.from_messages([
+            ("system", self.system_prompt),
+            MessagesPlaceholder(variable_name="historico"),
+            ("human", "{mensagem}"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ])
+
+        agent = create_openai_functions_agent(
+            llm=self.llm,
+            tools=self.tools,
+            prompt=self.prompt_template
+        )
+
+        self.executor = AgentExecutor(
+            agent=agent,
+            tools=self.tools,
+            verbose=self.verbose,
+            return_intermediate_steps=True,
+            max_iterations=10,
+            handle_parsing_errors=True
+        )
+
+    @property
+    def system_prompt(self) -> str:
+        """
+        Template do prompt do sistema (somente leitura).
 
-    def processar(self, mensagem: str, historico: List = None) -> Dict[str, Any]:
+        O agente é compartilhado entre sessões; dados do cliente devem ir
+        em `variaveis` de processar(), nunca no template.
+        """
+        return self._system_prompt
+
+    def processar(
+        self,
+        mensagem: str,
+        historico: List = None,
+        variaveis: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Processa uma mensagem e retorna resposta.
 
         Args:
             mensagem: Mensagem do usuário
             historico: Lista de tuplas (role, content) do histórico
+            variaveis: Valores das variáveis do system prompt para este turno
+                       (ex: nome_cliente, limite_credito, score_credito)
 
         Returns:
             Dict com:
@@ -65,41 +127,81 @@ class AgentePadrao:
                 - resposta: str (resposta do agente)
                 - steps: list (intermediate_steps para debug)
         """
+        return self._invocar(mensagem, historico, variaveis)
+
+    def processar_stream(
+        self,
+        mensagem: str,
+        historico: List = None,
+        variaveis: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Processa uma mensagem entregando a resposta à medida que é gerada.
+
+        O executor roda em uma thread; tokens do LLM e chamadas de tools
+        chegam por callback e são repassados na ordem em que acontecem.
+
+        Args:
+            mensagem: Mensagem do usuário
+            historico: Lista de tuplas (role, content) do histórico
+            variaveis: Valores das variáveis do system prompt para este turno
+
+        Yields:
+            Dicts de evento:
+                - {"tipo": "token", "conteudo": str}
+                - {"tipo": "tool", "fase": "inicio" | "fim", "nome": str}
+                - {"tipo": "fim", "resultado": dict} (o mesmo de processar)
+
+        Example:
+            >>> for evento in agente.processar_stream("Qual meu limite?", [], variaveis):
+            ...     if evento["tipo"] == "token":
+            ...         print(evento["conteudo"], end="")
+        """
+        fila: queue.Queue = queue.Queue()
+
+        def executar():
+            resultado = self._invocar(mensagem, historico, variaveis, [_EventosParaFila(fila)])
+            fila.put({"tipo": "fim", "resultado": resultado})
+
+        # copy_context: o callback do Langfuse herda o trace atual na thread
+        contexto = contextvars.copy_context()
+        threading.Thread(target=contexto.run, args=(executar,), daemon=True).start()
+
+        emitiu_token = False
+        while True:
+            evento = fila.get()
+
+            if evento["tipo"] == "token":
+                emitiu_token = True
+            elif evento["tipo"] == "fim":
+                # Modelo sem streaming (ou erro antes do primeiro token): resposta inteira
+                if not emitiu_token and evento["resultado"]["resposta"]:
+                    yield {"tipo": "token", "conteudo": evento["resultado"]["resposta"]}
+                yield evento
+                return
+
+            yield evento
+
+    def _invocar(
+        self,
+        mensagem: str,
+        historico: Optional[List],
+        variaveis: Optional[Dict[str, Any]],
+        callbacks_extras: Optional[List[BaseCallbackHandler]] = None
+    ) -> Dict[str, Any]:
+        """Executa o AgentExecutor e monta o dict de resultado de processar."""
         if historico is None:
             historico = []
 
         try:
-            # Recriar executor com prompt atualizado (pode ter mudado)
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", self.system_prompt),
-                MessagesPlaceholder(variable_name="historico"),
-                ("human", "{mensagem}"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-            ])
-
-            agent = create_openai_functions_agent(
-                llm=self.llm,
-                tools=self.tools,
-                prompt=prompt_template
-            )
-
-            executor = AgentExecutor(
-                agent=agent,
-                tools=self.tools,
-                verbose=self.verbose,
-                return_intermediate_steps=True,
-                max_iterations=10,
-                handle_parsing_errors=True
-            )
-
             # Preparar callbacks do Langfuse
-            callbacks = []
+            callbacks = list(callbacks_extras or [])
             langfuse_cb = get_langfuse_callback()
             if langfuse_cb:
                 callbacks.append(langfuse_cb)
 
-            result = executor.invoke(
-                {"mensagem": mensagem, "historico": historico},
+            result = self.executor.invoke(
+                {**(variaveis or {}), "mensagem": mensagem, "historico": historico},
                 config={"callbacks": callbacks} if callbacks else None
             )
 
@@ -267,7 +267,8 @@ Fornecer informações sobre cotações de moedas estrangeiras em tempo real.
 ## FERRAMENTAS DISPONIVEIS
 - get_exchange_rate(moeda): Consulta cotação de uma moeda (ex: "USD", "EUR")
 - get_multiple_exchange_rates(moedas): Consulta múltiplas moedas (ex: "USD,EUR,GBP")
-- convert_currency(valor, moeda_origem): Converte valor para reais
+- convert_currency(valor, moeda_origem, moeda_destino): Converte valor entre moedas (destino padrão: BRL)
+- get_exchange_rate_history(moeda, horas): Mínima, máxima, média e variação recentes de uma moeda
 - transfer_to_agent(agente_destino, motivo): Transfere para outro agente (crédito, entrevista)
 - end_conversation(motivo): Encerra atendimento
 
@@ -289,7 +290,9 @@ Fornecer informações sobre cotações de moedas estrangeiras em tempo real.
     - SEMPRE chame a tool - NUNCA responda sem consultar a API primeiro
  3. NUNCA invente valores de cotação
  4. Explique que as cotações são em tempo real e podem variar
+    - Se a ferramenta indicar "ultima cotacao conhecida", informe ao cliente a data/hora dessa cotação e que a API está indisponível no momento
  5. Se o cliente pedir conversão, use convert_currency
+    - Se perguntar como a moeda VARIOU (hoje, nas últimas horas, máxima, mínima), use get_exchange_rate_history
  6. Se o cliente perguntar sobre CREDITO/LIMITE, responda brevemente que pode ajudar com isso e o atendimento continuará
  7. Se o cliente perguntar sobre outros assuntos fora de câmbio, confirme que pode ajudar.
  8. NUNCA use end_conversation - o sistema redirecionará automaticamente para o próximo tópico
@@ -314,6 +317,15 @@ Cliente: "Quanto é 100 dólares em reais?"
 Você: [usa convert_currency(100, "USD")]
 "100 dólares equivalem a R$ 525,00 na cotação atual."
 
+Cliente: "Quantos dólares dá 100 euros?"
+Você: [usa convert_currency(100, "EUR", "USD")]
+"100 euros equivalem a 110,48 USD na cotação atual."
+
+VARIACAO:
+Cliente: "Como o dólar variou hoje?"
+Você: [usa get_exchange_rate_history("USD", 24)]
+"Nas últimas 24h o dólar oscilou entre R$ 5,21 e R$ 5,31 (média de R$ 5,26), com alta de 0,38%."
+
 MAIS VARIAÇÕES DE CONSULTA:
 Cliente: "Consultar preço do dólar"
 Você: [usa get_exchange_rate("USD")]
@@ -354,43 +366,79 @@ Você: "Claro! Posso ajudar com isso. Vamos continuar com seu atendimento de cr
 - Não inicie perguntas de autenticação ou crédito - apenas confirme que pode ajudar
 """
 
+# ============================================================================
+# RESUMO DO HISTORICO
+# ============================================================================
+
+RESUMO_HISTORICO_PROMPT = """Você resume conversas de atendimento do Banco Agil para uso interno dos agentes.
+
+Atualize o resumo existente incorporando as novas mensagens. Mantenha apenas o que for útil
+para continuar o atendimento: pedidos do cliente, valores consultados ou solicitados,
+resultados (aprovado/rejeitado, score, cotações) e pendências.
+
+REGRAS:
+- No máximo 5 frases, em português, em terceira pessoa
+- Não invente informações nem inclua CPF ou data de nascimento
+- Responda apenas com o resumo atualizado
+"""
+
 # ============================================================================
 # PROMPT HELPER FUNCTIONS
 # ============================================================================
 
+def triagem_prompt_variables(state: dict) -> dict:
+    """Variáveis do prompt do agente de triagem a partir do estado atual."""
+    return {
+        "authenticated": state.get("authenticated", False),
+        "authentication_attempts": state.get("authentication_attempts", 0),
+        "nome_cliente": state.get("nome_cliente", "N/A")
+    }
+
+
+def credito_prompt_variables(state: dict) -> dict:
+    """Variáveis do prompt do agente de credito a partir do estado atual."""
+    return {
+        "cpf_cliente": state.get("cpf_cliente", "N/A"),
+        "nome_cliente": state.get("nome_cliente", "N/A"),
+        "limite_credito": state.get("limite_credito", 0),
+        "score_credito": state.get("score_credito", 0),
+        "voltou_da_entrevista": state.get("voltou_da_entrevista", False)
+    }
+
+
+def entrevista_prompt_variables(state: dict) -> dict:
+    """Variáveis do prompt do agente de entrevista a partir do estado atual."""
+    return {
+        "cpf_cliente": state.get("cpf_cliente", "N/A"),
+        "nome_cliente": state.get("nome_cliente", "N/A"),
+        "score_credito": state.get("score_credito", 0),
+        "vindo_de_credito": state.get("vindo_de_credito", False)
+    }
+
+
+def cambio_prompt_variables(state: dict) -> dict:
+    """Variáveis do prompt do agente de cambio a partir do estado atual."""
+    return {
+        "nome_cliente": state.get("nome_cliente", "Cliente"),
+        "cpf_cliente": state.get("cpf_cliente", "N/A")
+    }
+
+
 def format_triagem_prompt(state: dict) -> str:
     """Formata o prompt do agente de triagem com o estado atual."""
-    return TRIAGEM_SYSTEM_PROMPT.format(
-        authenticated=state.get("authenticated", False),
-        authentication_attempts=state.get("authentication_attempts", 0),
-        nome_cliente=state.get("nome_cliente", "N/A")
-    )
+    return TRIAGEM_SYSTEM_PROMPT.format(**triagem_prompt_variables(state))
 
 
 def format_credito_prompt(state: dict) -> str:
     """Formata o prompt do agente de credito com o estado atual."""
-    return CREDITO_SYSTEM_PROMPT.format(
-        cpf_cliente=state.get("cpf_cliente", "N/A"),
-        nome_cliente=state.get("nome_cliente", "N/A"),
-        limite_credito=state.get("limite_credito", 0),
-        score_credito=state.get("score_credito", 0),
-        voltou_da_entrevista=state.get("voltou_da_entrevista", False)
-    )
+    return CREDITO_SYSTEM_PROMPT.format(**credito_prompt_variables(state))
 
 
 def format_entrevista_prompt(state: dict) -> str:
     """Formata o prompt do agente de entrevista com o estado atual."""
-    return ENTREVISTA_SYSTEM_PROMPT.format(
-        cpf_cliente=state.get("cpf_cliente", "N/A"),
-        nome_cliente=state.get("nome_cliente", "N/A"),
-        score_credito=state.get("score_credito", 0),
-        vindo_de_credito=state.get("vindo_de_credito", False)
-    )
+    return ENTREVISTA_SYSTEM_PROMPT.format(**entrevista_prompt_variables(state))
 
 
 def format_cambio_prompt(state: dict) -> str:
     """Formata o prompt do agente de cambio com o estado atual."""
-    return CAMBIO_SYSTEM_PROMPT.format(
-        nome_cliente=state.get("nome_cliente", "Cliente"),
-        cpf_cliente=state.get("cpf_cliente", "N/A")
-    )
+    return CAMBIO_SYSTEM_PROMPT.format(**cambio_prompt_variables(state))
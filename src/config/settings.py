@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Literal
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from langchain_openai import ChatOpenAI
@@ -17,17 +17,47 @@ class Settings(BaseSettings):
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"
     openai_temperature: float = 0.4
+    fake_llm_script: str = ""  # JSON com respostas roteirizadas: usa um LLM falso (sem OpenAI)
 
     # =========================================================================
     # Application
     # =========================================================================
     max_auth_attempts: int = 3
     csv_data_path: str = "./data"
+    fast_path_enabled: bool = True  # Responde pedidos simples sem o LLM (intent_router)
+    history_max_turns: int = 6  # Turnos enviados literalmente aos agentes (0 = todos)
+    history_max_tokens: int = 2000  # Limite de tokens de resumo + histórico (0 = sem limite)
+    history_summary_batch: int = 4  # Turnos que saem da janela de uma vez (um resumo por lote)
+    history_summary_model: str = "gpt-4o-mini"  # Modelo do resumo do histórico (vazio = sem LLM)
+    response_cache_enabled: bool = False  # Reutiliza respostas de perguntas que não dependem do cliente
+    response_cache_size: int = 512  # Entradas no cache de respostas (LRU)
+    response_cache_ttl: float = 3600.0  # Validade de cada resposta em cache (s)
+
+    # =========================================================================
+    # Storage
+    # =========================================================================
+    storage_backend: Literal["csv", "sqlite"] = "csv"
+    sqlite_db_path: str = "./data/banco_agil.db"
+    csv_append_fsync: bool = False  # fsync a cada solicitação anexada ao CSV
 
     # =========================================================================
     # Exchange API
     # =========================================================================
     exchange_api_url: str = "https://economia.awesomeapi.com.br/json/last"
+    exchange_cache_ttl: float = 60.0  # Segundos em que a cotação é fresca (0 = sem cache)
+    exchange_cache_stale_ttl: float = 600.0  # Máximo servido obsoleto enquanto atualiza
+    exchange_pool_size: int = 10  # Conexões keep-alive mantidas com a API
+    exchange_max_retries: int = 2
+    exchange_retry_backoff: float = 0.3  # Backoff exponencial entre tentativas (s)
+    exchange_coalesce_window: float = 0.0  # Janela para agrupar pares sob concorrência (0 = só deduplica)
+    exchange_supported_currencies: str = "USD,EUR,GBP,ARS,BTC,CAD,CHF,JPY"
+    exchange_refresh_interval: float = 30.0  # Atualização periódica das cotações (0 = desligada)
+    exchange_timeout: float = 10.0  # Timeout de cada requisição (s)
+    exchange_circuit_failure_threshold: int = 3  # Falhas seguidas que abrem o circuito
+    exchange_circuit_open_seconds: float = 30.0  # Tempo recusando chamadas antes do teste
+    exchange_health_ttl: float = 15.0  # Validade do status de saúde em cache (s)
+    exchange_history_size: int = 100_000  # Amostras no histórico em memória (todos os pares)
+    exchange_snapshot_path: str = "./data/cotacoes_snapshot.json"  # Vazio = sem snapshot em disco
 
     # =========================================================================
     # LangSmith (Opcional)
@@ -58,6 +88,25 @@ class Settings(BaseSettings):
         """Retorna o Path do diretório de dados."""
         return Path(self.csv_data_path)
 
+    @property
+    def sqlite_path(self) -> Path:
+        """Retorna o Path do arquivo SQLite."""
+        return Path(self.sqlite_db_path)
+
+    @property
+    def snapshot_path(self) -> Optional[Path]:
+        """Retorna o Path do snapshot de cotações (None se desativado)."""
+        return Path(self.exchange_snapshot_path) if self.exchange_snapshot_path else None
+
+    @property
+    def moedas_suportadas(self) -> list[str]:
+        """Retorna a lista de moedas suportadas (sem BRL)."""
+        return [
+            moeda.strip().upper()
+            for moeda in self.exchange_supported_currencies.split(",")
+            if moeda.strip()
+        ]
+
     def get_csv_path(self, filename: str) -> Path:
         """Retorna o Path completo para um arquivo CSV."""
         return self.data_path / filename
@@ -85,12 +134,21 @@ def get_llm(
         model: Modelo a ser usado. Default: settings.openai_model
 
     Returns:
-        ChatOpenAI configurado e pronto para uso.
+        ChatOpenAI configurado e pronto para uso (ou o LLM falso de
+        FAKE_LLM_SCRIPT, se definido).
 
     Example:
         >>> llm = get_llm(temperature=0.5)
         >>> response = llm.invoke("Olá!")
     """
+    if settings.fake_llm_script:
+        # Execução offline (benchmarks, demonstrações): respostas do roteiro
+        from src.utils.fake_llm import FakeChatModel, RespostasRoteirizadas
+        return FakeChatModel(
+            responder=RespostasRoteirizadas.de_arquivo(settings.fake_llm_script),
+            streaming=streaming
+        )
+
     return ChatOpenAI(
         model=model or settings.openai_model,
         temperature=temperature if temperature is not None else settings.openai_temperature,
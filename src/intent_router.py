@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Classificador de intenções determinístico, executado antes do LLM.
+
+Uma única regex compilada (alternância com grupos nomeados) percorre a
+mensagem normalizada (minúsculas, sem acentos) uma vez e devolve os
+tópicos encontrados. Serve para:
+- decidir a troca de agente (crédito, câmbio, entrevista);
+- reconhecer pedidos simples de alta confiança ("qual meu limite",
+  "cotação do dólar"), respondidos direto pela tool, sem o modelo.
+"""
+
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
+
+
+# ==============================================================================
+# TOPICOS
+# ==============================================================================
+
+CREDITO = "credito"              # Assunto de crédito/limite (troca para o agente de crédito)
+CAMBIO = "cambio"                # Assunto de câmbio (troca para o agente de câmbio)
+CAMBIO_AMPLO = "cambio_amplo"    # Termos de câmbio mais genéricos (taxa, usd, eur...)
+ACEITE = "aceite"                # Cliente aceitando uma proposta (entrevista)
+LIMITE = "limite"                # Menciona o limite
+ALTERACAO = "alteracao"          # Pedido de mudança (aumentar, solicitar...)
+PEDIDO_COTACAO = "pedido_cotacao"
+HISTORICO = "historico"          # Variação/histórico de cotação
+NEGACAO = "negacao"
+CONSULTA_LIMITE = "consulta_limite"    # Pedido explícito de ver o limite ("qual meu limite")
+PERGUNTA_ABERTA = "pergunta_aberta"    # Como/por que/foi...: pede explicação, não um valor
+OUTRO_LIMITE = "outro_limite"          # Limites que não são o de crédito (saque, pix...)
+
+# Intenções atendidas pelo caminho rápido
+CONSULTAR_LIMITE = "consultar_limite"
+CONSULTAR_COTACAO = "consultar_cotacao"
+
+# Nome por extenso das moedas, com artigo (para as respostas)
+NOMES_MOEDAS = {
+    "USD": "do dólar",
+    "EUR": "do euro",
+    "GBP": "da libra",
+    "JPY": "do iene",
+    "CHF": "do franco suíço",
+    "CAD": "do dólar canadense",
+    "ARS": "do peso argentino",
+    "BTC": "do bitcoin",
+}
+
+# Cada grupo: (termos, tópicos marcados). Os termos são fragmentos de regex
+# e casam como substring, como as antigas listas de palavras-chave; siglas
+# de moeda exigem palavra inteira ("cad" não casa com "cadastro"). A ordem
+# importa quando um termo contém outro: o mais longo deve vir antes
+# ("dolar canadense" antes de "dolar", "euros" antes de "euro").
+_GRUPOS: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]] = {
+    # Antes dos demais: consome "limite", então marca também os tópicos dele
+    "consulta_limite": (
+        (r"\b(?:qual|quanto|ver|consultar|saber)\b"
+         r"(?:\s+(?:e|eh|o|a|esta|ta|meu|seu|atual))*\s+limite\b",),
+        frozenset({CREDITO, LIMITE, CONSULTA_LIMITE})
+    ),
+    "pergunta_aberta": ((r"^como\b", r"^foi\b", r"\bpor ?que\b"), frozenset({PERGUNTA_ABERTA})),
+    "moeda_cad": (("dolar canadense", "dolares canadenses", r"\bcad\b"), frozenset({CAMBIO, "moeda:CAD"})),
+    "moeda_usd": (("dolares", "dolar", r"\busd\b"), frozenset({CAMBIO, "moeda:USD"})),
+    "moeda_eur": (("euros", "euro"), frozenset({CAMBIO, "moeda:EUR"})),
+    "moeda_eur_sigla": ((r"\beur\b",), frozenset({CAMBIO_AMPLO, "moeda:EUR"})),
+    "moeda_gbp": (("libras", "libra", r"\bgbp\b"), frozenset({CAMBIO, "moeda:GBP"})),
+    "moeda_jpy": (("ienes", "iene", r"\bjpy\b"), frozenset({CAMBIO, "moeda:JPY"})),
+    "moeda_chf": (("franco suico", "francos suicos", r"\bchf\b"), frozenset({CAMBIO, "moeda:CHF"})),
+    "moeda_ars": (("peso argentino", "pesos argentinos", r"\bars\b"), frozenset({CAMBIO, "moeda:ARS"})),
+    "moeda_btc": (("bitcoins", "bitcoin", r"\bbtc\b"), frozenset({CAMBIO, "moeda:BTC"})),
+    "cotacao": (("cotacoes", "cotacao"), frozenset({CAMBIO, PEDIDO_COTACAO})),
+    "cambio": (("cambio", "moeda"), frozenset({CAMBIO})),
+    "conversao": (("conversao", "converter"), frozenset({CAMBIO_AMPLO, ALTERACAO})),
+    "taxa": (("taxa",), frozenset({CAMBIO_AMPLO})),
+    "preco": (("quanto esta", "quanto ta", "quanto custa", "preco", "valor"), frozenset({PEDIDO_COTACAO})),
+    "historico": (
+        ("variacao", "variou", "historico", "maxima", "minima", "ontem", "semana", "subiu", "caiu"),
+        frozenset({HISTORICO})
+    ),
+    "limite": (("limite",), frozenset({CREDITO, LIMITE})),
+    "outro_limite": (("saque", "pix", "transferencia", "cheque especial"), frozenset({OUTRO_LIMITE})),
+    "aumento": (("aumentar", "aumento"), frozenset({CREDITO, ALTERACAO})),
+    "credito": (("credito", "emprestimo", "score", "pontos"), frozenset({CREDITO})),
+    "alteracao": (
+        ("solicitar", "pedir", "mudar", "alterar", "subir", "novo", "maximo", "maior",
+         "reduzir", "diminuir", "entrevista"),
+        frozenset({ALTERACAO})
+    ),
+    "aceite": (("sim", "quero", "aceito", "gostaria"), frozenset({ACEITE})),
+    "negacao": ((r"\bnao\b", r"\bnem\b"), frozenset({NEGACAO})),
+}
+
+_PADRAO = re.compile("|".join(
+    f"(?P<{nome}>{'|'.join(termos)})"
+    for nome, (termos, _) in _GRUPOS.items()
+))
+
+_DIGITOS = re.compile(r"\d")
+
+# Mensagens maiores que isso nunca vão pelo caminho rápido
+MAX_PALAVRAS_CAMINHO_RAPIDO = 12
+
+
+def normalizar(texto: str) -> str:
+    """
+    Minúsculas e sem acentos.
+
+    Example:
+        >>> normalizar("Cotação do Dólar")
+        'cotacao do dolar'
+    """
+    decomposto = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(c for c in decomposto if not unicodedata.combining(c))
+
+
+@dataclass(frozen=True)
+class Classificacao:
+    """Resultado da classificação de uma mensagem."""
+
+    topicos: FrozenSet[str]
+    moedas: Tuple[str, ...]
+    tem_digitos: bool
+    palavras: int
+
+    def tem(self, *topicos: str) -> bool:
+        """True se a mensagem tem algum dos tópicos."""
+        return any(topico in self.topicos for topico in topicos)
+
+    @property
+    def intencao_rapida(self) -> Optional[str]:
+        """
+        Intenção simples e de alta confiança, atendida sem o LLM.
+
+        Só vale para mensagens curtas, sem números (valores, CPF, datas),
+        sem negação, com um único assunto e que pedem um valor: o limite
+        exige uma forma explícita de consulta ("qual/quanto/ver/consultar/
+        saber ... limite"), e perguntas abertas (como, por que, foi...)
+        sempre vão para o LLM.
+
+        Returns:
+            CONSULTAR_LIMITE, CONSULTAR_COTACAO ou None
+        """
+        if (
+            self.tem_digitos or self.palavras > MAX_PALAVRAS_CAMINHO_RAPIDO
+            or self.tem(NEGACAO, PERGUNTA_ABERTA)
+        ):
+            return None
+
+        if self.tem(CONSULTA_LIMITE) and not self.tem(ALTERACAO, CAMBIO, CAMBIO_AMPLO, HISTORICO, OUTRO_LIMITE):
+            return CONSULTAR_LIMITE
+
+        if (
+            self.tem(PEDIDO_COTACAO) and len(self.moedas) == 1
+            and not self.tem(CREDITO, ALTERACAO, HISTORICO)
+        ):
+            return CONSULTAR_COTACAO
+
+        return None
+
+
+@lru_cache(maxsize=2048)
+def classificar(mensagem: str) -> Classificacao:
+    """
+    Classifica uma mensagem em uma única passada da regex compilada.
+
+    Args:
+        mensagem: Texto do cliente
+
+    Returns:
+        Classificacao com tópicos, moedas citadas e sinais de complexidade
+
+    Example:
+        >>> classificar("Qual a cotação do dólar?").intencao_rapida
+        'consultar_cotacao'
+    """
+    texto = normalizar(mensagem)
+    topicos = set()
+    moedas = []
+
+    for match in _PADRAO.finditer(texto):
+        for topico in _GRUPOS[match.lastgroup][1]:
+            if topico.startswith("moeda:"):
+                moeda = topico.split(":", 1)[1]
+                if moeda not in moedas:
+                    moedas.append(moeda)
+            else:
+                topicos.add(topico)
+
+    return Classificacao(
+        topicos=frozenset(topicos),
+        moedas=tuple(moedas),
+        tem_digitos=bool(_DIGITOS.search(texto)),
+        palavras=len(texto.split())
+    )
+
+
+class EstatisticasCaminhoRapido:
+    """Contadores de turnos atendidos pelo caminho rápido (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.turnos = 0
+        self.rapidos = 0
+        self.por_intencao: Dict[str, int] = {}
+
+    def registrar(self, intencao: Optional[str]) -> None:
+        """Registra um turno; intencao None = atendido pelo LLM."""
+        with self._lock:
+            self.turnos += 1
+            if intencao is not None:
+                self.rapidos += 1
+                self.por_intencao[intencao] = self.por_intencao.get(intencao, 0) + 1
+
+    def resumo(self) -> Dict:
+        """
+        Returns:
+            Dict com turnos, rapidos, fracao_rapida e por_intencao
+        """
+        with self._lock:
+            return {
+                "turnos": self.turnos,
+                "rapidos": self.rapidos,
+                "fracao_rapida": self.rapidos / self.turnos if self.turnos else 0.0,
+                "por_intencao": dict(self.por_intencao)
+            }
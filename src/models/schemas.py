@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Optional
 
 
 class Cliente(BaseModel):
@@ -109,6 +109,10 @@ class CotacaoMoeda(BaseModel):
     moeda: str = Field(..., min_length=3, max_length=3, description="Código da moeda (USD, EUR, etc)")
     taxa: float = Field(..., gt=0, description="Taxa de câmbio")
     data_hora: datetime = Field(default_factory=datetime.now)
+    desatualizada_desde: Optional[datetime] = Field(
+        None,
+        description="Preenchido quando a API está indisponível e a cotação é a última conhecida"
+    )
 
     class Config:
         json_schema_extra = {
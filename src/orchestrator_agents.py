@@ -1,21 +1,41 @@
-from typing import Dict, Any, Tuple
+import re
+import time
+from typing import Dict, Any, Generator, Iterator, Tuple, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
 from src.agentes import (
     criar_agente_triagem,
     criar_agente_credito,
     criar_agente_entrevista,
     criar_agente_cambio
 )
-from src.config.settings import get_llm
+from src.config.settings import get_llm, settings
 from src.config.prompts import (
     TRIAGEM_SYSTEM_PROMPT,
     CREDITO_SYSTEM_PROMPT,
     ENTREVISTA_SYSTEM_PROMPT,
     CAMBIO_SYSTEM_PROMPT,
-    format_triagem_prompt,
-    format_credito_prompt,
-    format_entrevista_prompt,
-    format_cambio_prompt
+    RESUMO_HISTORICO_PROMPT,
+    triagem_prompt_variables,
+    credito_prompt_variables,
+    entrevista_prompt_variables,
+    cambio_prompt_variables
 )
+from src.intent_router import (
+    classificar,
+    normalizar,
+    EstatisticasCaminhoRapido,
+    NOMES_MOEDAS,
+    CREDITO,
+    CAMBIO,
+    CAMBIO_AMPLO,
+    ACEITE,
+    NEGACAO,
+    CONSULTAR_LIMITE,
+    CONSULTAR_COTACAO
+)
+from src.utils.history_manager import GerenciadorHistorico
+from src.utils.response_cache import CacheRespostas, normalizar_pergunta
 from src.utils.observability import (
     observe,
     get_langfuse_client,
@@ -27,24 +47,84 @@ from src.utils.observability import (
 from src.tools.auth_tools import authenticate_client, get_client_info
 from src.tools.credit_tools import get_credit_limit, request_limit_increase, check_max_limit_for_score
 from src.tools.interview_tools import calculate_new_score, update_client_score
-from src.tools.exchange_tools import get_exchange_rate, get_multiple_exchange_rates, convert_currency
+from src.tools.exchange_tools import (
+    get_exchange_rate,
+    get_multiple_exchange_rates,
+    convert_currency,
+    get_exchange_rate_history
+)
 from src.tools.common_tools import end_conversation, get_help
 
 
+# Mensagem interna enviada ao agente que assume a conversa numa troca
+# decidida pela resposta (ex.: crédito -> entrevista)
+MENSAGEM_CONTINUACAO = "[CONTINUACAO]"
+
+# Tools que podem aparecer em um turno guardado no cache de respostas:
+# não leem nem alteram dados do cliente
+TOOLS_SEM_EFEITO = {"get_help"}
+
+# Números citados numa resposta (ex.: "5.000,00", "572")
+_NUMERO = re.compile(r"\d[\d.,]*")
+
+# Troca de agente pelo assunto da mensagem: agente -> [(tópicos, destino)],
+# na ordem de prioridade
+ROTAS_POR_ASSUNTO = {
+    "triagem": [((CREDITO,), "credito"), ((CAMBIO, CAMBIO_AMPLO), "cambio")],
+    "credito": [((CAMBIO, CAMBIO_AMPLO), "cambio")],
+    "entrevista": [((CAMBIO,), "cambio")],
+    "cambio": [((CREDITO,), "credito")],
+}
+
+
 class OrquestradorBancoAgil:
     """
     Mantém instâncias dos 4 agentes e decide qual usar baseado no estado.
+
+    Uma única instância atende várias sessões em paralelo (ela é
+    compartilhada via st.cache_resource): os agentes não são alterados
+    depois de criados e todo dado da sessão chega por `estado`, que
+    processar() não modifica (retorna um novo).
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        llm: Optional[BaseChatModel] = None,
+        llm_resumo: Optional[BaseChatModel] = None
+    ):
         """
         Inicializa orquestrador e cria os 4 agentes.
 
         Args:
             verbose: Se True, agentes mostram logs detalhados
+            llm: Modelo usado pelos agentes. Se None, usa get_llm()
+            llm_resumo: Modelo que resume o histórico. Se None, é criado
+                com HISTORY_SUMMARY_MODEL quando os agentes usam o LLM
+                padrão; com um `llm` próprio, FAKE_LLM_SCRIPT ou
+                HISTORY_SUMMARY_MODEL vazio, o resumo é feito sem LLM
+                (resumo_de_reserva)
         """
         self.verbose = verbose
-        llm = get_llm()
+        self.estatisticas_rapidas = EstatisticasCaminhoRapido()
+        self.cache_respostas = CacheRespostas(
+            capacidade=settings.response_cache_size,
+            ttl=settings.response_cache_ttl
+        )
+        # Resumo com um modelo próprio: não disputa o LLM dos agentes (nem
+        # consome passos de um LLM roteirizado)
+        if llm_resumo is None and llm is None and settings.history_summary_model and not settings.fake_llm_script:
+            llm_resumo = get_llm(temperature=0, streaming=False, model=settings.history_summary_model)
+        self.llm_resumo = llm_resumo
+
+        self.llm = llm = llm or get_llm()
+        self.gerenciador_historico = GerenciadorHistorico(
+            max_turnos=settings.history_max_turns,
+            max_tokens=settings.history_max_tokens,
+            resumir=self._resumir_historico if llm_resumo is not None else None,
+            lote_resumo=settings.history_summary_batch,
+            modelo=settings.openai_model
+        )
 
         # Criar agentes com suas tools específicas
         self.triagem = criar_agente_triagem(
@@ -70,15 +150,41 @@ class OrquestradorBancoAgil:
 
         self.cambio = criar_agente_cambio(
             llm=llm,
-            tools=[get_exchange_rate, get_multiple_exchange_rates, convert_currency, end_conversation],
+            tools=[
+                get_exchange_rate,
+                get_multiple_exchange_rates,
+                convert_currency,
+                get_exchange_rate_history,
+                end_conversation
+            ],
             prompt=CAMBIO_SYSTEM_PROMPT,
             verbose=verbose
         )
 
-    def processar(self, mensagem: str, estado: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        # Agente -> (instância, variáveis do prompt, atualização do estado)
+        self._agentes = {
+            "triagem": (self.triagem, triagem_prompt_variables, self._atualizar_estado_triagem),
+            "credito": (self.credito, credito_prompt_variables, self._atualizar_estado_credito),
+            "entrevista": (self.entrevista, entrevista_prompt_variables, self._atualizar_estado_entrevista),
+            "cambio": (self.cambio, cambio_prompt_variables, self._atualizar_estado_cambio),
+        }
+
+    def processar(
+        self,
+        mensagem: str,
+        estado: Dict[str, Any],
+        transicao_no_turno: bool = True
+    ) -> Tuple[str, Dict[str, Any]]:
         """
         Processa mensagem com o agente apropriado.
 
+        Trocas de agente acontecem dentro da mesma chamada:
+        - pelo assunto da mensagem (cliente autenticado): o agente de
+          destino é escolhido ANTES do LLM e responde direto;
+        - pela resposta (ex.: entrevista aceita ou concluída): se ela não
+          termina em pergunta, o novo agente continua no mesmo turno e as
+          duas respostas são devolvidas juntas.
+
         Args:
             mensagem: Mensagem do usuário
             estado: Estado atual da conversa (dict simples):
@@ -90,18 +196,97 @@ class OrquestradorBancoAgil:
                     "limite": float | None,
                     "score": int | None,
                     "historico": List[tuple],
+                    "resumo_historico": str,
                     "ultima_mensagem": str
                 }
+            transicao_no_turno: Se False, a troca de agente só vale a partir
+                da próxima mensagem (comportamento anterior)
 
         Returns:
             Tuple (resposta_str, novo_estado_dict)
         """
-        # Salvar última mensagem para análise
-        estado["ultima_mensagem"] = mensagem
+        for evento in self._turno(mensagem, estado, transicao_no_turno, streaming=False):
+            if evento["tipo"] == "fim":
+                return evento["resposta"], evento["estado"]
+
+    def processar_stream(
+        self,
+        mensagem: str,
+        estado: Dict[str, Any],
+        transicao_no_turno: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Como processar(), mas entrega a resposta à medida que é gerada.
+
+        Args:
+            mensagem: Mensagem do usuário
+            estado: Estado atual da conversa (veja processar)
+            transicao_no_turno: Veja processar
+
+        Yields:
+            Dicts de evento:
+                - {"tipo": "token", "conteudo": str}
+                - {"tipo": "tool", "fase": "inicio" | "fim", "nome": str}
+                - {"tipo": "fim", "resposta": str, "estado": dict,
+                   "metricas": {"ttft_ms": float | None, "total_ms": float}}
+
+        Example:
+            >>> for evento in orquestrador.processar_stream("Qual a cotação do euro?", estado):
+            ...     if evento["tipo"] == "token":
+            ...         print(evento["conteudo"], end="")
+            ...     elif evento["tipo"] == "fim":
+            ...         estado = evento["estado"]
+        """
+        inicio = time.perf_counter()
+        ttft_ms = None
+
+        for evento in self._turno(mensagem, estado, transicao_no_turno, streaming=True):
+            if evento["tipo"] == "token" and ttft_ms is None:
+                ttft_ms = (time.perf_counter() - inicio) * 1000
+
+            if evento["tipo"] == "fim":
+                evento["metricas"] = {
+                    "ttft_ms": ttft_ms,
+                    "total_ms": (time.perf_counter() - inicio) * 1000
+                }
+                langfuse = get_langfuse_client()
+                if langfuse:
+                    try:
+                        langfuse.update_current_span(metadata=evento["metricas"])
+                    except Exception:
+                        pass
+
+            yield evento
+
+    def _turno(
+        self,
+        mensagem: str,
+        estado: Dict[str, Any],
+        transicao_no_turno: bool,
+        streaming: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Executa um turno, gerando os eventos de processar_stream.
+
+        Com streaming=False os agentes rodam com invoke (sem thread) e não
+        geram eventos de token; processar() usa apenas o evento "fim".
+        """
+        # Salvar última mensagem para análise (em uma cópia: o estado
+        # recebido pertence à sessão e não é alterado)
+        estado = {**estado, "ultima_mensagem": mensagem}
 
         # Determinar agente atual
         agente_atual = estado.get("agente_atual", "triagem")
-        historico = estado.get("historico", [])
+
+        # Janela recente + resumo dos turnos anteriores, dentro do limite de tokens
+        contexto = self.gerenciador_historico.preparar(
+            estado.get("historico", []),
+            estado.get("resumo_historico", ""),
+            mensagem
+        )
+        historico = contexto.mensagens
+        estado["historico"] = contexto.historico
+        estado["resumo_historico"] = contexto.resumo
 
         # Atualizar trace do Langfuse com contexto da sessão
         langfuse = get_langfuse_client()
@@ -117,43 +302,69 @@ class OrquestradorBancoAgil:
                 )
                 langfuse.update_current_span(
                     input={"mensagem": mensagem},
-                    metadata={"historico_size": len(historico)}
+                    metadata={"historico_size": len(historico), "tokens": contexto.tokens}
                 )
             except Exception:
                 pass  # Ignora erros de observabilidade
 
-        # Executar agente específico
-        if agente_atual == "triagem":
-            self.triagem.system_prompt = format_triagem_prompt(self._estado_para_dict(estado))
-            resultado = self.triagem.processar(mensagem, historico)
-            novo_estado = self._atualizar_estado_triagem(resultado, estado)
+        # Pedidos simples de alta confiança: tool direto, sem LLM
+        rapido = self._caminho_rapido(estado) if settings.fast_path_enabled else None
+        self.estatisticas_rapidas.registrar(rapido[0] if rapido else None)
 
-        elif agente_atual == "credito":
-            self.credito.system_prompt = format_credito_prompt(self._estado_para_dict(estado))
-            resultado = self.credito.processar(mensagem, historico)
-            novo_estado = self._atualizar_estado_credito(resultado, estado)
+        encadeou = False
+        acerto_cache = None
 
-        elif agente_atual == "entrevista":
-            self.entrevista.system_prompt = format_entrevista_prompt(self._estado_para_dict(estado))
-            resultado = self.entrevista.processar(mensagem, historico)
-            novo_estado = self._atualizar_estado_entrevista(resultado, estado)
-
-        elif agente_atual == "cambio":
-            self.cambio.system_prompt = format_cambio_prompt(self._estado_para_dict(estado))
-            resultado = self.cambio.processar(mensagem, historico)
-            novo_estado = self._atualizar_estado_cambio(resultado, estado)
+        if rapido:
+            _, resultado, novo_estado = rapido
+            yield {"tipo": "token", "conteudo": resultado["resposta"]}
 
         else:
-            # Fallback - voltar para triagem
-            resultado = {"resposta": "Erro: agente desconhecido. Retornando para triagem..."}
-            novo_estado = estado.copy()
-            novo_estado["agente_atual"] = "triagem"
+            # Troca pelo assunto antes do LLM: o agente de destino já responde
+            if transicao_no_turno and estado.get("autenticado"):
+                destino = self._destino_por_assunto(agente_atual, mensagem)
+                if destino:
+                    estado["agente_atual"] = agente_atual = destino
+
+            # Perguntas que não dependem do cliente: resposta já pronta
+            if settings.response_cache_enabled:
+                acerto_cache = self._consultar_cache(agente_atual, estado)
+
+            if acerto_cache:
+                resultado = {"sucesso": True, "resposta": acerto_cache[0], "steps": []}
+                novo_estado = estado.copy()
+                yield {"tipo": "token", "conteudo": resultado["resposta"]}
+            else:
+                resultado, novo_estado = yield from self._executar_agente(
+                    agente_atual, mensagem, historico, estado, streaming
+                )
+                if settings.response_cache_enabled:
+                    self._guardar_no_cache(agente_atual, estado, resultado, novo_estado)
+
+            # Troca decidida pela resposta: o novo agente continua no mesmo turno
+            proximo = novo_estado.get("agente_atual")
+            if transicao_no_turno and proximo != agente_atual and "?" not in resultado["resposta"]:
+                yield {"tipo": "token", "conteudo": "\n\n"}
+                continuacao, novo_estado = yield from self._executar_agente(
+                    proximo,
+                    MENSAGEM_CONTINUACAO,
+                    historico + [("user", mensagem), ("assistant", resultado["resposta"])],
+                    {**novo_estado, "ultima_mensagem": MENSAGEM_CONTINUACAO},
+                    streaming
+                )
+                novo_estado["ultima_mensagem"] = mensagem
+                resultado = {
+                    "sucesso": resultado.get("sucesso", False) and continuacao.get("sucesso", False),
+                    "resposta": f"{resultado['resposta']}\n\n{continuacao['resposta']}",
+                    "steps": resultado.get("steps", []) + continuacao.get("steps", [])
+                }
+                encadeou = True
 
-        # Atualizar histórico
-        novo_estado["historico"] = historico + [
+        # Atualizar histórico (só a janela; o restante já está no resumo)
+        novo_estado["historico"] = contexto.historico + [
             ("user", mensagem),
             ("assistant", resultado["resposta"])
         ]
+        novo_estado["tokens_turno"] = contexto.tokens
 
         # Atualizar span com resultado
         if langfuse:
@@ -164,7 +375,10 @@ class OrquestradorBancoAgil:
                         "agente_usado": agente_atual,
                         "agente_proximo": novo_estado.get("agente_atual"),
                         "mudou_agente": agente_atual != novo_estado.get("agente_atual"),
-                        "sucesso": resultado.get("sucesso", False)
+                        "sucesso": resultado.get("sucesso", False),
+                        "caminho_rapido": rapido[0] if rapido else None,
+                        "cache_resposta": acerto_cache[1] if acerto_cache else None,
+                        "encadeou_agente": encadeou
                     }
                 )
             except Exception:
@@ -174,8 +388,250 @@ class OrquestradorBancoAgil:
         if self.verbose:
             print(f"\n[DEBUG] Agente: {agente_atual} -> {novo_estado['agente_atual']}")
             print(f"[DEBUG] Autenticado: {novo_estado.get('autenticado')}")
+            print(f"[DEBUG] Tokens do contexto: {contexto.tokens}")
+
+        yield {"tipo": "fim", "resposta": resultado["resposta"], "estado": novo_estado}
+
+    def _executar_agente(
+        self,
+        agente: str,
+        mensagem: str,
+        historico: list,
+        estado: Dict,
+        streaming: bool = False
+    ) -> Generator[Dict[str, Any], None, Tuple[Dict, Dict]]:
+        """
+        Executa um agente e aplica a atualização de estado dele.
+
+        É um gerador: com streaming=True repassa os eventos de token/tool
+        do agente. Use com `yield from`.
+
+        Returns:
+            Tupla (resultado, novo_estado)
+        """
+        if agente not in self._agentes:
+            # Fallback - voltar para triagem
+            novo_estado = estado.copy()
+            novo_estado["agente_atual"] = "triagem"
+            resultado = {"resposta": "Erro: agente desconhecido. Retornando para triagem..."}
+            yield {"tipo": "token", "conteudo": resultado["resposta"]}
+            return resultado, novo_estado
+
+        instancia, variaveis, atualizar = self._agentes[agente]
+        valores = variaveis(self._estado_para_dict(estado))
+
+        if streaming:
+            for evento in instancia.processar_stream(mensagem, historico, valores):
+                if evento["tipo"] == "fim":
+                    resultado = evento["resultado"]
+                else:
+                    yield evento
+        else:
+            resultado = instancia.processar(mensagem, historico, valores)
+
+        return resultado, atualizar(resultado, estado)
+
+    def _resumir_historico(self, resumo: str, mensagens: list) -> str:
+        """
+        Incorpora ao resumo as mensagens que saíram da janela do histórico.
+
+        Chamado só quando a janela anda (em lotes de HISTORY_SUMMARY_BATCH
+        turnos); recebe o resumo anterior, então cada chamada processa
+        apenas as mensagens novas. Usa self.llm_resumo, nunca o LLM dos agentes.
+        """
+        linhas = "\n".join(
+            f"{'Cliente' if papel == 'user' else 'Assistente'}: {texto}"
+            for papel, texto in mensagens
+        )
+        resposta = self.llm_resumo.invoke([
+            SystemMessage(content=RESUMO_HISTORICO_PROMPT),
+            HumanMessage(content=f"Resumo atual:\n{resumo or '(vazio)'}\n\nNovas mensagens:\n{linhas}")
+        ])
+        return resposta.content
+
+    def _destino_por_assunto(self, agente: str, mensagem: str) -> Optional[str]:
+        """
+        Agente que deve tratar a mensagem pelo assunto dela.
+
+        Returns:
+            Nome do agente de destino ou None para continuar no atual
+        """
+        classificacao = classificar(mensagem)
+        for topicos, destino in ROTAS_POR_ASSUNTO.get(agente, []):
+            if classificacao.tem(*topicos):
+                return destino
+        return None
+
+    def response_cache_stats(self) -> Dict:
+        """
+        Retorna as métricas do cache de respostas.
+
+        Returns:
+            Dict com consultas, acertos, taxa_acerto, ignoradas, guardadas e tamanho
+        """
+        return self.cache_respostas.estatisticas()
+
+    def _pode_usar_cache(self, agente: str, estado: Dict) -> bool:
+        """
+        Diz se a mensagem pode ser respondida (ou guardada) pelo cache.
+
+        Ficam de fora: a entrevista (cada resposta alimenta o score), os
+        turnos logo após uma troca de agente com flag de transição e
+        mensagens com números (CPF, datas, valores), aceite ou negação,
+        que podem levar a tools que alteram dados ou dependem do contexto.
+        """
+        if agente == "entrevista" or agente not in self._agentes:
+            return False
+
+        if estado.get("voltou_da_entrevista") or estado.get("vindo_de_credito"):
+            return False
+
+        mensagem = estado.get("ultima_mensagem", "")
+        if not normalizar_pergunta(mensagem):
+            return False
+
+        classificacao = classificar(mensagem)
+        return not (classificacao.tem_digitos or classificacao.tem(ACEITE, NEGACAO))
+
+    def _contexto_cache(self, estado: Dict) -> Tuple:
+        """
+        Parte da chave do cache que vem do estado: só os campos que mudam
+        a resposta para qualquer cliente. Os dados do cliente (nome, CPF,
+        limite, score) ficam de fora para que clientes diferentes
+        compartilhem respostas; respostas que os citam nem são guardadas
+        (veja _guardar_no_cache).
+        """
+        return (
+            bool(estado.get("autenticado")),
+            bool(estado.get("voltou_da_entrevista")),
+            bool(estado.get("vindo_de_credito"))
+        )
+
+    @staticmethod
+    def _valores_citados(texto: str) -> set:
+        """Valores numéricos do texto, lidos no formato brasileiro e no americano."""
+        valores = set()
+        for numero in _NUMERO.findall(texto):
+            numero = numero.rstrip(".,")
+            for leitura in (numero.replace(".", "").replace(",", "."), numero.replace(",", "")):
+                try:
+                    valores.add(float(leitura))
+                except ValueError:
+                    pass
+        return valores
+
+    def _consultar_cache(self, agente: str, estado: Dict) -> Optional[Tuple[str, str]]:
+        """
+        Busca a resposta do turno no cache de respostas.
+
+        Returns:
+            Tupla (resposta, tipo do acerto) ou None
+        """
+        if not self._pode_usar_cache(agente, estado):
+            self.cache_respostas.registrar_ignorada()
+            return None
+
+        return self.cache_respostas.obter(agente, estado["ultima_mensagem"], self._contexto_cache(estado))
+
+    def _guardar_no_cache(self, agente: str, estado: Dict, resultado: Dict, novo_estado: Dict) -> None:
+        """
+        Guarda a resposta se ela não depende do cliente.
+
+        Só entram turnos bem-sucedidos, sem tools (ou só com TOOLS_SEM_EFEITO),
+        sem troca de agente ou mudança no estado do cliente e cuja resposta
+        não cite o nome, o CPF, o limite ou o score do cliente.
+        """
+        if not resultado.get("sucesso") or not self._pode_usar_cache(agente, estado):
+            return
+
+        for step in resultado.get("steps", []):
+            if getattr(step[0], "tool", None) not in TOOLS_SEM_EFEITO:
+                return
+
+        campos = ("agente_atual", "autenticado", "limite", "score")
+        if any(novo_estado.get(campo) != estado.get(campo) for campo in campos):
+            return
+
+        resposta = resultado["resposta"]
+        resposta_normalizada = normalizar(resposta)
+        dados_cliente = [estado.get("cpf") or ""] + [
+            normalizar(parte) for parte in (estado.get("nome") or "").split() if len(parte) > 2
+        ]
+        if any(dado and dado in resposta_normalizada for dado in dados_cliente):
+            return
+
+        valores_cliente = {float(estado[campo]) for campo in ("limite", "score") if estado.get(campo) is not None}
+        if valores_cliente & self._valores_citados(resposta):
+            return
 
-        return resultado["resposta"], novo_estado
+        self.cache_respostas.guardar(agente, estado["ultima_mensagem"], self._contexto_cache(estado), resposta)
+
+    def fast_path_stats(self) -> Dict:
+        """
+        Retorna a fração de turnos atendidos pelo caminho rápido.
+
+        Returns:
+            Dict com turnos, rapidos, fracao_rapida e por_intencao
+        """
+        return self.estatisticas_rapidas.resumo()
+
+    def _caminho_rapido(self, estado: Dict) -> Optional[Tuple[str, Dict, Dict]]:
+        """
+        Atende pedidos simples sem o LLM, chamando a tool diretamente.
+
+        Só é usado com o cliente autenticado e fora da entrevista (onde as
+        mensagens são respostas às perguntas). Se a tool falhar, o turno
+        segue normalmente pelo agente.
+
+        Returns:
+            Tupla (intencao, resultado, novo_estado) ou None
+        """
+        if not estado.get("autenticado") or not estado.get("cpf"):
+            return None
+
+        if estado.get("agente_atual", "triagem") == "entrevista":
+            return None
+
+        classificacao = classificar(estado.get("ultima_mensagem", ""))
+        intencao = classificacao.intencao_rapida
+        novo_estado = estado.copy()
+
+        if intencao == CONSULTAR_LIMITE:
+            saida = get_credit_limit.invoke({"cpf": estado["cpf"]})
+            if not saida.get("success"):
+                return None
+
+            dados = saida["data"]
+            resposta = (
+                f"Seu limite de crédito atual é de {dados['limite_formatado']}. "
+                "Posso ajudar com mais alguma coisa?"
+            )
+            novo_estado["limite"] = dados["limite_atual"]
+            novo_estado["score"] = dados["score"]
+            novo_estado["agente_atual"] = "credito"
+
+        elif intencao == CONSULTAR_COTACAO:
+            moeda = classificacao.moedas[0]
+            saida = get_exchange_rate.invoke({"moeda": moeda})
+            if not saida.get("success"):
+                return None
+
+            dados = saida["data"]
+            resposta = f"A cotação atual {NOMES_MOEDAS.get(moeda, moeda)} é: {dados['descricao']}."
+            if dados.get("desatualizada"):
+                resposta += (
+                    " A API de câmbio está indisponível no momento; este é o último "
+                    f"valor conhecido, de {dados['data_hora']}."
+                )
+            else:
+                resposta += " As cotações são em tempo real e podem variar."
+            novo_estado["agente_atual"] = "cambio"
+
+        else:
+            return None
+
+        resultado = {"sucesso": True, "resposta": resposta, "steps": []}
+        return intencao, resultado, novo_estado
 
     def _estado_para_dict(self, estado: Dict) -> Dict:
         """Converte estado para formato esperado pelos prompts."""
@@ -209,7 +665,7 @@ class OrquestradorBancoAgil:
 
                 # Autenticação bem-sucedida
                 if isinstance(tool_output, dict) and tool_output.get("success"):
-                    data = tool_output.get("data", {})
+                    data = tool_output.get("data") or {}
                     if "cpf" in data:
                         novo_estado["autenticado"] = True
                         novo_estado["cpf"] = data.get("cpf")
@@ -217,18 +673,11 @@ class OrquestradorBancoAgil:
                         novo_estado["limite"] = data.get("limite_credito")
                         novo_estado["score"] = data.get("score_credito")
 
-        # Detectar próximo agente via palavras-chave (SE autenticado)
+        # Detectar próximo agente pelo assunto da mensagem (SE autenticado)
         if novo_estado.get("autenticado"):
-            mensagem_lower = estado.get("ultima_mensagem", "").lower()
-
-            # Palavras-chave de crédito
-            credito_kw = ["limite", "credito", "aumentar", "aumento", "emprestimo", "score", "pontos"]
-            cambio_kw = ["dolar", "euro", "cotacao", "cambio", "moeda", "taxa", "usd", "eur"]
-
-            if any(k in mensagem_lower for k in credito_kw):
-                novo_estado["agente_atual"] = "credito"
-            elif any(k in mensagem_lower for k in cambio_kw):
-                novo_estado["agente_atual"] = "cambio"
+            destino = self._destino_por_assunto("triagem", estado.get("ultima_mensagem", ""))
+            if destino:
+                novo_estado["agente_atual"] = destino
 
         return novo_estado
 
@@ -241,7 +690,7 @@ class OrquestradorBancoAgil:
         - Atualização de limite (via tool request_limit_increase)
         """
         novo_estado = estado.copy()
-        mensagem_lower = estado.get("ultima_mensagem", "").lower()
+        mensagem = estado.get("ultima_mensagem", "")
 
         # Limpar flag de retorno da entrevista após primeiro uso
         if novo_estado.get("voltou_da_entrevista"):
@@ -252,20 +701,19 @@ class OrquestradorBancoAgil:
             if len(step) >= 2:
                 tool_output = step[1]
                 if isinstance(tool_output, dict):
-                    data = tool_output.get("data", {})
+                    data = tool_output.get("data") or {}
                     if "novo_limite" in data:
                         novo_estado["limite"] = data["novo_limite"]
 
         # Detectar mudança de contexto
-        cambio_kw = ["dolar", "euro", "cotacao", "cambio", "moeda", "taxa", "usd", "eur", "conversao"]
-        if any(k in mensagem_lower for k in cambio_kw):
-            novo_estado["agente_atual"] = "cambio"
+        destino = self._destino_por_assunto("credito", mensagem)
+        if destino:
+            novo_estado["agente_atual"] = destino
 
         # Detectar aceitação de entrevista
-        entrevista_kw = ["entrevista", "atualizar score", "sim", "quero", "aceito"]
         resposta_lower = resultado.get("resposta", "").lower()
 
-        if "entrevista" in resposta_lower and any(k in mensagem_lower for k in ["sim", "quero", "aceito", "gostaria"]):
+        if "entrevista" in resposta_lower and classificar(mensagem).tem(ACEITE):
             novo_estado["agente_atual"] = "entrevista"
             novo_estado["vindo_de_credito"] = True  # Flag para evitar repetição
 
@@ -294,7 +742,7 @@ class OrquestradorBancoAgil:
                     # Entrevista concluída! Voltar para crédito
                     tool_output = step[1]
                     if isinstance(tool_output, dict):
-                        data = tool_output.get("data", {})
+                        data = tool_output.get("data") or {}
                         if "score_novo" in data:
                             novo_estado["score"] = data["score_novo"]
 
@@ -303,11 +751,9 @@ class OrquestradorBancoAgil:
                     break
 
         # Detectar mudança de contexto para câmbio
-        mensagem_lower = estado.get("ultima_mensagem", "").lower()
-        cambio_kw = ["dolar", "euro", "cotacao", "cambio", "moeda"]
-
-        if any(k in mensagem_lower for k in cambio_kw):
-            novo_estado["agente_atual"] = "cambio"
+        destino = self._destino_por_assunto("entrevista", estado.get("ultima_mensagem", ""))
+        if destino:
+            novo_estado["agente_atual"] = destino
 
         return novo_estado
 
@@ -319,13 +765,11 @@ class OrquestradorBancoAgil:
         - Mudança de contexto para crédito
         """
         novo_estado = estado.copy()
-        mensagem_lower = estado.get("ultima_mensagem", "").lower()
 
         # Detectar mudança de contexto para crédito
-        credito_kw = ["limite", "credito", "aumentar", "aumento", "emprestimo", "score"]
-
-        if any(k in mensagem_lower for k in credito_kw):
-            novo_estado["agente_atual"] = "credito"
+        destino = self._destino_por_assunto("cambio", estado.get("ultima_mensagem", ""))
+        if destino:
+            novo_estado["agente_atual"] = destino
 
         return novo_estado
 
@@ -345,6 +789,7 @@ def criar_estado_inicial() -> Dict[str, Any]:
         "limite": None,
         "score": None,
         "historico": [],
+        "resumo_historico": "",
         "ultima_mensagem": "",
         "tentativas_auth": 0
     }
@@ -0,0 +1,315 @@
+"""Serviço assíncrono de consulta de cotação de moedas (httpx)."""
+
+import asyncio
+import time
+import weakref
+from datetime import datetime
+from typing import Optional, Dict, Tuple
+
+import httpx
+
+from src.models.schemas import CotacaoMoeda
+from src.services.exchange_cache import FRESCA, OBSOLETA
+from src.services.exchange_service import (
+    get_exchange_cache,
+    get_circuit_breaker,
+    erro_circuito_aberto,
+    erro_de_conexao,
+    erro_timeout,
+    espera_nova_tentativa,
+    falha_da_api,
+    get_rate_matrix,
+    cotacao_de_reserva,
+    extrair_cotacoes,
+    registrar_cotacoes,
+    taxa_cruzada
+)
+from src.utils.exceptions import ExchangeAPIError
+from src.config.settings import settings
+
+
+# Um AsyncClient por event loop: o pool de conexões do httpx fica
+# associado ao loop em que foi criado
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Referências às atualizações em segundo plano (evita coleta pelo GC)
+_atualizacoes: set[asyncio.Task] = set()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Retorna o httpx.AsyncClient compartilhado do event loop atual.
+
+    Deve ser chamado de dentro de uma coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.exchange_pool_size,
+                max_keepalive_connections=settings.exchange_pool_size
+            )
+        )
+        _clients[loop] = client
+
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Fecha o AsyncClient do event loop atual, se existir."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class AsyncExchangeService:
+    """
+    Versão assíncrona do ExchangeService.
+
+    Compartilha o cache de cotações com o serviço síncrono, de modo que
+    uma cotação obtida por um é servida pelo outro.
+    """
+
+    def __init__(self, api_url: Optional[str] = None):
+        """
+        Inicializa o serviço de câmbio assíncrono.
+
+        Args:
+            api_url: URL base da API. Se None, usa settings.exchange_api_url
+        """
+        self.api_base = api_url or settings.exchange_api_url
+        self.timeout = settings.exchange_timeout  # Timeout em segundos
+        self.cache = get_exchange_cache()
+        self.disjuntor = get_circuit_breaker(self.api_base)
+
+    async def _requisitar(self, pares: list[str], moeda: Optional[str] = None) -> dict:
+        """
+        Faz a requisição HTTP (via circuit breaker) e retorna o JSON.
+
+        Novas tentativas como em ExchangeService._requisitar: só erros de
+        conexão e 429/5xx, cada uma contando no circuit breaker, todas
+        dentro do prazo de exchange_timeout segundos.
+        """
+        prazo = time.monotonic() + self.timeout
+        tentativa = 0
+
+        while True:
+            # Prazo esgotado (ex.: pelo backoff): não chama a API
+            restante = prazo - time.monotonic()
+            if restante <= 0:
+                raise erro_timeout(moeda)
+
+            if not self.disjuntor.permitir():
+                raise erro_circuito_aberto(moeda)
+
+            try:
+                data = await self._requisitar_http(pares, moeda, timeout=restante)
+            except ExchangeAPIError as e:
+                if not falha_da_api(e):
+                    self.disjuntor.registrar_sucesso()
+                    raise
+
+                self.disjuntor.registrar_falha()
+                espera = espera_nova_tentativa(e, tentativa, prazo)
+                if espera is None:
+                    raise
+                tentativa += 1
+                await asyncio.sleep(espera)
+                continue
+
+            self.disjuntor.registrar_sucesso()
+            return data
+
+    async def _requisitar_http(
+        self,
+        pares: list[str],
+        moeda: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> dict:
+        """Requisição HTTP em si, com os erros convertidos em ExchangeAPIError."""
+        url = f"{self.api_base}/{','.join(pares)}"
+
+        try:
+            response = await get_async_client().get(url, timeout=self.timeout if timeout is None else timeout)
+            response.raise_for_status()
+            return response.json()
+
+        except (httpx.ConnectTimeout, httpx.ConnectError):
+            raise erro_de_conexao(
+                "Erro de conexao ao consultar API de cambio",
+                moeda=moeda
+            )
+
+        except httpx.TimeoutException:
+            raise erro_timeout(moeda)
+
+        except httpx.TransportError:
+            raise ExchangeAPIError(
+                "Erro de conexao ao consultar API de cambio",
+                moeda=moeda
+            )
+
+        except httpx.HTTPStatusError as e:
+            raise ExchangeAPIError(
+                f"Erro HTTP ao consultar API: {e.response.status_code}",
+                moeda=moeda,
+                status_code=e.response.status_code
+            )
+
+        except Exception as e:
+            raise ExchangeAPIError(
+                f"Erro inesperado ao consultar cotacao: {str(e)}",
+                moeda=moeda
+            )
+
+    async def _buscar_pares(self, moedas: list[str], base: str = "BRL") -> Dict[str, CotacaoMoeda]:
+        """
+        Busca cotações na API (uma única requisição) e atualiza o cache.
+
+        O registro roda em uma thread: ele pode regravar o snapshot em
+        disco, o que não deve bloquear o event loop.
+        """
+        pares = [f"{moeda}-{base}" for moeda in moedas]
+        data = await self._requisitar(pares, moeda=moedas[0] if len(moedas) == 1 else None)
+        return await asyncio.to_thread(registrar_cotacoes, extrair_cotacoes(data, moedas, base), base)
+
+    def _atualizar_em_segundo_plano(self, moeda: str, base: str) -> None:
+        """Agenda a atualização de um par obsoleto no event loop atual."""
+        chave = f"{moeda}-{base}"
+
+        if not self.cache.iniciar_atualizacao(chave):
+            return
+
+        async def atualizar():
+            try:
+                await self._buscar_pares([moeda], base)
+            except Exception:
+                pass  # Mantém a entrada obsoleta até a próxima tentativa
+            finally:
+                self.cache.finalizar_atualizacao(chave)
+
+        task = asyncio.get_running_loop().create_task(atualizar())
+        _atualizacoes.add(task)
+        task.add_done_callback(_atualizacoes.discard)
+
+    async def get_rate(self, moeda: str = "USD", base: str = "BRL") -> CotacaoMoeda:
+        """
+        Obtém a cotação de uma moeda em relação ao Real (BRL).
+
+        Mesma semântica de ExchangeService.get_rate, sem bloquear o loop
+        (inclusive a última cotação conhecida quando a API está fora).
+
+        Raises:
+            ExchangeAPIError: Se houver erro na consulta
+
+        Example:
+            >>> cotacao = await AsyncExchangeService().get_rate("USD")
+        """
+        if self.cache.ttl > 0:
+            cotacao, estado = self.cache.get(f"{moeda}-{base}")
+
+            if estado == OBSOLETA:
+                self._atualizar_em_segundo_plano(moeda, base)
+
+            if cotacao is not None:
+                return cotacao
+
+        try:
+            cotacoes = await self._buscar_pares([moeda], base)
+
+            if moeda not in cotacoes:
+                raise ExchangeAPIError(
+                    f"Moeda {moeda} nao encontrada na API",
+                    moeda=moeda,
+                    status_code=404
+                )
+
+            return cotacoes[moeda]
+
+        except ExchangeAPIError as e:
+            reserva = cotacao_de_reserva(moeda, base, e)
+            if reserva is None:
+                raise
+            return reserva
+
+    async def get_multiple_rates(self, moedas: list[str], base: str = "BRL") -> Dict[str, CotacaoMoeda]:
+        """
+        Obtém cotações de múltiplas moedas em uma única requisição.
+
+        Moedas com cotação fresca no cache não são consultadas novamente.
+
+        Example:
+            >>> cotacoes = await AsyncExchangeService().get_multiple_rates(["USD", "EUR"])
+        """
+        resultado = {}
+        faltando = []
+
+        for moeda in moedas:
+            cotacao, estado = self.cache.get(f"{moeda}-{base}") if self.cache.ttl > 0 else (None, None)
+            if estado == FRESCA:
+                resultado[moeda] = cotacao
+            else:
+                faltando.append(moeda)
+
+        if not faltando:
+            return resultado
+
+        try:
+            resultado.update(await self._buscar_pares(faltando, base))
+            return resultado
+
+        except ExchangeAPIError as e:
+            reservas = {moeda: cotacao_de_reserva(moeda, base, e) for moeda in faltando}
+            if all(reservas.values()):
+                resultado.update(reservas)
+                return resultado
+
+            raise ExchangeAPIError(
+                f"Erro ao consultar multiplas cotacoes: {str(e)}"
+            )
+
+        except Exception as e:
+            raise ExchangeAPIError(
+                f"Erro ao consultar multiplas cotacoes: {str(e)}"
+            )
+
+    async def convert(
+        self,
+        valor: float,
+        origem: str,
+        destino: str = "BRL",
+        base: str = "BRL"
+    ) -> Tuple[float, float, Optional[datetime]]:
+        """
+        Converte um valor entre quaisquer duas moedas.
+
+        Mesma semântica de ExchangeService.convert: usa a matriz de taxas
+        cruzadas quando disponível e, senão, as cotações de cada moeda,
+        buscadas em paralelo.
+
+        Returns:
+            Tupla (valor_convertido, taxa, desatualizada_desde)
+        """
+        if origem == destino:
+            return valor, 1.0, None
+
+        matriz = get_rate_matrix(self.api_base)
+        if matriz is not None and origem in matriz and destino in matriz:
+            taxa = matriz.taxa(origem, destino)
+            return valor * taxa, taxa, matriz.desatualizada_desde(settings.exchange_cache_ttl)
+
+        cotacoes = await asyncio.gather(
+            *(self.get_rate(moeda, base) for moeda in (origem, destino) if moeda != base)
+        )
+        taxas = {base: 1.0, **{cotacao.moeda: cotacao.taxa for cotacao in cotacoes}}
+        desatualizada_desde = min(
+            (c.desatualizada_desde for c in cotacoes if c.desatualizada_desde),
+            default=None
+        )
+
+        taxa = taxa_cruzada(taxas, origem, destino)
+        return valor * taxa, taxa, desatualizada_desde
@@ -1,16 +1,113 @@
 """Serviço de acesso a dados (CSV)."""
 
+import csv
+import threading
 import pandas as pd
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple, Any, Iterable, List, Mapping
 from datetime import datetime
 
 from src.models.schemas import Cliente, SolicitacaoAumento, ScoreLimite
 from src.utils.exceptions import DataAccessError, AuthenticationError
 from src.utils.validators import validar_cpf, validar_data_nascimento
+from src.utils.file_io import append_csv_row, atomic_write_text, file_lock
 from src.config.settings import settings
 
 
+SOLICITACOES_COLUNAS = [
+    "cpf_cliente",
+    "data_hora_solicitacao",
+    "limite_atual",
+    "novo_limite_solicitado",
+    "status_pedido"
+]
+
+
+class _TabelaClientes:
+    """
+    Tabela de clientes residente em memória, indexada por CPF.
+
+    Guarda a assinatura (mtime, tamanho) do arquivo de origem para
+    saber quando precisa ser recarregada.
+    """
+
+    def __init__(self):
+        self.assinatura: Optional[Tuple[int, int]] = None
+        self.por_cpf: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    def carregar(self, df: pd.DataFrame, assinatura: Tuple[int, int]) -> None:
+        """Reconstrói o índice a partir do DataFrame de clientes."""
+        por_cpf: Dict[str, Dict[str, Any]] = {}
+        for row in df.to_dict(orient="records"):
+            # Mantém a primeira ocorrência, como a busca por máscara fazia
+            por_cpf.setdefault(row["cpf"], row)
+        self.por_cpf = por_cpf
+        self.assinatura = assinatura
+
+
+SCORE_MAXIMO = 1000
+
+
+def compilar_faixas_score(faixas: Iterable[Tuple[int, int, float]]) -> List[float]:
+    """
+    Compila faixas de score em uma tabela indexada pelo próprio score.
+
+    Args:
+        faixas: Tuplas (score_minimo, score_maximo, limite_maximo)
+
+    Returns:
+        Lista com SCORE_MAXIMO + 1 posições; tabela[score] é o limite máximo
+
+    Raises:
+        ValueError: Se houver faixa inválida, sobreposição ou score sem faixa
+    """
+    tabela: List[Optional[float]] = [None] * (SCORE_MAXIMO + 1)
+
+    for minimo, maximo, limite in faixas:
+        if not 0 <= minimo <= maximo <= SCORE_MAXIMO:
+            raise ValueError(f"Faixa invalida: {minimo}-{maximo}")
+
+        for score in range(minimo, maximo + 1):
+            if tabela[score] is not None:
+                raise ValueError(f"Faixas sobrepostas no score {score}")
+            tabela[score] = float(limite)
+
+    lacunas = [score for score, limite in enumerate(tabela) if limite is None]
+    if lacunas:
+        raise ValueError(f"Nenhuma faixa definida para o score {lacunas[0]}")
+
+    return tabela
+
+
+def buscar_limite_compilado(tabela: List[float], score: int) -> Optional[float]:
+    """Retorna o limite de um score na tabela compilada (None se fora da faixa)."""
+    if score != int(score) or not 0 <= score <= SCORE_MAXIMO:
+        return None
+    return tabela[int(score)]
+
+
+class _TabelaScoreLimite:
+    """Faixas de score compiladas, com a assinatura do arquivo de origem."""
+
+    def __init__(self):
+        self.assinatura: Optional[Tuple[int, int]] = None
+        self.limites: List[float] = []
+        self.lock = threading.Lock()
+
+
+# Tabelas compartilhadas pelo processo, uma por arquivo de origem
+_tabelas_clientes: Dict[str, _TabelaClientes] = {}
+_tabelas_score: Dict[str, _TabelaScoreLimite] = {}
+_tabelas_lock = threading.Lock()
+
+
+def _assinatura_arquivo(filepath: Path) -> Tuple[int, int]:
+    """Retorna (mtime em ns, tamanho) do arquivo."""
+    stat = filepath.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
 class DataService:
     """Serviço para manipulação de dados em CSV."""
 
@@ -43,15 +140,94 @@ class DataService:
             )
 
     def _salvar_clientes(self, df: pd.DataFrame) -> None:
-        """Salva o DataFrame de clientes."""
+        """
+        Salva o DataFrame de clientes (escrita atômica).
+
+        Deve ser chamado com file_lock(self.clientes_file) ativo.
+        """
         try:
-            df.to_csv(self.clientes_file, index=False)
+            atomic_write_text(self.clientes_file, df.to_csv(index=False))
         except Exception as e:
             raise DataAccessError(
                 f"Erro ao salvar arquivo de clientes: {str(e)}",
                 filepath=str(self.clientes_file)
             )
 
+        # Atualizar o índice com o que acabou de ser gravado, sem depender
+        # da resolução do mtime do sistema de arquivos
+        tabela = self._tabela_clientes()
+        with tabela.lock:
+            tabela.carregar(df, _assinatura_arquivo(self.clientes_file))
+
+    def _tabela_clientes(self) -> _TabelaClientes:
+        """Retorna a tabela residente associada ao arquivo de clientes."""
+        chave = str(self.clientes_file.resolve())
+        with _tabelas_lock:
+            tabela = _tabelas_clientes.get(chave)
+            if tabela is None:
+                tabela = _TabelaClientes()
+                _tabelas_clientes[chave] = tabela
+            return tabela
+
+    def _limites_por_score(self) -> List[float]:
+        """
+        Retorna a tabela score -> limite máximo compilada de score_limite.csv.
+
+        O arquivo é lido e validado apenas quando seu mtime ou tamanho mudam.
+        """
+        try:
+            assinatura = _assinatura_arquivo(self.score_limite_file)
+        except FileNotFoundError:
+            raise DataAccessError(
+                "Arquivo score_limite.csv nao encontrado",
+                filepath=str(self.score_limite_file)
+            )
+
+        chave = str(self.score_limite_file.resolve())
+        with _tabelas_lock:
+            tabela = _tabelas_score.setdefault(chave, _TabelaScoreLimite())
+
+        with tabela.lock:
+            if tabela.assinatura != assinatura:
+                try:
+                    with open(self.score_limite_file, newline="", encoding="utf-8") as f:
+                        tabela.limites = compilar_faixas_score(
+                            (
+                                int(float(row["score_minimo"])),
+                                int(float(row["score_maximo"])),
+                                float(row["limite_maximo"])
+                            )
+                            for row in csv.DictReader(f)
+                        )
+                except Exception as e:
+                    raise DataAccessError(
+                        f"Erro ao carregar score_limite: {str(e)}",
+                        filepath=str(self.score_limite_file)
+                    )
+                tabela.assinatura = assinatura
+            return tabela.limites
+
+    def _indice_clientes(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna o índice CPF -> linha do cliente.
+
+        O arquivo é lido apenas na primeira chamada do processo e quando
+        seu mtime ou tamanho mudam.
+        """
+        try:
+            assinatura = _assinatura_arquivo(self.clientes_file)
+        except FileNotFoundError:
+            raise DataAccessError(
+                f"Arquivo de clientes nao encontrado",
+                filepath=str(self.clientes_file)
+            )
+
+        tabela = self._tabela_clientes()
+        with tabela.lock:
+            if tabela.assinatura != assinatura:
+                tabela.carregar(self._carregar_clientes(), assinatura)
+            return tabela.por_cpf
+
     def authenticate_client(self, cpf: str, data_nascimento: str) -> Optional[Cliente]:
         """
         Autentica um cliente usando CPF e data de nascimento.
@@ -74,19 +250,13 @@ class DataService:
         if not validar_data_nascimento(data_nascimento):
             raise AuthenticationError("Data de nascimento invalida")
 
-        # Buscar no CSV
-        df = self._carregar_clientes()
+        # Buscar no índice em memória
+        row_dict = self._indice_clientes().get(cpf)
 
-        cliente_row = df[
-            (df["cpf"] == cpf) &
-            (df["data_nascimento"] == data_nascimento)
-        ]
-
-        if cliente_row.empty:
+        if row_dict is None or row_dict["data_nascimento"] != data_nascimento:
             return None
 
         # Converter para modelo Pydantic
-        row_dict = cliente_row.iloc[0].to_dict()
         return Cliente(**row_dict)
 
     def get_client_by_cpf(self, cpf: str) -> Optional[Cliente]:
@@ -102,13 +272,11 @@ class DataService:
         if not validar_cpf(cpf):
             return None
 
-        df = self._carregar_clientes()
-        cliente_row = df[df["cpf"] == cpf]
+        row_dict = self._indice_clientes().get(cpf)
 
-        if cliente_row.empty:
+        if row_dict is None:
             return None
 
-        row_dict = cliente_row.iloc[0].to_dict()
         return Cliente(**row_dict)
 
     def update_client_score(self, cpf: str, novo_score: int) -> bool:
@@ -125,21 +293,22 @@ class DataService:
         Raises:
             DataAccessError: Se houver erro ao acessar/salvar dados
         """
-        df = self._carregar_clientes()
+        with file_lock(self.clientes_file):
+            df = self._carregar_clientes()
 
-        # Verificar se cliente existe
-        if cpf not in df["cpf"].values:
-            raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+            # Verificar se cliente existe
+            if cpf not in df["cpf"].values:
+                raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
 
-        # Validar score
-        if not 0 <= novo_score <= 1000:
-            raise ValueError("Score deve estar entre 0 e 1000")
+            # Validar score
+            if not 0 <= novo_score <= 1000:
+                raise ValueError("Score deve estar entre 0 e 1000")
 
-        # Atualizar
-        df.loc[df["cpf"] == cpf, "score_credito"] = novo_score
+            # Atualizar
+            df.loc[df["cpf"] == cpf, "score_credito"] = novo_score
 
-        # Salvar
-        self._salvar_clientes(df)
+            # Salvar
+            self._salvar_clientes(df)
 
         return True
 
@@ -154,19 +323,67 @@ class DataService:
         Returns:
             True se atualizado com sucesso
         """
-        df = self._carregar_clientes()
+        with file_lock(self.clientes_file):
+            df = self._carregar_clientes()
 
-        if cpf not in df["cpf"].values:
-            raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+            if cpf not in df["cpf"].values:
+                raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
 
-        if novo_limite < 0:
-            raise ValueError("Limite deve ser maior ou igual a zero")
+            if novo_limite < 0:
+                raise ValueError("Limite deve ser maior ou igual a zero")
 
-        df.loc[df["cpf"] == cpf, "limite_credito"] = novo_limite
-        self._salvar_clientes(df)
+            df.loc[df["cpf"] == cpf, "limite_credito"] = novo_limite
+            self._salvar_clientes(df)
 
         return True
 
+    def existing_cpfs(self, cpfs: Iterable[str]) -> set[str]:
+        """
+        Filtra os CPFs que existem na base de clientes.
+
+        Args:
+            cpfs: CPFs a verificar
+
+        Returns:
+            Conjunto com os CPFs encontrados
+        """
+        indice = self._indice_clientes()
+        return {cpf for cpf in cpfs if cpf in indice}
+
+    def update_client_scores_bulk(self, scores: Mapping[str, int]) -> int:
+        """
+        Atualiza o score de vários clientes em uma única escrita.
+
+        CPFs que não existem na base são ignorados.
+
+        Args:
+            scores: Mapeamento CPF -> novo score (0-1000)
+
+        Returns:
+            Número de clientes atualizados
+
+        Raises:
+            ValueError: Se algum score estiver fora da faixa 0-1000
+            DataAccessError: Se houver erro ao acessar/salvar dados
+        """
+        if any(not 0 <= score <= 1000 for score in scores.values()):
+            raise ValueError("Score deve estar entre 0 e 1000")
+
+        if not scores:
+            return 0
+
+        with file_lock(self.clientes_file):
+            df = self._carregar_clientes()
+
+            novos = df["cpf"].map(scores)
+            atualizar = novos.notna()
+
+            if atualizar.any():
+                df.loc[atualizar, "score_credito"] = novos[atualizar].astype(int)
+                self._salvar_clientes(df)
+
+        return int(atualizar.sum())
+
     def create_limit_request(self, solicitacao: SolicitacaoAumento) -> bool:
         """
         Cria uma solicitação de aumento de limite.
@@ -178,32 +395,9 @@ class DataService:
             True se criada com sucesso
         """
         try:
-            # Carregar solicitações existentes
-            try:
-                df = pd.read_csv(self.solicitacoes_file, dtype={"cpf_cliente": str})
-            except FileNotFoundError:
-                # Se arquivo não existe, criar um vazio
-                df = pd.DataFrame(columns=[
-                    "cpf_cliente",
-                    "data_hora_solicitacao",
-                    "limite_atual",
-                    "novo_limite_solicitado",
-                    "status_pedido"
-                ])
-
-            # Adicionar nova solicitação
-            nova_linha = {
-                "cpf_cliente": solicitacao.cpf_cliente,
-                "data_hora_solicitacao": solicitacao.data_hora_solicitacao.isoformat(),
-                "limite_atual": solicitacao.limite_atual,
-                "novo_limite_solicitado": solicitacao.novo_limite_solicitado,
-                "status_pedido": solicitacao.status_pedido
-            }
-
-            df = pd.concat([df, pd.DataFrame([nova_linha])], ignore_index=True)
-
-            # Salvar
-            df.to_csv(self.solicitacoes_file, index=False)
+            # Anexar uma linha ao final, sem reler o histórico
+            with file_lock(self.solicitacoes_file):
+                self._anexar_solicitacao(solicitacao)
 
             return True
 
@@ -213,6 +407,74 @@ class DataService:
                 filepath=str(self.solicitacoes_file)
             )
 
+    def _anexar_solicitacao(self, solicitacao: SolicitacaoAumento) -> None:
+        """
+        Anexa a solicitação ao CSV.
+
+        Deve ser chamado com file_lock(self.solicitacoes_file) ativo.
+        """
+        append_csv_row(
+            self.solicitacoes_file,
+            SOLICITACOES_COLUNAS,
+            [
+                solicitacao.cpf_cliente,
+                solicitacao.data_hora_solicitacao.isoformat(),
+                solicitacao.limite_atual,
+                solicitacao.novo_limite_solicitado,
+                solicitacao.status_pedido
+            ],
+            fsync=settings.csv_append_fsync
+        )
+
+    def process_limit_request(self, solicitacao: SolicitacaoAumento) -> bool:
+        """
+        Registra uma solicitação e, se aprovada, aplica o novo limite.
+
+        Os dois arquivos ficam travados durante toda a operação, com uma
+        leitura e uma escrita de clientes e um append de solicitações. O
+        limite é gravado antes do registro, então nunca existe uma
+        solicitação aprovada registrada sem o limite correspondente; se o
+        registro falhar, o limite anterior é restaurado, então também
+        não fica limite alterado sem solicitação.
+
+        Args:
+            solicitacao: Dados da solicitação (status já decidido)
+
+        Returns:
+            True se processada com sucesso
+
+        Raises:
+            DataAccessError: Se o cliente não existir ou houver erro de I/O
+        """
+        aprovada = solicitacao.status_pedido == "aprovado"
+        cpf = solicitacao.cpf_cliente
+
+        with file_lock(self.clientes_file), file_lock(self.solicitacoes_file):
+            if aprovada:
+                df = self._carregar_clientes()
+
+                if cpf not in df["cpf"].values:
+                    raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+
+                linha = df["cpf"] == cpf
+                limite_anterior = df.loc[linha, "limite_credito"].copy()
+                df.loc[linha, "limite_credito"] = solicitacao.novo_limite_solicitado
+                self._salvar_clientes(df)
+
+            try:
+                self._anexar_solicitacao(solicitacao)
+            except Exception as e:
+                if aprovada:
+                    # Desfaz o limite: a operação vale inteira ou não vale
+                    df.loc[linha, "limite_credito"] = limite_anterior
+                    self._salvar_clientes(df)
+                raise DataAccessError(
+                    f"Erro ao criar solicitacao: {str(e)}",
+                    filepath=str(self.solicitacoes_file)
+                )
+
+        return True
+
     def get_max_limit_for_score(self, score: int) -> float:
         """
         Retorna o limite máximo permitido para um score.
@@ -226,31 +488,16 @@ class DataService:
         Raises:
             DataAccessError: Se houver erro ao acessar dados
         """
-        try:
-            df = pd.read_csv(self.score_limite_file)
-
-            # Encontrar a faixa correspondente
-            faixa = df[
-                (df["score_minimo"] <= score) &
-                (df["score_maximo"] >= score)
-            ]
-
-            if faixa.empty:
-                raise ValueError(f"Nenhuma faixa encontrada para score {score}")
-
-            return float(faixa.iloc[0]["limite_maximo"])
+        limite = buscar_limite_compilado(self._limites_por_score(), score)
 
-        except FileNotFoundError:
-            raise DataAccessError(
-                "Arquivo score_limite.csv nao encontrado",
-                filepath=str(self.score_limite_file)
-            )
-        except Exception as e:
+        if limite is None:
             raise DataAccessError(
-                f"Erro ao consultar score_limite: {str(e)}",
+                f"Erro ao consultar score_limite: Nenhuma faixa encontrada para score {score}",
                 filepath=str(self.score_limite_file)
             )
 
+        return limite
+
     def get_all_score_limits(self) -> list[ScoreLimite]:
         """
         Retorna todas as faixas de score e limite.
@@ -266,3 +513,60 @@ class DataService:
                 f"Erro ao carregar faixas de score: {str(e)}",
                 filepath=str(self.score_limite_file)
             )
+
+
+# ==============================================================================
+# INSTÂNCIA COMPARTILHADA
+# ==============================================================================
+
+_data_service: Optional[DataService] = None
+_data_service_lock = threading.Lock()
+
+
+def _criar_data_service() -> DataService:
+    """Cria o DataService do backend configurado em settings.storage_backend."""
+    if settings.storage_backend == "sqlite":
+        from src.services.sqlite_data_service import SQLiteDataService
+        return SQLiteDataService()
+
+    return DataService()
+
+
+def get_data_service() -> DataService:
+    """
+    Retorna a instância de DataService compartilhada pelo processo.
+
+    As tools devem resolver o serviço por aqui, para que caches e índices
+    sobrevivam entre chamadas e sessões. O backend (CSV ou SQLite) é
+    escolhido por settings.storage_backend.
+
+    Returns:
+        DataService compartilhado (criado na primeira chamada)
+    """
+    global _data_service
+
+    if _data_service is None:
+        with _data_service_lock:
+            if _data_service is None:
+                _data_service = _criar_data_service()
+
+    return _data_service
+
+
+def reset_data_service(data_service: Optional[DataService] = None) -> None:
+    """
+    Descarta a instância compartilhada e as tabelas em memória (uso em testes).
+
+    Args:
+        data_service: Instância a ser usada daqui em diante.
+                      Se None, uma nova será criada na próxima chamada
+                      de get_data_service().
+    """
+    global _data_service
+
+    with _data_service_lock:
+        _data_service = data_service
+
+    with _tabelas_lock:
+        _tabelas_clientes.clear()
+        _tabelas_score.clear()
@@ -0,0 +1,135 @@
+"""Cache em memória de cotações de moedas."""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from src.models.schemas import CotacaoMoeda
+
+
+# Estados de uma entrada do cache
+FRESCA = "fresca"
+OBSOLETA = "obsoleta"
+
+
+class CotacaoCache:
+    """
+    Cache por par de moedas com TTL e janela de stale-while-revalidate.
+
+    - Idade <= ttl: entrada fresca, servida direto.
+    - ttl < idade <= stale_ttl: entrada obsoleta, servida enquanto uma
+      atualização em segundo plano é feita.
+    - Idade > stale_ttl: tratada como ausente.
+
+    A cotação é guardada como foi obtida, mantendo o data_hora original.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float):
+        """
+        Args:
+            ttl: Segundos em que a cotação é considerada fresca
+            stale_ttl: Segundos máximos em que a cotação ainda pode ser
+                       servida enquanto é atualizada (>= ttl)
+        """
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+
+        self._entradas: Dict[str, Tuple[CotacaoMoeda, float]] = {}
+        self._atualizando: set[str] = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def get(self, chave: str) -> Tuple[Optional[CotacaoMoeda], Optional[str]]:
+        """
+        Busca uma cotação no cache.
+
+        Args:
+            chave: Par de moedas (ex: "USD-BRL")
+
+        Returns:
+            Tupla (cotacao, estado), com estado FRESCA ou OBSOLETA,
+            ou (None, None) se não houver entrada utilizável
+        """
+        with self._lock:
+            entrada = self._entradas.get(chave)
+
+            if entrada is not None:
+                cotacao, armazenada_em = entrada
+                idade = time.monotonic() - armazenada_em
+
+                if idade <= self.ttl:
+                    self.hits += 1
+                    return cotacao, FRESCA
+
+                if idade <= self.stale_ttl:
+                    self.stale_hits += 1
+                    return cotacao, OBSOLETA
+
+            self.misses += 1
+            return None, None
+
+    def set(self, chave: str, cotacao: CotacaoMoeda, idade: float = 0.0) -> None:
+        """
+        Armazena uma cotação.
+
+        Args:
+            chave: Par de moedas (ex: "USD-BRL")
+            cotacao: Cotação obtida
+            idade: Idade inicial da entrada em segundos (0 = acabou de ser obtida)
+        """
+        with self._lock:
+            self._entradas[chave] = (cotacao, time.monotonic() - idade)
+
+    def iniciar_atualizacao(self, chave: str) -> bool:
+        """
+        Marca o início de uma atualização em segundo plano.
+
+        Returns:
+            False se já houver uma atualização em andamento para a chave
+        """
+        with self._lock:
+            if chave in self._atualizando:
+                return False
+            self._atualizando.add(chave)
+            self.refreshes += 1
+            return True
+
+    def finalizar_atualizacao(self, chave: str) -> None:
+        """Marca o fim de uma atualização em segundo plano."""
+        with self._lock:
+            self._atualizando.discard(chave)
+
+    def limpar(self) -> None:
+        """Remove todas as entradas e zera os contadores."""
+        with self._lock:
+            self._entradas.clear()
+            self._atualizando.clear()
+            self.hits = self.stale_hits = self.misses = self.refreshes = 0
+
+    def estatisticas(self) -> Dict:
+        """
+        Retorna contadores e idade de cada entrada.
+
+        Returns:
+            Dict com hits, stale_hits, misses, refreshes, hit_rate e
+            idade_segundos por par
+        """
+        with self._lock:
+            agora = time.monotonic()
+            total = self.hits + self.stale_hits + self.misses
+
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "hit_rate": (self.hits + self.stale_hits) / total if total else 0.0,
+                "idade_segundos": {
+                    chave: round(agora - armazenada_em, 3)
+                    for chave, (_, armazenada_em) in self._entradas.items()
+                }
+            }
@@ -0,0 +1,165 @@
+"""Agrupamento (single-flight) de consultas simultâneas de cotação."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Tuple
+
+from src.models.schemas import CotacaoMoeda
+from src.utils.exceptions import ExchangeAPIError
+
+
+# Função que busca vários pares em uma requisição: (moedas, base) -> cotações
+BuscarPares = Callable[[list[str], str], Dict[str, CotacaoMoeda]]
+
+
+class AgrupadorCotacoes:
+    """
+    Deduplica e agrupa consultas simultâneas à API de câmbio.
+
+    - Chamadores simultâneos do mesmo par aguardam a mesma requisição
+      em andamento e recebem o mesmo resultado.
+    - Pares diferentes pedidos dentro de `janela` segundos são enviados
+      juntos em uma única URL multi-par (USD-BRL,EUR-BRL,...).
+
+    O primeiro chamador de um lote (líder) faz a requisição e distribui
+    os resultados; os demais só aguardam. O líder só espera a janela se
+    já havia outras consultas em andamento quando o lote foi aberto: uma
+    consulta isolada vai direto à API, sem pagar a espera.
+    Lotes são separados por (api_base, base), pois cada um gera uma URL.
+    """
+
+    def __init__(self, janela: float):
+        """
+        Args:
+            janela: Segundos que o líder espera por outros pares antes de
+                    consultar a API (0 = apenas deduplica o mesmo par)
+        """
+        self.janela = janela
+
+        self._em_andamento: Dict[Tuple[str, str, str], Future] = {}
+        self._lotes: Dict[Tuple[str, str], Dict[str, Future]] = {}
+        self._lock = threading.Lock()
+
+        self.consultas = 0
+        self.compartilhadas = 0
+        self.requisicoes = 0
+
+    def obter(self, api_base: str, moeda: str, base: str, buscar: BuscarPares) -> CotacaoMoeda:
+        """
+        Obtém a cotação de um par, compartilhando a requisição com outros chamadores.
+
+        Args:
+            api_base: URL base da API (faz parte da chave do lote)
+            moeda: Código da moeda
+            base: Moeda base
+            buscar: Função que consulta a API para uma lista de moedas
+
+        Returns:
+            CotacaoMoeda do par
+
+        Raises:
+            ExchangeAPIError: Se a consulta falhar ou a moeda não existir na API
+        """
+        chave_lote = (api_base, base)
+        chave = (api_base, moeda, base)
+        lider = False
+        esperar = False
+
+        with self._lock:
+            self.consultas += 1
+            futuro = self._em_andamento.get(chave)
+
+            if futuro is not None:
+                self.compartilhadas += 1
+            else:
+                futuro = Future()
+                self._em_andamento[chave] = futuro
+
+                lote = self._lotes.get(chave_lote)
+                if lote is None:
+                    lote = self._lotes[chave_lote] = {}
+                    lider = True
+                    # Há concorrência: vale esperar outros pares para o lote
+                    esperar = len(self._em_andamento) > 1
+                lote[moeda] = futuro
+
+        if lider:
+            self._executar_lote(chave_lote, buscar, esperar)
+
+        return futuro.result()
+
+    def _executar_lote(self, chave_lote: Tuple[str, str], buscar: BuscarPares, esperar: bool) -> None:
+        """Fecha o lote (após a janela, se esperar), consulta a API e resolve os futuros."""
+        if esperar and self.janela > 0:
+            time.sleep(self.janela)
+
+        api_base, base = chave_lote
+
+        with self._lock:
+            lote = self._lotes.pop(chave_lote)
+
+        try:
+            for moeda, resultado in self._buscar_lote(list(lote), base, buscar).items():
+                if isinstance(resultado, Exception):
+                    lote[moeda].set_exception(resultado)
+                else:
+                    lote[moeda].set_result(resultado)
+        except BaseException as e:
+            for futuro in lote.values():
+                if not futuro.done():
+                    futuro.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                for moeda in lote:
+                    self._em_andamento.pop((api_base, moeda, base), None)
+
+    def _buscar_lote(self, moedas: list[str], base: str, buscar: BuscarPares) -> Dict[str, object]:
+        """
+        Consulta um lote e retorna, por moeda, a cotação ou a exceção.
+
+        Se a URL multi-par for rejeitada com 404 (a AwesomeAPI recusa o lote
+        inteiro quando um dos pares não existe), cada par é consultado
+        separadamente para não propagar o erro de uma moeda às outras.
+        """
+        with self._lock:
+            self.requisicoes += 1
+
+        try:
+            cotacoes = buscar(moedas, base)
+
+        except ExchangeAPIError as e:
+            if len(moedas) == 1 or e.details.get("status_code") != 404:
+                return {moeda: e for moeda in moedas}
+
+            resultado = {}
+            for moeda in moedas:
+                resultado.update(self._buscar_lote([moeda], base, buscar))
+            return resultado
+
+        return {
+            moeda: cotacoes.get(moeda) or ExchangeAPIError(
+                f"Moeda {moeda} nao encontrada na API",
+                moeda=moeda,
+                status_code=404
+            )
+            for moeda in moedas
+        }
+
+    def estatisticas(self) -> Dict:
+        """
+        Retorna contadores de consultas e requisições.
+
+        Returns:
+            Dict com consultas, compartilhadas (aguardaram uma requisição
+            já em andamento), requisicoes feitas à API e economia (fração
+            de consultas que não geraram requisição própria)
+        """
+        with self._lock:
+            return {
+                "consultas": self.consultas,
+                "compartilhadas": self.compartilhadas,
+                "requisicoes": self.requisicoes,
+                "economia": 1 - self.requisicoes / self.consultas if self.consultas else 0.0
+            }
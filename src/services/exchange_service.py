@@ -1,14 +1,403 @@
 """Serviço de consulta de cotação de moedas."""
 
+import atexit
+import threading
+import time
 import requests
-from typing import Optional, Dict
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Sequence, Tuple, Union
 from datetime import datetime
 
+import numpy as np
+
 from src.models.schemas import CotacaoMoeda
+from src.services.exchange_cache import CotacaoCache, FRESCA, OBSOLETA
+from src.services.exchange_coalescer import AgrupadorCotacoes
+from src.services.rate_history import HistoricoCotacoes
+from src.services.rate_matrix import AtualizadorCotacoes, MatrizCambio
+from src.services.rate_snapshot import SnapshotCotacoes
+from src.utils.circuit_breaker import CircuitBreaker
 from src.utils.exceptions import ExchangeAPIError
 from src.config.settings import settings
 
 
+# Últimas cotações válidas (memória + arquivo em disco)
+_snapshot: Optional[SnapshotCotacoes] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_rate_snapshot() -> SnapshotCotacoes:
+    """Retorna o snapshot de cotações do processo (carregado na primeira chamada)."""
+    global _snapshot
+
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = SnapshotCotacoes(settings.snapshot_path)
+                atexit.register(_snapshot.gravar)  # Grava o que ficou pendente
+
+    return _snapshot
+
+
+def reset_rate_snapshot() -> None:
+    """Descarta o snapshot em memória (uso em testes); o arquivo é mantido."""
+    global _snapshot
+
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def cotacao_de_reserva(moeda: str, base: str, erro: ExchangeAPIError) -> Optional[CotacaoMoeda]:
+    """
+    Última cotação conhecida para servir quando a API falha.
+
+    Não há reserva para moedas inexistentes (erro 404): nesse caso o
+    erro deve chegar ao cliente.
+
+    Returns:
+        CotacaoMoeda com desatualizada_desde preenchido, ou None
+    """
+    if erro.details.get("status_code") == 404:
+        return None
+
+    return get_rate_snapshot().ultima(moeda, base)
+
+
+# Circuit breakers por URL base da API
+_disjuntores: Dict[str, CircuitBreaker] = {}
+_disjuntores_lock = threading.Lock()
+
+
+def get_circuit_breaker(api_base: str) -> CircuitBreaker:
+    """Retorna o circuit breaker da API informada (criado na primeira chamada)."""
+    disjuntor = _disjuntores.get(api_base)
+
+    if disjuntor is None:
+        with _disjuntores_lock:
+            disjuntor = _disjuntores.get(api_base)
+            if disjuntor is None:
+                disjuntor = _disjuntores[api_base] = CircuitBreaker(
+                    limite_falhas=settings.exchange_circuit_failure_threshold,
+                    tempo_aberto=settings.exchange_circuit_open_seconds
+                )
+
+    return disjuntor
+
+
+def reset_circuit_breakers() -> None:
+    """Descarta todos os circuit breakers (uso em testes)."""
+    with _disjuntores_lock:
+        _disjuntores.clear()
+
+
+def erro_circuito_aberto(moeda: Optional[str] = None) -> ExchangeAPIError:
+    """Erro retornado sem chamar a API enquanto o circuito está aberto."""
+    return ExchangeAPIError(
+        "API de cambio indisponivel no momento (circuito aberto)",
+        moeda=moeda
+    )
+
+
+def falha_da_api(erro: ExchangeAPIError) -> bool:
+    """
+    Indica se o erro conta como falha da API para o circuit breaker.
+
+    Timeout, erro de conexão, 429 e 5xx contam; respostas 4xx (ex: moeda
+    inexistente) mostram que a API está respondendo e não contam.
+    """
+    status = erro.details.get("status_code")
+    return status is None or status == 429 or status >= 500
+
+
+def erro_timeout(moeda: Optional[str] = None) -> ExchangeAPIError:
+    """Erro de timeout da consulta (requisição lenta ou prazo esgotado)."""
+    return ExchangeAPIError(
+        "Timeout ao consultar API de cambio",
+        moeda=moeda
+    )
+
+
+# Status HTTP em que a requisição é refeita
+STATUS_REPETIVEIS = (429, 500, 502, 503, 504)
+
+
+def erro_de_conexao(mensagem: str, moeda: Optional[str] = None) -> ExchangeAPIError:
+    """Erro de conexão (inclui timeout de conexão): a requisição pode ser refeita."""
+    erro = ExchangeAPIError(mensagem, moeda=moeda)
+    erro.details["repetivel"] = True
+    return erro
+
+
+def espera_nova_tentativa(erro: ExchangeAPIError, tentativa: int, prazo: float) -> Optional[float]:
+    """
+    Decide se uma requisição que falhou deve ser refeita.
+
+    Só erros de conexão e status 429/5xx são refeitos; timeout de leitura
+    não (a API recebeu o pedido e não respondeu: repetir só multiplica a
+    espera). A nova tentativa precisa caber no prazo da consulta.
+
+    Args:
+        erro: Erro da tentativa que falhou
+        tentativa: Número de tentativas já refeitas
+        prazo: Instante (time.monotonic) em que a consulta toda expira
+
+    Returns:
+        Segundos a esperar antes de refazer, ou None para desistir
+    """
+    repetivel = erro.details.get("repetivel") or erro.details.get("status_code") in STATUS_REPETIVEIS
+    if not repetivel or tentativa >= settings.exchange_max_retries:
+        return None
+
+    espera = settings.exchange_retry_backoff * (2 ** tentativa)
+    if time.monotonic() + espera >= prazo:
+        return None
+    return espera
+
+
+# Cache compartilhado por todas as instâncias do serviço
+_cache: Optional[CotacaoCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_exchange_cache() -> CotacaoCache:
+    """
+    Retorna o cache de cotações do processo (criado na primeira chamada).
+
+    Na criação, o cache é aquecido com as cotações do snapshot em disco
+    que ainda estão dentro da janela de obsolescência, com a idade real
+    de cada uma (as obsoletas são servidas e atualizadas em segundo plano).
+    """
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                cache = CotacaoCache(
+                    ttl=settings.exchange_cache_ttl,
+                    stale_ttl=settings.exchange_cache_stale_ttl
+                )
+
+                agora = datetime.now()
+                for par, cotacao in get_rate_snapshot().cotacoes().items():
+                    idade = (agora - cotacao.data_hora).total_seconds()
+                    if 0 <= idade <= cache.stale_ttl:
+                        cache.set(par, cotacao, idade=idade)
+
+                _cache = cache
+
+    return _cache
+
+
+def reset_exchange_cache() -> None:
+    """Descarta o cache de cotações (uso em testes)."""
+    global _cache
+
+    with _cache_lock:
+        _cache = None
+
+
+# Agrupador de consultas simultâneas (single-flight)
+_agrupador: Optional[AgrupadorCotacoes] = None
+_agrupador_lock = threading.Lock()
+
+
+def get_exchange_coalescer() -> AgrupadorCotacoes:
+    """Retorna o agrupador de consultas do processo (criado na primeira chamada)."""
+    global _agrupador
+
+    if _agrupador is None:
+        with _agrupador_lock:
+            if _agrupador is None:
+                _agrupador = AgrupadorCotacoes(janela=settings.exchange_coalesce_window)
+
+    return _agrupador
+
+
+def reset_exchange_coalescer() -> None:
+    """Descarta o agrupador de consultas (uso em testes)."""
+    global _agrupador
+
+    with _agrupador_lock:
+        _agrupador = None
+
+
+# Histórico de cotações obtidas (buffer circular em memória)
+_historico: Optional[HistoricoCotacoes] = None
+_historico_lock = threading.Lock()
+
+
+def get_rate_history() -> HistoricoCotacoes:
+    """Retorna o histórico de cotações do processo (criado na primeira chamada)."""
+    global _historico
+
+    if _historico is None:
+        with _historico_lock:
+            if _historico is None:
+                _historico = HistoricoCotacoes(settings.exchange_history_size)
+
+    return _historico
+
+
+def reset_rate_history() -> None:
+    """Descarta o histórico de cotações (uso em testes)."""
+    global _historico
+
+    with _historico_lock:
+        _historico = None
+
+
+def extrair_cotacoes(data: dict, moedas: list[str], base: str) -> Dict[str, CotacaoMoeda]:
+    """
+    Converte a resposta JSON da AwesomeAPI em cotações.
+
+    Args:
+        data: JSON no formato {"USDBRL": {"bid": "5.25", ...}, ...}
+        moedas: Moedas pedidas
+        base: Moeda base
+
+    Returns:
+        Dict moeda -> CotacaoMoeda, apenas com as moedas presentes na resposta
+    """
+    resultado = {}
+    agora = datetime.now()
+
+    for moeda in moedas:
+        taxa_str = data.get(f"{moeda}{base}", {}).get("bid")
+        if taxa_str:
+            resultado[moeda] = CotacaoMoeda(
+                moeda=moeda,
+                taxa=float(taxa_str),
+                data_hora=agora
+            )
+
+    return resultado
+
+
+def registrar_cotacoes(cotacoes: Dict[str, CotacaoMoeda], base: str) -> Dict[str, CotacaoMoeda]:
+    """Armazena cotações recém-obtidas no cache, no snapshot e no histórico e as retorna."""
+    cache = get_exchange_cache()
+    for moeda, cotacao in cotacoes.items():
+        cache.set(f"{moeda}-{base}", cotacao)
+    get_rate_snapshot().registrar(cotacoes, base)
+    get_rate_history().registrar(cotacoes, base)
+    return cotacoes
+
+
+# Sessão HTTP compartilhada (pool de conexões keep-alive)
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP do processo, criada na primeira chamada.
+
+    A sessão mantém conexões abertas (keep-alive) com a API de câmbio,
+    evitando DNS + TCP + TLS a cada cotação. Ela não refaz requisições:
+    as novas tentativas ficam em ExchangeService._requisitar, que passa
+    cada uma pelo circuit breaker e pelo prazo da consulta.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=settings.exchange_pool_size,
+                    pool_maxsize=settings.exchange_pool_size
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+def reset_http_session() -> None:
+    """Fecha e descarta a sessão HTTP compartilhada."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+# Atualizador periódico das cotações suportadas (matriz de taxas cruzadas)
+_atualizador: Optional[AtualizadorCotacoes] = None
+_atualizador_lock = threading.Lock()
+
+
+def get_rate_refresher() -> AtualizadorCotacoes:
+    """
+    Retorna o atualizador de cotações do processo (criado na primeira chamada).
+
+    A thread só começa a rodar com `get_rate_refresher().iniciar()`.
+    """
+    global _atualizador
+
+    if _atualizador is None:
+        with _atualizador_lock:
+            if _atualizador is None:
+                _atualizador = AtualizadorCotacoes(
+                    buscar=lambda moedas, base: ExchangeService()._buscar_pares(moedas, base),
+                    moedas=settings.moedas_suportadas,
+                    intervalo=settings.exchange_refresh_interval
+                )
+
+    return _atualizador
+
+
+def reset_rate_refresher() -> None:
+    """Para e descarta o atualizador de cotações (uso em testes)."""
+    global _atualizador
+
+    with _atualizador_lock:
+        if _atualizador is not None:
+            _atualizador.parar()
+        _atualizador = None
+
+
+def get_rate_matrix(api_base: Optional[str] = None) -> Optional[MatrizCambio]:
+    """
+    Retorna a matriz de taxas cruzadas, se houver uma utilizável.
+
+    A matriz é utilizável enquanto sua idade não passar da janela de
+    cotações obsoletas do cache (EXCHANGE_CACHE_STALE_TTL) e se refere
+    à API configurada (serviços com api_url próprio não a usam).
+
+    Args:
+        api_base: URL base da API do serviço que consulta
+
+    Returns:
+        MatrizCambio ou None
+    """
+    if api_base not in (None, settings.exchange_api_url) or _atualizador is None:
+        return None
+
+    matriz = _atualizador.matriz
+    if matriz is None or matriz.idade() > settings.exchange_cache_stale_ttl:
+        return None
+
+    return matriz
+
+
+def taxa_cruzada(taxas: Dict[str, float], origem: str, destino: str) -> float:
+    """
+    Calcula a taxa origem -> destino a partir das taxas de cada moeda na base.
+
+    Args:
+        taxas: Valor de 1 unidade de cada moeda na base (a base vale 1.0)
+        origem: Moeda de origem
+        destino: Moeda de destino
+
+    Returns:
+        Unidades de destino por unidade de origem
+    """
+    return taxas[origem] / taxas[destino]
+
+
 class ExchangeService:
     """
     Serviço para consultar cotação de moedas via API externa.
@@ -22,88 +411,94 @@ class ExchangeService:
         Inicializa o serviço de câmbio.
 
         Args:
-            api_url: URL base da API (não usado com AwesomeAPI)
+            api_url: URL base da API. Se None, usa settings.exchange_api_url
         """
         # AwesomeAPI - API brasileira com valores corretos
-        self.api_base = "https://economia.awesomeapi.com.br/json/last"
-        self.timeout = 10  # Timeout em segundos
+        self.api_base = api_url or settings.exchange_api_url
+        self.timeout = settings.exchange_timeout  # Timeout em segundos
+        self.cache = get_exchange_cache()
+        self.session = get_http_session()
+        self.disjuntor = get_circuit_breaker(self.api_base)
 
-    def get_rate(self, moeda: str = "USD", base: str = "BRL") -> CotacaoMoeda:
+    def _requisitar(self, pares: list[str], moeda: Optional[str] = None) -> dict:
         """
-        Obtém a cotação de uma moeda em relação ao Real (BRL).
+        Faz a requisição HTTP para um ou mais pares e retorna o JSON.
 
-        Args:
-            moeda: Código da moeda a consultar (USD, EUR, GBP, etc)
-            base: Sempre BRL (Real Brasileiro)
+        Passa pelo circuit breaker: com o circuito aberto, falha na hora
+        sem chamar a API. Erros de conexão e status 429/5xx são refeitos
+        (até exchange_max_retries vezes, com backoff exponencial); cada
+        tentativa conta no circuit breaker e todas dividem o mesmo prazo
+        de exchange_timeout segundos.
 
-        Returns:
-            CotacaoMoeda com os dados da cotação
+        Args:
+            pares: Pares no formato da AwesomeAPI (ex: ["USD-BRL", "EUR-BRL"])
+            moeda: Moeda associada aos erros (quando há um único par)
 
         Raises:
-            ExchangeAPIError: Se houver erro na consulta
-
-        Example:
-            >>> service = ExchangeService()
-            >>> cotacao = service.get_rate("USD")
-            >>> print(f"1 {cotacao.moeda} = R$ {cotacao.taxa:.2f}")
-            1 USD = R$ 5.25
+            ExchangeAPIError: Se houver erro na consulta ou o circuito estiver aberto
         """
-        try:
-            # AwesomeAPI: formato USD-BRL, EUR-BRL, etc
-            par = f"{moeda}-{base}"
-            url = f"{self.api_base}/{par}"
+        prazo = time.monotonic() + self.timeout
+        tentativa = 0
+
+        while True:
+            # Prazo esgotado (ex.: pelo backoff): não chama a API
+            restante = prazo - time.monotonic()
+            if restante <= 0:
+                raise erro_timeout(moeda)
+
+            if not self.disjuntor.permitir():
+                raise erro_circuito_aberto(moeda)
+
+            try:
+                data = self._requisitar_http(pares, moeda, timeout=restante)
+            except ExchangeAPIError as e:
+                if not falha_da_api(e):
+                    self.disjuntor.registrar_sucesso()
+                    raise
+
+                self.disjuntor.registrar_falha()
+                espera = espera_nova_tentativa(e, tentativa, prazo)
+                if espera is None:
+                    raise
+                tentativa += 1
+                time.sleep(espera)
+                continue
+
+            self.disjuntor.registrar_sucesso()
+            return data
+
+    def _requisitar_http(
+        self,
+        pares: list[str],
+        moeda: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> dict:
+        """Requisição HTTP em si, com os erros convertidos em ExchangeAPIError."""
+        url = f"{self.api_base}/{','.join(pares)}"
 
-            # Fazer requisição
-            response = requests.get(url, timeout=self.timeout)
+        try:
+            response = self.session.get(url, timeout=self.timeout if timeout is None else timeout)
             response.raise_for_status()
+            return response.json()
 
-            # Parse JSON
-            data = response.json()
-
-            # AwesomeAPI retorna formato: {"USDBRL": {"bid": "5.25", ...}}
-            chave = par.replace("-", "")  # USD-BRL -> USDBRL
-
-            if chave not in data:
-                raise ExchangeAPIError(
-                    f"Moeda {moeda} nao encontrada na API",
-                    moeda=moeda
-                )
-
-            # Pegar taxa de compra (bid)
-            taxa_str = data[chave].get("bid")
-            if not taxa_str:
-                raise ExchangeAPIError(
-                    "Taxa nao encontrada na resposta da API",
-                    moeda=moeda
-                )
-
-            taxa = float(taxa_str)
-
-            # Criar modelo
-            cotacao = CotacaoMoeda(
-                moeda=moeda,
-                taxa=taxa,
-                data_hora=datetime.now()
-            )
-
-            return cotacao
-
-        except requests.exceptions.Timeout:
-            raise ExchangeAPIError(
-                "Timeout ao consultar API de cambio",
-                moeda=moeda
-            )
+        except requests.exceptions.ReadTimeout:
+            raise erro_timeout(moeda)
 
         except requests.exceptions.ConnectionError:
-            raise ExchangeAPIError(
+            # Inclui ConnectTimeout
+            raise erro_de_conexao(
                 "Erro de conexao ao consultar API de cambio",
                 moeda=moeda
             )
 
+        except requests.exceptions.Timeout:
+            raise erro_timeout(moeda)
+
         except requests.exceptions.HTTPError as e:
             raise ExchangeAPIError(
                 f"Erro HTTP ao consultar API: {e.response.status_code}",
-                moeda=moeda
+                moeda=moeda,
+                status_code=e.response.status_code
             )
 
         except Exception as e:
@@ -112,10 +507,102 @@ class ExchangeService:
                 moeda=moeda
             )
 
+    def _buscar_pares(self, moedas: list[str], base: str = "BRL") -> Dict[str, CotacaoMoeda]:
+        """
+        Busca cotações na API (uma única requisição) e atualiza o cache.
+
+        Args:
+            moedas: Códigos das moedas
+            base: Moeda base
+
+        Returns:
+            Dict moeda -> CotacaoMoeda, apenas com as moedas encontradas
+        """
+        pares = [f"{moeda}-{base}" for moeda in moedas]
+        data = self._requisitar(pares, moeda=moedas[0] if len(moedas) == 1 else None)
+        return registrar_cotacoes(extrair_cotacoes(data, moedas, base), base)
+
+    def _atualizar_em_segundo_plano(self, moeda: str, base: str) -> None:
+        """Dispara a atualização de um par obsoleto sem bloquear o chamador."""
+        chave = f"{moeda}-{base}"
+
+        if not self.cache.iniciar_atualizacao(chave):
+            return  # Já existe uma atualização em andamento
+
+        def atualizar():
+            try:
+                self._buscar_pares([moeda], base)
+            except Exception:
+                pass  # Mantém a entrada obsoleta até a próxima tentativa
+            finally:
+                self.cache.finalizar_atualizacao(chave)
+
+        threading.Thread(target=atualizar, name=f"refresh-{chave}", daemon=True).start()
+
+    def get_rate(self, moeda: str = "USD", base: str = "BRL") -> CotacaoMoeda:
+        """
+        Obtém a cotação de uma moeda em relação ao Real (BRL).
+
+        A cotação é servida do cache enquanto fresca; se estiver obsoleta,
+        é servida e atualizada em segundo plano. O data_hora retornado é
+        sempre o do momento em que a cotação foi obtida da API.
+
+        Na falta do cache, consultas simultâneas são agrupadas: quem pede
+        o mesmo par aguarda a mesma requisição, e pares diferentes pedidos
+        na mesma janela vão juntos em uma única URL multi-par.
+
+        Se a API estiver indisponível (ou o circuito estiver aberto),
+        retorna a última cotação conhecida (snapshot) com
+        desatualizada_desde preenchido.
+
+        Args:
+            moeda: Código da moeda a consultar (USD, EUR, GBP, etc)
+            base: Sempre BRL (Real Brasileiro)
+
+        Returns:
+            CotacaoMoeda com os dados da cotação
+
+        Raises:
+            ExchangeAPIError: Se houver erro na consulta e não houver
+                              cotação anterior conhecida
+
+        Example:
+            >>> service = ExchangeService()
+            >>> cotacao = service.get_rate("USD")
+            >>> print(f"1 {cotacao.moeda} = R$ {cotacao.taxa:.2f}")
+            1 USD = R$ 5.25
+        """
+        if self.cache.ttl > 0:
+            cotacao, estado = self.cache.get(f"{moeda}-{base}")
+
+            if estado == OBSOLETA:
+                self._atualizar_em_segundo_plano(moeda, base)
+
+            if cotacao is not None:
+                return cotacao
+
+        try:
+            # Circuito aberto: falha antes de entrar no agrupamento
+            if self.disjuntor.recusando():
+                raise erro_circuito_aberto(moeda)
+
+            return get_exchange_coalescer().obter(self.api_base, moeda, base, self._buscar_pares)
+
+        except ExchangeAPIError as e:
+            reserva = cotacao_de_reserva(moeda, base, e)
+            if reserva is None:
+                raise
+            return reserva
+
     def get_multiple_rates(self, moedas: list[str], base: str = "BRL") -> Dict[str, CotacaoMoeda]:
         """
         Obtém cotações de múltiplas moedas.
 
+        Moedas com cotação fresca no cache não são consultadas novamente;
+        as demais são buscadas em uma única requisição. Se a API falhar e
+        todas as moedas faltantes tiverem cotação anterior conhecida, elas
+        são retornadas com desatualizada_desde preenchido.
+
         Args:
             moedas: Lista de códigos de moedas (ex: ["USD", "EUR", "GBP"])
             base: Moeda base (padrão: BRL)
@@ -132,51 +619,193 @@ class ExchangeService:
             EUR: R$ 5.80
         """
         resultado = {}
+        faltando = []
 
-        try:
-            # AwesomeAPI aceita múltiplas moedas: USD-BRL,EUR-BRL,GBP-BRL
-            pares = [f"{moeda}-{base}" for moeda in moedas]
-            pares_str = ",".join(pares)
-            url = f"{self.api_base}/{pares_str}"
+        for moeda in moedas:
+            cotacao, estado = self.cache.get(f"{moeda}-{base}") if self.cache.ttl > 0 else (None, None)
+            if estado == FRESCA:
+                resultado[moeda] = cotacao
+            else:
+                faltando.append(moeda)
 
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
+        if not faltando:
+            return resultado
 
-            data = response.json()
+        try:
+            # AwesomeAPI aceita múltiplas moedas: USD-BRL,EUR-BRL,GBP-BRL
+            resultado.update(self._buscar_pares(faltando, base))
+            return resultado
 
-            # Processar cada moeda
-            for moeda in moedas:
-                chave = f"{moeda}{base}"  # USD-BRL -> USDBRL
-                if chave in data:
-                    taxa_str = data[chave].get("bid")
-                    if taxa_str:
-                        resultado[moeda] = CotacaoMoeda(
-                            moeda=moeda,
-                            taxa=float(taxa_str),
-                            data_hora=datetime.now()
-                        )
+        except ExchangeAPIError as e:
+            reservas = {moeda: cotacao_de_reserva(moeda, base, e) for moeda in faltando}
+            if all(reservas.values()):
+                resultado.update(reservas)
+                return resultado
 
-            return resultado
+            raise ExchangeAPIError(
+                f"Erro ao consultar multiplas cotacoes: {str(e)}"
+            )
 
         except Exception as e:
             raise ExchangeAPIError(
                 f"Erro ao consultar multiplas cotacoes: {str(e)}"
             )
 
+    def convert(
+        self,
+        valor: float,
+        origem: str,
+        destino: str = "BRL",
+        base: str = "BRL"
+    ) -> Tuple[float, float, Optional[datetime]]:
+        """
+        Converte um valor entre quaisquer duas moedas.
+
+        Usa a matriz de taxas cruzadas em memória quando disponível
+        (sem chamadas de rede); caso contrário, obtém as cotações das
+        duas moedas em relação à base via get_rate.
+
+        Args:
+            valor: Valor na moeda de origem
+            origem: Moeda de origem (ex: "EUR")
+            destino: Moeda de destino (padrão: BRL)
+            base: Moeda base das cotações
+
+        Returns:
+            Tupla (valor_convertido, taxa, desatualizada_desde), com
+            desatualizada_desde preenchido se alguma cotação usada for a
+            última conhecida (API indisponível) ou se a matriz tiver
+            passado de EXCHANGE_CACHE_TTL
+
+        Raises:
+            ExchangeAPIError: Se houver erro na consulta
+
+        Example:
+            >>> valor, taxa, _ = ExchangeService().convert(100, "EUR", "USD")
+        """
+        if origem == destino:
+            return valor, 1.0, None
+
+        matriz = get_rate_matrix(self.api_base)
+        if matriz is not None and origem in matriz and destino in matriz:
+            taxa = matriz.taxa(origem, destino)
+            return valor * taxa, taxa, matriz.desatualizada_desde(settings.exchange_cache_ttl)
+
+        cotacoes = [self.get_rate(moeda, base) for moeda in (origem, destino) if moeda != base]
+        taxas = {base: 1.0, **{cotacao.moeda: cotacao.taxa for cotacao in cotacoes}}
+        desatualizada_desde = min(
+            (c.desatualizada_desde for c in cotacoes if c.desatualizada_desde),
+            default=None
+        )
+
+        taxa = taxa_cruzada(taxas, origem, destino)
+        return valor * taxa, taxa, desatualizada_desde
+
+    def convert_batch(
+        self,
+        valores: Union[Sequence[float], np.ndarray],
+        origens: Union[str, Sequence[str]],
+        destinos: Union[str, Sequence[str]] = "BRL",
+        base: str = "BRL"
+    ) -> np.ndarray:
+        """
+        Converte vários valores de uma vez pela matriz de taxas cruzadas.
+
+        Se não houver matriz em memória, as moedas envolvidas são buscadas
+        em uma única requisição multi-par.
+
+        Args:
+            valores: Valores a converter
+            origens: Moeda de origem única ou uma por valor
+            destinos: Moeda de destino única ou uma por valor
+            base: Moeda base das cotações
+
+        Returns:
+            Array float64 com os valores convertidos
+
+        Raises:
+            ExchangeAPIError: Se houver erro na consulta ou moeda desconhecida
+        """
+        moedas = set(np.atleast_1d(origens)) | set(np.atleast_1d(destinos))
+        moedas.discard(base)
+
+        matriz = get_rate_matrix(self.api_base)
+        if matriz is None or not all(moeda in matriz for moeda in moedas):
+            matriz = MatrizCambio(self.get_multiple_rates(sorted(moedas), base), base)
+
+        return matriz.converter_lote(valores, origens, destinos)
+
+    def get_rate_history(self, moeda: str = "USD", horas: float = 24,
+                         ultimas: int = 5, base: str = "BRL") -> Optional[Dict]:
+        """
+        Estatísticas das cotações já obtidas de uma moeda, sem chamar a API.
+
+        O histórico é alimentado por toda consulta feita à API (inclusive
+        pelo atualizador periódico), com os valores no momento da consulta.
+
+        Args:
+            moeda: Código da moeda
+            horas: Janela em horas até agora
+            ultimas: Quantas amostras mais recentes incluir
+            base: Moeda base
+
+        Returns:
+            Dict com amostras, minimo, maximo, media, primeira, ultima,
+            variacao, variacao_percentual, inicio, fim e ultimas;
+            None se não houver amostras na janela
+
+        Example:
+            >>> ExchangeService().get_rate_history("USD", horas=24)["maximo"]
+            5.31
+        """
+        return get_rate_history().consultar(moeda, horas, ultimas, base)
+
+    def cache_stats(self) -> Dict:
+        """
+        Retorna as estatísticas do cache de cotações.
+
+        Returns:
+            Dict com hits, stale_hits, misses, refreshes, hit_rate e idades
+        """
+        return self.cache.estatisticas()
+
+    def coalescing_stats(self) -> Dict:
+        """
+        Retorna as estatísticas do agrupamento de consultas.
+
+        Returns:
+            Dict com consultas, compartilhadas, requisicoes e economia
+        """
+        return get_exchange_coalescer().estatisticas()
+
+    def circuit_stats(self) -> Dict:
+        """
+        Retorna o estado do circuit breaker da API.
+
+        Returns:
+            Dict com estado, falhas_seguidas, aberturas e recusadas
+        """
+        return self.disjuntor.estatisticas()
+
     def is_api_available(self) -> bool:
         """
         Verifica se a API está disponível.
 
+        Usa o estado de saúde em cache (resultado da última chamada real,
+        válido por EXCHANGE_HEALTH_TTL segundos, ou circuito aberto) e só
+        consulta a API quando esse estado expirou.
+
         Returns:
             True se a API está respondendo
         """
+        saudavel = self.disjuntor.saudavel(settings.exchange_health_ttl)
+        if saudavel is not None:
+            return saudavel
+
         try:
-            response = requests.get(
-                f"{self.api_base}/USD-BRL",
-                timeout=self.timeout
-            )
-            return response.status_code == 200
-        except:
+            self._requisitar(["USD-BRL"], moeda="USD")
+            return True
+        except ExchangeAPIError:
             return False
 
     def get_available_currencies(self, base: str = "BRL") -> list[str]:
@@ -189,5 +818,5 @@ class ExchangeService:
         Returns:
             Lista de códigos de moedas disponíveis
         """
-        # AwesomeAPI suporta moedas principais
-        return ["USD", "EUR", "GBP", "ARS", "BTC", "CAD", "CHF", "JPY"]
+        # Moedas mantidas pelo atualizador (EXCHANGE_SUPPORTED_CURRENCIES)
+        return settings.moedas_suportadas
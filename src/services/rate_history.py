@@ -0,0 +1,159 @@
+"""Histórico de cotações em memória (buffer circular)."""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.models.schemas import CotacaoMoeda
+
+
+class HistoricoCotacoes:
+    """
+    Buffer circular de tamanho fixo com amostras (instante, par, taxa).
+
+    As amostras ficam em três arrays NumPy pré-alocados; ao encher, as
+    mais antigas são sobrescritas. Consultas (mínimo, máximo, média,
+    últimas N) são feitas sobre os arrays, sem loops em Python por amostra.
+    """
+
+    def __init__(self, capacidade: int):
+        """
+        Args:
+            capacidade: Número máximo de amostras guardadas (todos os pares)
+        """
+        self.capacidade = max(1, capacidade)
+
+        self._instantes = np.zeros(self.capacidade, dtype=np.float64)  # Epoch em segundos
+        self._pares = np.full(self.capacidade, -1, dtype=np.int32)
+        self._taxas = np.zeros(self.capacidade, dtype=np.float64)
+
+        self._proxima = 0  # Posição da próxima escrita
+        self._total = 0    # Amostras válidas (<= capacidade)
+
+        self._indice_pares: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._total
+
+    def _indice_par(self, par: str) -> int:
+        """Retorna (criando se preciso) o código numérico de um par."""
+        indice = self._indice_pares.get(par)
+        if indice is None:
+            indice = self._indice_pares[par] = len(self._indice_pares)
+        return indice
+
+    def registrar(self, cotacoes: Dict[str, CotacaoMoeda], base: str = "BRL") -> None:
+        """
+        Adiciona uma amostra por cotação obtida.
+
+        Args:
+            cotacoes: Dict moeda -> CotacaoMoeda
+            base: Moeda base das cotações
+        """
+        with self._lock:
+            for moeda, cotacao in cotacoes.items():
+                posicao = self._proxima
+                self._instantes[posicao] = cotacao.data_hora.timestamp()
+                self._pares[posicao] = self._indice_par(f"{moeda}-{base}")
+                self._taxas[posicao] = cotacao.taxa
+
+                self._proxima = (posicao + 1) % self.capacidade
+                self._total = min(self._total + 1, self.capacidade)
+
+    def consultar_varias(
+        self,
+        moedas: List[str],
+        horas: float = 24,
+        ultimas: int = 5,
+        base: str = "BRL",
+        agora: Optional[float] = None
+    ) -> Dict[str, Dict]:
+        """
+        Estatísticas de várias moedas em uma janela, numa única passada.
+
+        Args:
+            moedas: Códigos das moedas
+            horas: Tamanho da janela (horas até agora)
+            ultimas: Quantas amostras mais recentes retornar por moeda
+            base: Moeda base
+            agora: Instante de referência (epoch); padrão: time.time()
+
+        Returns:
+            Dict moeda -> {amostras, minimo, maximo, media, primeira, ultima,
+            variacao, variacao_percentual, inicio, fim, ultimas}. Moedas sem
+            amostras na janela não aparecem no resultado.
+        """
+        limite = (agora if agora is not None else time.time()) - horas * 3600
+
+        with self._lock:
+            codigos = {
+                self._indice_pares[f"{moeda}-{base}"]: moeda
+                for moeda in moedas
+                if f"{moeda}-{base}" in self._indice_pares
+            }
+            if not codigos:
+                return {}
+
+            selecao = (
+                (self._instantes[:self._total] >= limite) &
+                np.isin(self._pares[:self._total], list(codigos))
+            )
+            instantes = self._instantes[:self._total][selecao]
+            pares = self._pares[:self._total][selecao]
+            taxas = self._taxas[:self._total][selecao]
+
+        if instantes.size == 0:
+            return {}
+
+        # Ordenar por par e, dentro do par, por instante
+        ordem = np.lexsort((instantes, pares))
+        instantes, pares, taxas = instantes[ordem], pares[ordem], taxas[ordem]
+
+        codigos_presentes, inicios, contagens = np.unique(pares, return_index=True, return_counts=True)
+        fins = inicios + contagens - 1
+
+        minimos = np.minimum.reduceat(taxas, inicios)
+        maximos = np.maximum.reduceat(taxas, inicios)
+        medias = np.add.reduceat(taxas, inicios) / contagens
+        primeiras = taxas[inicios]
+        finais = taxas[fins]
+
+        resultado = {}
+        for i, codigo in enumerate(codigos_presentes):
+            recentes = slice(max(inicios[i], fins[i] + 1 - ultimas), fins[i] + 1)
+
+            resultado[codigos[int(codigo)]] = {
+                "amostras": int(contagens[i]),
+                "minimo": float(minimos[i]),
+                "maximo": float(maximos[i]),
+                "media": float(medias[i]),
+                "primeira": float(primeiras[i]),
+                "ultima": float(finais[i]),
+                "variacao": float(finais[i] - primeiras[i]),
+                "variacao_percentual": float((finais[i] / primeiras[i] - 1) * 100),
+                "inicio": datetime.fromtimestamp(instantes[inicios[i]]),
+                "fim": datetime.fromtimestamp(instantes[fins[i]]),
+                "ultimas": [
+                    (datetime.fromtimestamp(instante), float(taxa))
+                    for instante, taxa in zip(instantes[recentes], taxas[recentes])
+                ]
+            }
+
+        return resultado
+
+    def consultar(self, moeda: str, horas: float = 24, ultimas: int = 5, base: str = "BRL") -> Optional[Dict]:
+        """
+        Estatísticas de uma moeda na janela das últimas `horas` horas.
+
+        Returns:
+            Dict como em consultar_varias, ou None se não houver amostras
+
+        Example:
+            >>> historico.consultar("USD", horas=24)["variacao_percentual"]
+            0.38
+        """
+        return self.consultar_varias([moeda], horas, ultimas, base).get(moeda)
@@ -0,0 +1,234 @@
+"""Matriz de taxas cruzadas e atualização periódica das cotações."""
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from src.models.schemas import CotacaoMoeda
+from src.utils.exceptions import ExchangeAPIError
+
+
+# Função que busca vários pares em uma requisição: (moedas, base) -> cotações
+BuscarPares = Callable[[list[str], str], Dict[str, CotacaoMoeda]]
+
+
+class MatrizCambio:
+    """
+    Taxas de câmbio entre todas as moedas suportadas, mantidas em memória.
+
+    Guarda o vetor `vetor[i]` = valor de 1 unidade da moeda i na moeda base
+    (a base tem valor 1) e a matriz derivada
+
+        matriz[i, j] = vetor[i] / vetor[j]
+
+    com quantas unidades da moeda j vale 1 unidade da moeda i. Qualquer
+    conversão (EUR -> USD, BRL -> JPY, ...) vira uma consulta à matriz.
+
+    Instâncias não são alteradas depois de criadas: uma atualização gera
+    uma nova matriz, que substitui a anterior por troca de referência.
+    """
+
+    def __init__(self, cotacoes: Dict[str, CotacaoMoeda], base: str = "BRL"):
+        """
+        Args:
+            cotacoes: Cotações em relação à base (moeda -> CotacaoMoeda)
+            base: Moeda base das cotações
+        """
+        self.base = base
+        self.moedas = [base, *sorted(m for m in cotacoes if m != base)]
+        self.indice = {moeda: i for i, moeda in enumerate(self.moedas)}
+
+        self.vetor = np.array([1.0, *(cotacoes[m].taxa for m in self.moedas[1:])])
+        self.matriz = self.vetor[:, None] / self.vetor[None, :]
+        self.matriz.setflags(write=False)
+
+        # Momento da cotação mais antiga (o que o cliente deve ver)
+        self.data_hora = min(
+            (cotacoes[m].data_hora for m in self.moedas[1:]),
+            default=datetime.now()
+        )
+        self._criada_em = time.monotonic()
+
+    def __contains__(self, moeda: str) -> bool:
+        return moeda in self.indice
+
+    def idade(self) -> float:
+        """Segundos desde que a matriz foi montada."""
+        return time.monotonic() - self._criada_em
+
+    def desatualizada_desde(self, ttl: float) -> Optional[datetime]:
+        """
+        Momento da cotação mais antiga, se ela já passou de `ttl` segundos.
+
+        Args:
+            ttl: Segundos em que uma cotação é considerada fresca
+
+        Returns:
+            data_hora da matriz se ela estiver obsoleta, senão None
+        """
+        if (datetime.now() - self.data_hora).total_seconds() > ttl:
+            return self.data_hora
+        return None
+
+    def _indices(self, moedas: Union[str, Sequence[str], np.ndarray]) -> np.ndarray:
+        """Converte códigos de moeda em índices da matriz (vetorizado)."""
+        codigos = np.asarray(moedas)
+        unicos, inverso = np.unique(codigos, return_inverse=True)
+
+        desconhecidas = [m for m in unicos if m not in self.indice]
+        if desconhecidas:
+            raise ExchangeAPIError(
+                f"Moeda {desconhecidas[0]} nao suportada",
+                moeda=str(desconhecidas[0])
+            )
+
+        return np.array([self.indice[m] for m in unicos])[inverso].reshape(codigos.shape)
+
+    def taxa(self, origem: str, destino: str = "BRL") -> float:
+        """
+        Retorna quantas unidades de `destino` vale 1 unidade de `origem`.
+
+        Raises:
+            ExchangeAPIError: Se alguma das moedas não estiver na matriz
+        """
+        return float(self.matriz[self._indices(origem), self._indices(destino)])
+
+    def converter(self, valor: float, origem: str, destino: str = "BRL") -> float:
+        """
+        Converte um valor entre duas moedas.
+
+        Example:
+            >>> matriz.converter(100, "EUR", "USD")
+            110.47...
+        """
+        return valor * self.taxa(origem, destino)
+
+    def converter_lote(
+        self,
+        valores: Union[Sequence[float], np.ndarray],
+        origens: Union[str, Sequence[str], np.ndarray],
+        destinos: Union[str, Sequence[str], np.ndarray] = "BRL"
+    ) -> np.ndarray:
+        """
+        Converte vários valores de uma vez.
+
+        Origens e destinos podem ser uma moeda única (aplicada a todos os
+        valores) ou uma sequência do mesmo tamanho de `valores`.
+
+        Returns:
+            Array float64 com os valores convertidos
+
+        Raises:
+            ExchangeAPIError: Se alguma moeda não estiver na matriz
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        return valores * self.matriz[self._indices(origens), self._indices(destinos)]
+
+
+class AtualizadorCotacoes:
+    """
+    Atualiza periodicamente as cotações de todas as moedas suportadas.
+
+    Uma thread daemon busca todos os pares em uma única requisição
+    multi-par a cada `intervalo` segundos e publica uma nova MatrizCambio.
+    Falhas mantêm a matriz anterior; moedas ausentes em uma resposta
+    mantêm a última cotação conhecida.
+    """
+
+    def __init__(self, buscar: BuscarPares, moedas: list[str], intervalo: float, base: str = "BRL"):
+        """
+        Args:
+            buscar: Função que consulta a API para uma lista de moedas
+            moedas: Moedas a manter atualizadas
+            intervalo: Segundos entre atualizações
+            base: Moeda base
+        """
+        self.buscar = buscar
+        self.moedas = moedas
+        self.intervalo = intervalo
+        self.base = base
+
+        self.matriz: Optional[MatrizCambio] = None
+        self._cotacoes: Dict[str, CotacaoMoeda] = {}
+
+        self._thread: Optional[threading.Thread] = None
+        self._parar = threading.Event()
+        self._lock = threading.Lock()
+
+        self.atualizacoes = 0
+        self.falhas = 0
+        self.ultimo_erro: Optional[str] = None
+
+    def atualizar(self) -> MatrizCambio:
+        """
+        Busca as cotações agora e publica uma nova matriz.
+
+        Raises:
+            ExchangeAPIError: Se a consulta falhar
+        """
+        cotacoes = self.buscar(self.moedas, self.base)
+
+        with self._lock:
+            self._cotacoes.update(cotacoes)
+            self.matriz = MatrizCambio(dict(self._cotacoes), self.base)
+            self.atualizacoes += 1
+            return self.matriz
+
+    def _executar(self) -> None:
+        """Laço da thread: atualiza e espera o intervalo até ser parada."""
+        while True:
+            try:
+                self.atualizar()
+            except Exception as e:
+                self.falhas += 1
+                self.ultimo_erro = str(e)
+
+            if self._parar.wait(self.intervalo):
+                return
+
+    def iniciar(self) -> bool:
+        """
+        Inicia a thread de atualização (chamadas repetidas não têm efeito).
+
+        Returns:
+            True se a thread estiver rodando ao final da chamada
+        """
+        if self.intervalo <= 0:
+            return False
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._parar.clear()
+                self._thread = threading.Thread(
+                    target=self._executar,
+                    name="atualizador-cotacoes",
+                    daemon=True
+                )
+                self._thread.start()
+
+        return True
+
+    def parar(self) -> None:
+        """Sinaliza a thread para parar e aguarda seu término."""
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def estatisticas(self) -> Dict:
+        """
+        Retorna contadores e a idade da matriz atual.
+
+        Returns:
+            Dict com atualizacoes, falhas, ultimo_erro, moedas e idade_segundos
+        """
+        matriz = self.matriz
+        return {
+            "atualizacoes": self.atualizacoes,
+            "falhas": self.falhas,
+            "ultimo_erro": self.ultimo_erro,
+            "moedas": matriz.moedas if matriz else [],
+            "idade_segundos": round(matriz.idade(), 3) if matriz else None
+        }
@@ -0,0 +1,144 @@
+"""Snapshot em disco das últimas cotações válidas."""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.models.schemas import CotacaoMoeda
+from src.utils.file_io import atomic_write_text
+
+
+# Intervalo mínimo entre gravações do arquivo (segundos)
+INTERVALO_MINIMO_GRAVACAO = 5.0
+
+
+class SnapshotCotacoes:
+    """
+    Últimas cotações obtidas com sucesso, em memória e em um arquivo JSON.
+
+    O arquivo é carregado na criação (início do processo) e regravado de
+    forma atômica após novas cotações, no máximo a cada
+    INTERVALO_MINIMO_GRAVACAO segundos. Serve para:
+    - aquecer o cache no início, sem esperar a primeira consulta à API;
+    - responder com a última cotação conhecida quando a API está fora.
+
+    Formato do arquivo:
+        {"salvo_em": "...", "cotacoes": {"USD-BRL": {"taxa": 5.25, "data_hora": "..."}}}
+    """
+
+    def __init__(self, caminho: Optional[Path]):
+        """
+        Args:
+            caminho: Arquivo do snapshot. None desativa a persistência
+                     (as cotações continuam guardadas em memória)
+        """
+        self.caminho = caminho
+        self._cotacoes: Dict[str, CotacaoMoeda] = {}
+        self._ultima_gravacao = 0.0
+        self._pendente = False
+        self._lock = threading.Lock()
+
+        self.carregar()
+
+    def carregar(self) -> Dict[str, CotacaoMoeda]:
+        """
+        Lê o arquivo do snapshot, ignorando arquivo ausente ou corrompido.
+
+        Returns:
+            Dict par -> CotacaoMoeda carregado (ex: {"USD-BRL": ...})
+        """
+        if self.caminho is None or not self.caminho.exists():
+            return {}
+
+        try:
+            dados = json.loads(self.caminho.read_text(encoding="utf-8"))
+            cotacoes = {
+                par: CotacaoMoeda(
+                    moeda=par.split("-")[0],
+                    taxa=item["taxa"],
+                    data_hora=datetime.fromisoformat(item["data_hora"])
+                )
+                for par, item in dados.get("cotacoes", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+        with self._lock:
+            self._cotacoes.update(cotacoes)
+
+        return cotacoes
+
+    def registrar(self, cotacoes: Dict[str, CotacaoMoeda], base: str) -> None:
+        """
+        Guarda cotações recém-obtidas e grava o arquivo se o intervalo permitir.
+
+        Args:
+            cotacoes: Dict moeda -> CotacaoMoeda
+            base: Moeda base das cotações
+        """
+        if not cotacoes:
+            return
+
+        with self._lock:
+            for moeda, cotacao in cotacoes.items():
+                self._cotacoes[f"{moeda}-{base}"] = cotacao
+            self._pendente = True
+
+            if time.monotonic() - self._ultima_gravacao < INTERVALO_MINIMO_GRAVACAO:
+                return
+
+        self.gravar()
+
+    def gravar(self) -> None:
+        """Grava o snapshot em disco (atômico), se houver alterações."""
+        if self.caminho is None:
+            return
+
+        with self._lock:
+            if not self._pendente:
+                return
+
+            conteudo = json.dumps({
+                "salvo_em": datetime.now().isoformat(),
+                "cotacoes": {
+                    par: {"taxa": cotacao.taxa, "data_hora": cotacao.data_hora.isoformat()}
+                    for par, cotacao in self._cotacoes.items()
+                }
+            }, indent=2)
+            self._pendente = False
+            self._ultima_gravacao = time.monotonic()
+
+        try:
+            self.caminho.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.caminho, conteudo)
+        except OSError:
+            with self._lock:
+                self._pendente = True  # Tenta de novo na próxima gravação
+
+    def ultima(self, moeda: str, base: str = "BRL") -> Optional[CotacaoMoeda]:
+        """
+        Retorna a última cotação conhecida marcada como desatualizada.
+
+        Args:
+            moeda: Código da moeda
+            base: Moeda base
+
+        Returns:
+            Cópia da cotação com desatualizada_desde = data_hora original,
+            ou None se a moeda nunca foi obtida
+        """
+        with self._lock:
+            cotacao = self._cotacoes.get(f"{moeda}-{base}")
+
+        if cotacao is None:
+            return None
+
+        return cotacao.model_copy(update={"desatualizada_desde": cotacao.data_hora})
+
+    def cotacoes(self) -> Dict[str, CotacaoMoeda]:
+        """Retorna uma cópia de todas as cotações guardadas (par -> cotação)."""
+        with self._lock:
+            return dict(self._cotacoes)
@@ -1,6 +1,9 @@
 """Serviço de cálculo de score de crédito."""
 
-from typing import Dict
+from typing import Dict, Mapping, Any, Union
+import numpy as np
+import pandas as pd
+
 from src.models.schemas import DadosFinanceiros
 from src.utils.exceptions import ScoreCalculationError
 
@@ -106,6 +109,142 @@ class ScoreService:
         except Exception as e:
             raise ScoreCalculationError(f"Erro ao calcular score: {str(e)}")
 
+    COLUNAS_BATCH = (
+        "renda_mensal",
+        "despesas_fixas",
+        "tipo_emprego",
+        "num_dependentes",
+        "tem_dividas"
+    )
+
+    @classmethod
+    def _colunas_batch(
+        cls,
+        dados: Union[pd.DataFrame, Mapping[str, Any]]
+    ) -> Dict[str, np.ndarray]:
+        """Extrai as colunas de entrada do batch como arrays NumPy."""
+        faltando = [c for c in cls.COLUNAS_BATCH if c not in dados]
+        if faltando:
+            raise ScoreCalculationError(f"Colunas ausentes: {', '.join(faltando)}")
+
+        colunas = {
+            "renda_mensal": np.asarray(dados["renda_mensal"], dtype=np.float64),
+            "despesas_fixas": np.asarray(dados["despesas_fixas"], dtype=np.float64),
+            "tipo_emprego": np.asarray(dados["tipo_emprego"], dtype=object),
+            "num_dependentes": np.asarray(dados["num_dependentes"]),
+            "tem_dividas": np.asarray(dados["tem_dividas"]),
+        }
+
+        tamanhos = {len(v) for v in colunas.values()}
+        if len(tamanhos) > 1:
+            raise ScoreCalculationError("Colunas com tamanhos diferentes")
+
+        if colunas["num_dependentes"].dtype.kind not in "iu":
+            raise ScoreCalculationError("num_dependentes deve ser inteiro")
+        if colunas["tem_dividas"].dtype.kind not in "iub":
+            raise ScoreCalculationError("tem_dividas deve ser booleano")
+
+        return colunas
+
+    @classmethod
+    def validate_batch(cls, dados: Union[pd.DataFrame, Mapping[str, Any]]) -> np.ndarray:
+        """
+        Indica quais linhas de um batch satisfazem as regras de DadosFinanceiros.
+
+        Args:
+            dados: DataFrame ou dict de arrays com as colunas de COLUNAS_BATCH
+
+        Returns:
+            Array booleano (True = linha válida)
+        """
+        c = cls._colunas_batch(dados)
+
+        return (
+            np.isfinite(c["renda_mensal"]) & (c["renda_mensal"] > 0) &
+            np.isfinite(c["despesas_fixas"]) & (c["despesas_fixas"] >= 0) &
+            np.isin(c["tipo_emprego"], list(cls.PESO_EMPREGO)) &
+            (c["num_dependentes"] >= 0) &
+            np.isin(c["tem_dividas"], [0, 1])
+        )
+
+    @classmethod
+    def calculate_scores_batch(cls, dados: Union[pd.DataFrame, Mapping[str, Any]]) -> np.ndarray:
+        """
+        Calcula o score de muitos clientes de uma vez (vetorizado).
+
+        Aplica a mesma fórmula de calculate_score, na mesma ordem de
+        operações em float64, de modo que o resultado é idêntico ao
+        cálculo escalar linha a linha.
+
+        Args:
+            dados: DataFrame ou dict de arrays com as colunas renda_mensal,
+                   despesas_fixas, tipo_emprego, num_dependentes, tem_dividas
+
+        Returns:
+            Array int64 com os scores (0-1000), na ordem das linhas
+
+        Raises:
+            ScoreCalculationError: Se faltar coluna ou houver linha inválida
+
+        Example:
+            >>> ScoreService.calculate_scores_batch({
+            ...     "renda_mensal": [5000.0], "despesas_fixas": [2000.0],
+            ...     "tipo_emprego": ["formal"], "num_dependentes": [2],
+            ...     "tem_dividas": [False]
+            ... })
+            array([769])
+        """
+        c = cls._colunas_batch(dados)
+
+        invalidas = ~cls.validate_batch(c)
+        if invalidas.any():
+            primeira = int(np.flatnonzero(invalidas)[0])
+            raise ScoreCalculationError(
+                f"Erro ao calcular score: {int(invalidas.sum())} linha(s) invalida(s) "
+                f"(primeira: {primeira})"
+            )
+
+        renda = c["renda_mensal"]
+        despesas = c["despesas_fixas"]
+        dependentes = c["num_dependentes"]
+
+        # Componente: Relação renda/despesas
+        componente_renda = np.where(
+            despesas >= renda,
+            0.0,
+            (renda / (despesas + 1)) * cls.PESO_RENDA
+        )
+
+        # Componente: Tipo de emprego
+        componente_emprego = np.zeros(len(renda), dtype=np.float64)
+        for tipo, peso in cls.PESO_EMPREGO.items():
+            componente_emprego[c["tipo_emprego"] == tipo] = peso
+
+        # Componente: Número de dependentes
+        componente_dependentes = np.full(
+            len(renda), cls.PESO_DEPENDENTES_3_OU_MAIS, dtype=np.float64
+        )
+        for num, peso in cls.PESO_DEPENDENTES.items():
+            componente_dependentes[dependentes == num] = peso
+
+        # Componente: Dívidas
+        componente_dividas = np.where(
+            c["tem_dividas"].astype(bool),
+            float(cls.PESO_DIVIDAS[True]),
+            float(cls.PESO_DIVIDAS[False])
+        )
+
+        # Score total (mesma ordem de soma do cálculo escalar)
+        score_bruto = (
+            componente_renda +
+            componente_emprego +
+            componente_dependentes +
+            componente_dividas
+        )
+
+        # Truncar como int() e normalizar para faixa 0-1000
+        return np.clip(np.trunc(score_bruto), 0, 1000).astype(np.int64)
+
     @classmethod
     def validate_limit_for_score(
         cls,
@@ -0,0 +1,421 @@
+"""Serviço de acesso a dados com armazenamento em SQLite."""
+
+import sqlite3
+import threading
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Iterable, Mapping
+
+from src.models.schemas import Cliente, SolicitacaoAumento, ScoreLimite
+from src.services.data_service import (
+    DataService,
+    SOLICITACOES_COLUNAS,
+    compilar_faixas_score,
+    buscar_limite_compilado
+)
+from src.utils.exceptions import DataAccessError, AuthenticationError
+from src.utils.validators import validar_cpf, validar_data_nascimento
+from src.config.settings import settings
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    cpf TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    data_nascimento TEXT NOT NULL,
+    limite_credito REAL NOT NULL,
+    score_credito INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS score_limite (
+    score_minimo INTEGER NOT NULL,
+    score_maximo INTEGER NOT NULL,
+    limite_maximo REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_score_limite_faixa
+    ON score_limite (score_minimo, score_maximo);
+
+CREATE TABLE IF NOT EXISTS solicitacoes_aumento_limite (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cpf_cliente TEXT NOT NULL,
+    data_hora_solicitacao TEXT NOT NULL,
+    limite_atual REAL NOT NULL,
+    novo_limite_solicitado REAL NOT NULL,
+    status_pedido TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_solicitacoes_cpf
+    ON solicitacoes_aumento_limite (cpf_cliente);
+
+-- Versão de cada tabela de referência, incrementada a cada carga: outros
+-- processos sabem quando descartar o que têm em memória
+CREATE TABLE IF NOT EXISTS versao_dados (
+    tabela TEXT PRIMARY KEY,
+    versao INTEGER NOT NULL
+);
+"""
+
+
+class SQLiteDataService(DataService):
+    """
+    Serviço de dados com a mesma API pública do DataService, mas
+    persistindo clientes, faixas de score e solicitações em SQLite.
+
+    Buscas usam a chave primária/índices e atualizações gravam uma
+    única linha, em vez de reescrever o arquivo inteiro.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, data_path: Optional[Path] = None):
+        """
+        Inicializa o serviço e cria o schema, se necessário.
+
+        Args:
+            db_path: Caminho do arquivo SQLite.
+                    Se None, usa settings.sqlite_path
+            data_path: Diretório dos CSVs (usado pelo importador).
+                      Se None, usa settings.data_path
+        """
+        super().__init__(data_path)
+        self.db_path = db_path or settings.sqlite_path
+        self._local = threading.local()
+        self._limites: Optional[tuple[int, list[float]]] = None  # (versão, tabela)
+        self._limites_lock = threading.Lock()
+
+        with self._conexao() as conn:
+            conn.executescript(SCHEMA)
+
+    def _conexao(self) -> sqlite3.Connection:
+        """Retorna a conexão da thread atual (uma por thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.db_path, timeout=30)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            except sqlite3.Error as e:
+                raise DataAccessError(
+                    f"Erro ao abrir banco de dados: {str(e)}",
+                    filepath=str(self.db_path)
+                )
+            self._local.conn = conn
+        return conn
+
+    def _buscar_cliente(self, cpf: str) -> Optional[sqlite3.Row]:
+        """Busca a linha de um cliente pela chave primária."""
+        try:
+            return self._conexao().execute(
+                "SELECT cpf, nome, data_nascimento, limite_credito, score_credito "
+                "FROM clientes WHERE cpf = ?",
+                (cpf,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao consultar clientes: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+    def _atualizar_cliente(self, cpf: str, coluna: str, valor) -> None:
+        """Atualiza uma coluna de um único cliente."""
+        try:
+            with self._conexao() as conn:
+                cursor = conn.execute(
+                    f"UPDATE clientes SET {coluna} = ? WHERE cpf = ?",
+                    (valor, cpf)
+                )
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao atualizar cliente: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+        if cursor.rowcount == 0:
+            raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+
+    def authenticate_client(self, cpf: str, data_nascimento: str) -> Optional[Cliente]:
+        """Autentica um cliente usando CPF e data de nascimento."""
+        if not validar_cpf(cpf):
+            raise AuthenticationError("CPF invalido")
+
+        if not validar_data_nascimento(data_nascimento):
+            raise AuthenticationError("Data de nascimento invalida")
+
+        row = self._buscar_cliente(cpf)
+
+        if row is None or row["data_nascimento"] != data_nascimento:
+            return None
+
+        return Cliente(**dict(row))
+
+    def get_client_by_cpf(self, cpf: str) -> Optional[Cliente]:
+        """Busca cliente apenas por CPF."""
+        if not validar_cpf(cpf):
+            return None
+
+        row = self._buscar_cliente(cpf)
+
+        if row is None:
+            return None
+
+        return Cliente(**dict(row))
+
+    def update_client_score(self, cpf: str, novo_score: int) -> bool:
+        """Atualiza o score de crédito de um cliente."""
+        if self._buscar_cliente(cpf) is None:
+            raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+
+        if not 0 <= novo_score <= 1000:
+            raise ValueError("Score deve estar entre 0 e 1000")
+
+        self._atualizar_cliente(cpf, "score_credito", int(novo_score))
+        return True
+
+    def update_client_limit(self, cpf: str, novo_limite: float) -> bool:
+        """Atualiza o limite de crédito de um cliente."""
+        if self._buscar_cliente(cpf) is None:
+            raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+
+        if novo_limite < 0:
+            raise ValueError("Limite deve ser maior ou igual a zero")
+
+        self._atualizar_cliente(cpf, "limite_credito", float(novo_limite))
+        return True
+
+    def existing_cpfs(self, cpfs: Iterable[str]) -> set[str]:
+        """Filtra os CPFs que existem na base de clientes."""
+        cpfs = list(cpfs)
+        encontrados: set[str] = set()
+
+        try:
+            conn = self._conexao()
+            # Limite de parâmetros por consulta do SQLite
+            for i in range(0, len(cpfs), 500):
+                lote = cpfs[i:i + 500]
+                marcadores = ",".join("?" * len(lote))
+                rows = conn.execute(
+                    f"SELECT cpf FROM clientes WHERE cpf IN ({marcadores})",
+                    lote
+                ).fetchall()
+                encontrados.update(row["cpf"] for row in rows)
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao consultar clientes: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+        return encontrados
+
+    def update_client_scores_bulk(self, scores: Mapping[str, int]) -> int:
+        """Atualiza o score de vários clientes em uma única transação."""
+        if any(not 0 <= score <= 1000 for score in scores.values()):
+            raise ValueError("Score deve estar entre 0 e 1000")
+
+        try:
+            with self._conexao() as conn:
+                antes = conn.total_changes
+                conn.executemany(
+                    "UPDATE clientes SET score_credito = ? WHERE cpf = ?",
+                    [(int(score), cpf) for cpf, score in scores.items()]
+                )
+                return conn.total_changes - antes
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao atualizar scores: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+    def _inserir_solicitacao(self, conn: sqlite3.Connection, solicitacao: SolicitacaoAumento) -> None:
+        """Insere a solicitação na transação corrente."""
+        conn.execute(
+            "INSERT INTO solicitacoes_aumento_limite ("
+            "cpf_cliente, data_hora_solicitacao, limite_atual, "
+            "novo_limite_solicitado, status_pedido) VALUES (?, ?, ?, ?, ?)",
+            (
+                solicitacao.cpf_cliente,
+                solicitacao.data_hora_solicitacao.isoformat(),
+                solicitacao.limite_atual,
+                solicitacao.novo_limite_solicitado,
+                solicitacao.status_pedido
+            )
+        )
+
+    def create_limit_request(self, solicitacao: SolicitacaoAumento) -> bool:
+        """Registra uma solicitação de aumento de limite."""
+        try:
+            with self._conexao() as conn:
+                self._inserir_solicitacao(conn, solicitacao)
+            return True
+
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao criar solicitacao: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+    def process_limit_request(self, solicitacao: SolicitacaoAumento) -> bool:
+        """
+        Registra uma solicitação e, se aprovada, aplica o novo limite
+        na mesma transação.
+        """
+        cpf = solicitacao.cpf_cliente
+
+        try:
+            with self._conexao() as conn:
+                if solicitacao.status_pedido == "aprovado":
+                    cursor = conn.execute(
+                        "UPDATE clientes SET limite_credito = ? WHERE cpf = ?",
+                        (float(solicitacao.novo_limite_solicitado), cpf)
+                    )
+                    if cursor.rowcount == 0:
+                        raise DataAccessError(f"Cliente com CPF {cpf} nao encontrado")
+
+                self._inserir_solicitacao(conn, solicitacao)
+            return True
+
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao processar solicitacao: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+    def _limites_por_score(self) -> list[float]:
+        """
+        Retorna a tabela score -> limite máximo compilada.
+
+        A tabela é recompilada só quando a versão de score_limite no banco
+        muda (importação feita por este ou por outro processo).
+        """
+        with self._limites_lock:
+            try:
+                conn = self._conexao()
+                row = conn.execute(
+                    "SELECT versao FROM versao_dados WHERE tabela = 'score_limite'"
+                ).fetchone()
+                versao = row[0] if row else 0
+
+                if self._limites is None or self._limites[0] != versao:
+                    rows = conn.execute(
+                        "SELECT score_minimo, score_maximo, limite_maximo FROM score_limite"
+                    ).fetchall()
+                    self._limites = (versao, compilar_faixas_score(tuple(row) for row in rows))
+            except Exception as e:
+                raise DataAccessError(
+                    f"Erro ao carregar score_limite: {str(e)}",
+                    filepath=str(self.db_path)
+                )
+            return self._limites[1]
+
+    def get_max_limit_for_score(self, score: int) -> float:
+        """Retorna o limite máximo permitido para um score."""
+        limite = buscar_limite_compilado(self._limites_por_score(), score)
+
+        if limite is None:
+            raise DataAccessError(
+                f"Erro ao consultar score_limite: Nenhuma faixa encontrada para score {score}",
+                filepath=str(self.db_path)
+            )
+
+        return limite
+
+    def get_all_score_limits(self) -> list[ScoreLimite]:
+        """Retorna todas as faixas de score e limite."""
+        try:
+            rows = self._conexao().execute(
+                "SELECT score_minimo, score_maximo, limite_maximo "
+                "FROM score_limite ORDER BY score_minimo"
+            ).fetchall()
+            return [ScoreLimite(**dict(row)) for row in rows]
+        except Exception as e:
+            raise DataAccessError(
+                f"Erro ao carregar faixas de score: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+    def import_from_csv(self, sobrescrever_clientes: bool = False) -> dict[str, int]:
+        """
+        Importa os CSVs de data_path para o banco.
+
+        A importação pode ser repetida sem desfazer o que mudou no banco:
+        clientes que já existem (mesmo CPF) são mantidos, e solicitações
+        que já existem (mesmo CPF e data/hora) não são duplicadas. Faixas
+        de score são substituídas.
+
+        Args:
+            sobrescrever_clientes: Se True, clientes existentes recebem os
+                dados do CSV (limite e score voltam aos do arquivo)
+
+        Returns:
+            Dict com o número de linhas gravadas por tabela (para clientes
+            sem sobrescrever e para solicitações, só as novas)
+        """
+        try:
+            clientes = pd.read_csv(self.clientes_file, dtype={"cpf": str})
+            faixas = pd.read_csv(self.score_limite_file)
+            try:
+                solicitacoes = pd.read_csv(self.solicitacoes_file, dtype={"cpf_cliente": str})
+            except FileNotFoundError:
+                solicitacoes = pd.DataFrame(columns=SOLICITACOES_COLUNAS)
+        except Exception as e:
+            raise DataAccessError(f"Erro ao ler CSVs para importacao: {str(e)}")
+
+        try:
+            with self._conexao() as conn:
+                antes = conn.total_changes
+                conn.executemany(
+                    f"INSERT OR {'REPLACE' if sobrescrever_clientes else 'IGNORE'} INTO clientes ("
+                    "cpf, nome, data_nascimento, limite_credito, score_credito) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (r["cpf"], r["nome"], r["data_nascimento"],
+                         float(r["limite_credito"]), int(r["score_credito"]))
+                        for r in clientes.to_dict(orient="records")
+                    ]
+                )
+                clientes_gravados = conn.total_changes - antes
+
+                conn.execute("DELETE FROM score_limite")
+                conn.executemany(
+                    "INSERT INTO score_limite (score_minimo, score_maximo, limite_maximo) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (int(r["score_minimo"]), int(r["score_maximo"]), float(r["limite_maximo"]))
+                        for r in faixas.to_dict(orient="records")
+                    ]
+                )
+                antes = conn.total_changes
+                conn.executemany(
+                    "INSERT INTO solicitacoes_aumento_limite ("
+                    "cpf_cliente, data_hora_solicitacao, limite_atual, "
+                    "novo_limite_solicitado, status_pedido) "
+                    "SELECT ?1, ?2, ?3, ?4, ?5 WHERE NOT EXISTS ("
+                    "SELECT 1 FROM solicitacoes_aumento_limite "
+                    "WHERE cpf_cliente = ?1 AND data_hora_solicitacao = ?2)",
+                    [
+                        (r["cpf_cliente"], r["data_hora_solicitacao"], float(r["limite_atual"]),
+                         float(r["novo_limite_solicitado"]), r["status_pedido"])
+                        for r in solicitacoes.to_dict(orient="records")
+                    ]
+                )
+                novas_solicitacoes = conn.total_changes - antes
+
+                conn.execute(
+                    "INSERT INTO versao_dados (tabela, versao) VALUES ('score_limite', 1) "
+                    "ON CONFLICT(tabela) DO UPDATE SET versao = versao + 1"
+                )
+        except sqlite3.Error as e:
+            raise DataAccessError(
+                f"Erro ao importar dados: {str(e)}",
+                filepath=str(self.db_path)
+            )
+
+        # Faixas foram substituídas: recompilar na próxima consulta
+        with self._limites_lock:
+            self._limites = None
+
+        return {
+            "clientes": clientes_gravados,
+            "score_limite": len(faixas),
+            "solicitacoes_aumento_limite": novas_solicitacoes
+        }
@@ -3,7 +3,7 @@
 from langchain.tools import tool
 from typing import Dict, Any, Annotated
 
-from src.services.data_service import DataService
+from src.services.data_service import get_data_service
 from src.utils.exceptions import AuthenticationError, DataAccessError
 from src.utils.validators import limpar_cpf
 from src.utils.observability import observe_tool
@@ -46,7 +46,7 @@ def authenticate_client(cpf: str, data_nascimento: str) -> Dict[str, Any]:
         cpf_limpo = limpar_cpf(cpf)
 
         # Tentar autenticar
-        data_service = DataService()
+        data_service = get_data_service()
         cliente = data_service.authenticate_client(cpf_limpo, data_nascimento)
 
         if cliente is None:
@@ -107,7 +107,7 @@ def get_client_info(cpf: str) -> Dict[str, Any]:
     try:
         cpf_limpo = limpar_cpf(cpf)
 
-        data_service = DataService()
+        data_service = get_data_service()
         cliente = data_service.get_client_by_cpf(cpf_limpo)
 
         if cliente is None:
@@ -4,7 +4,7 @@ from langchain.tools import tool
 from typing import Dict, Any, Annotated
 from datetime import datetime
 
-from src.services.data_service import DataService
+from src.services.data_service import get_data_service
 from src.services.score_service import ScoreService
 from src.models.schemas import SolicitacaoAumento
 from src.utils.validators import limpar_cpf
@@ -45,7 +45,7 @@ def get_credit_limit(cpf: str) -> Dict[str, Any]:
     try:
         cpf_limpo = limpar_cpf(cpf)
 
-        data_service = DataService()
+        data_service = get_data_service()
         cliente = data_service.get_client_by_cpf(cpf_limpo)
 
         if cliente is None:
@@ -84,8 +84,8 @@ def request_limit_increase(cpf: str, novo_limite: float) -> Dict[str, Any]:
     2. Consulta o limite maximo permitido para o score
     3. Valida se o novo limite solicitado e permitido
     4. Aprova ou rejeita automaticamente
-    5. Registra a solicitacao em CSV
-    6. Se aprovado, atualiza o limite do cliente
+    5. Registra a solicitacao e, se aprovado, atualiza o limite do cliente
+       (em uma unica operacao)
 
     Args:
         cpf: CPF do cliente
@@ -115,7 +115,7 @@ def request_limit_increase(cpf: str, novo_limite: float) -> Dict[str, Any]:
         cpf_limpo = limpar_cpf(cpf)
 
         # Buscar dados do cliente
-        data_service = DataService()
+        data_service = get_data_service()
         cliente = data_service.get_client_by_cpf(cpf_limpo)
 
         if cliente is None:
@@ -158,13 +158,10 @@ def request_limit_increase(cpf: str, novo_limite: float) -> Dict[str, Any]:
             status_pedido=status
         )
 
-        # Registrar no CSV
-        data_service.create_limit_request(solicitacao)
+        # Registrar a solicitação e, se aprovada, aplicar o novo limite
+        data_service.process_limit_request(solicitacao)
 
-        # Se aprovado, atualizar limite do cliente
         if is_valid:
-            data_service.update_client_limit(cpf_limpo, novo_limite)
-
             return {
                 "success": True,
                 "approved": True,
@@ -224,7 +221,7 @@ def check_max_limit_for_score(score: int) -> Dict[str, Any]:
         }
     """
     try:
-        data_service = DataService()
+        data_service = get_data_service()
         limite_maximo = data_service.get_max_limit_for_score(score)
 
         classificacao = ScoreService.get_score_classification(score)
@@ -1,14 +1,111 @@
 """Tools de cambio para o Agente de Cambio."""
 
 from langchain.tools import tool
-from typing import Dict, Any, Annotated
+from datetime import datetime
+from typing import Dict, Any, Annotated, Optional
 
+from src.models.schemas import CotacaoMoeda
 from src.services.exchange_service import ExchangeService
+from src.services.async_exchange_service import AsyncExchangeService
 from src.utils.exceptions import ExchangeAPIError
-from src.utils.formatters import formatar_data_br
+from src.utils.formatters import formatar_data_br, formatar_moeda_br
 from src.utils.observability import observe_tool
 
 
+# ==============================================================================
+# FORMATACAO DAS RESPOSTAS (compartilhada pelas versoes sincrona e assincrona)
+# ==============================================================================
+
+def _aviso_desatualizada(desatualizada_desde: Optional[datetime]) -> str:
+    """Texto anexado à mensagem quando a cotação é a última conhecida."""
+    if desatualizada_desde is None:
+        return ""
+
+    return (
+        " (API de cambio indisponivel: ultima cotacao conhecida, "
+        f"de {formatar_data_br(desatualizada_desde)})"
+    )
+
+
+def _resposta_cotacao(cotacao: CotacaoMoeda) -> Dict[str, Any]:
+    """Monta a resposta de get_exchange_rate."""
+    # Formatar taxa em reais
+    taxa_formatada = f"R$ {cotacao.taxa:.2f}".replace(".", ",")
+
+    return {
+        "success": True,
+        "message": (
+            f"Cotacao atual: 1 {cotacao.moeda} = {taxa_formatada}"
+            + _aviso_desatualizada(cotacao.desatualizada_desde)
+        ),
+        "data": {
+            "moeda": cotacao.moeda,
+            "taxa": cotacao.taxa,
+            "taxa_formatada": taxa_formatada,
+            "data_hora": formatar_data_br(cotacao.data_hora),
+            "descricao": f"1 {cotacao.moeda} = {taxa_formatada}",
+            "desatualizada": cotacao.desatualizada_desde is not None
+        }
+    }
+
+
+def _resposta_multiplas(cotacoes: Dict[str, CotacaoMoeda]) -> Dict[str, Any]:
+    """Monta a resposta de get_multiple_exchange_rates."""
+    resultado = {}
+    for moeda_code, cotacao in cotacoes.items():
+        taxa_formatada = f"R$ {cotacao.taxa:.2f}".replace(".", ",")
+        resultado[moeda_code] = {
+            "taxa": cotacao.taxa,
+            "taxa_formatada": taxa_formatada,
+            "descricao": f"1 {moeda_code} = {taxa_formatada}",
+            "desatualizada": cotacao.desatualizada_desde is not None
+        }
+
+    desatualizada_desde = min(
+        (c.desatualizada_desde for c in cotacoes.values() if c.desatualizada_desde),
+        default=None
+    )
+
+    return {
+        "success": True,
+        "message": (
+            f"{len(resultado)} cotacoes obtidas com sucesso."
+            + _aviso_desatualizada(desatualizada_desde)
+        ),
+        "data": resultado
+    }
+
+
+def _resposta_conversao(valor: float, origem: str, destino: str, valor_convertido: float,
+                        taxa: float, desatualizada_desde: Optional[datetime] = None) -> Dict[str, Any]:
+    """Monta a resposta de convert_currency."""
+    # Formatar valores
+    if destino == "BRL":
+        valor_formatado = formatar_moeda_br(valor_convertido)
+    else:
+        valor_formatado = formatar_moeda_br(valor_convertido).replace("R$ ", "") + f" {destino}"
+
+    dados = {
+        "valor_origem": valor,
+        "moeda_origem": origem,
+        "moeda_destino": destino,
+        "valor_convertido": valor_convertido,
+        "valor_convertido_formatado": valor_formatado,
+        "taxa": taxa,
+        "desatualizada": desatualizada_desde is not None
+    }
+
+    if destino == "BRL":
+        dados["valor_brl"] = valor_convertido
+        dados["valor_brl_formatado"] = valor_formatado
+
+    return {
+        "success": True,
+        "message": f"{valor} {origem} = {valor_formatado}" + _aviso_desatualizada(desatualizada_desde),
+        "data": dados
+    }
+
+
 @tool
 def get_exchange_rate(moeda: str = "USD") -> Dict[str, Any]:
     """
@@ -53,20 +150,7 @@ def get_exchange_rate(moeda: str = "USD") -> Dict[str, Any]:
         exchange_service = ExchangeService()
         cotacao = exchange_service.get_rate(moeda_upper)
 
-        # Formatar taxa em reais
-        taxa_formatada = f"R$ {cotacao.taxa:.2f}".replace(".", ",")
-
-        return {
-            "success": True,
-            "message": f"Cotacao atual: 1 {cotacao.moeda} = {taxa_formatada}",
-            "data": {
-                "moeda": cotacao.moeda,
-                "taxa": cotacao.taxa,
-                "taxa_formatada": taxa_formatada,
-                "data_hora": formatar_data_br(cotacao.data_hora),
-                "descricao": f"1 {cotacao.moeda} = {taxa_formatada}"
-            }
-        }
+        return _resposta_cotacao(cotacao)
 
     except ExchangeAPIError as e:
         return {
@@ -115,21 +199,7 @@ def get_multiple_exchange_rates(moedas: str) -> Dict[str, Any]:
         exchange_service = ExchangeService()
         cotacoes = exchange_service.get_multiple_rates(lista_moedas)
 
-        # Formatar resultado
-        resultado = {}
-        for moeda_code, cotacao in cotacoes.items():
-            taxa_formatada = f"R$ {cotacao.taxa:.2f}".replace(".", ",")
-            resultado[moeda_code] = {
-                "taxa": cotacao.taxa,
-                "taxa_formatada": taxa_formatada,
-                "descricao": f"1 {moeda_code} = {taxa_formatada}"
-            }
-
-        return {
-            "success": True,
-            "message": f"{len(resultado)} cotacoes obtidas com sucesso.",
-            "data": resultado
-        }
+        return _resposta_multiplas(cotacoes)
 
     except Exception as e:
         return {
@@ -140,13 +210,17 @@ def get_multiple_exchange_rates(moedas: str) -> Dict[str, Any]:
 
 
 @tool
-def convert_currency(valor: float, moeda_origem: str = "USD") -> Dict[str, Any]:
+def convert_currency(valor: float, moeda_origem: str = "USD", moeda_destino: str = "BRL") -> Dict[str, Any]:
     """
-    Converte um valor de moeda estrangeira para Reais (BRL).
+    Converte um valor entre duas moedas (padrao: para Reais - BRL).
+
+    Aceita qualquer par de moedas suportadas, inclusive entre duas moedas
+    estrangeiras (ex: EUR para USD) ou de BRL para outra moeda.
 
     Args:
-        valor: Valor em moeda estrangeira
-        moeda_origem: Codigo da moeda (padrao: USD)
+        valor: Valor na moeda de origem
+        moeda_origem: Codigo da moeda de origem (padrao: USD)
+        moeda_destino: Codigo da moeda de destino (padrao: BRL)
 
     Returns:
         Dict com valor convertido
@@ -159,39 +233,171 @@ def convert_currency(valor: float, moeda_origem: str = "USD") -> Dict[str, Any]:
             "data": {
                 "valor_origem": 100,
                 "moeda_origem": "USD",
+                "moeda_destino": "BRL",
+                "valor_convertido": 525.00,
                 "valor_brl": 525.00,
                 "taxa": 5.25
             }
         }
     """
     try:
-        moeda_upper = moeda_origem.upper().strip()
+        origem = moeda_origem.upper().strip()
+        destino = moeda_destino.upper().strip()
 
-        # Obter taxa
+        # Converter (matriz em memoria ou cotacoes ao vivo)
         exchange_service = ExchangeService()
-        cotacao = exchange_service.get_rate(moeda_upper)
+        valor_convertido, taxa, desatualizada_desde = exchange_service.convert(valor, origem, destino)
+
+        return _resposta_conversao(valor, origem, destino, valor_convertido, taxa, desatualizada_desde)
+
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Erro ao converter: {str(e)}",
+            "data": None
+        }
+
+
+@tool
+def get_exchange_rate_history(moeda: str = "USD", horas: float = 24) -> Dict[str, Any]:
+    """
+    Consulta o historico recente de cotacao de uma moeda (sem chamar a API).
+
+    Use para perguntas sobre variacao, como "como o dolar variou hoje?" ou
+    "qual foi a maxima do euro nas ultimas horas?". Os dados sao as cotacoes
+    ja obtidas pelo sistema durante a janela pedida.
+
+    Args:
+        moeda: Codigo da moeda (3 letras). Padrao: "USD"
+        horas: Janela em horas ate agora. Padrao: 24
+
+    Returns:
+        Dict com minima, maxima, media, variacao e ultimas cotacoes
+
+    Example:
+        >>> get_exchange_rate_history("USD", 24)
+        {
+            "success": True,
+            "message": "USD nas ultimas 24h: minima R$ 5,21, maxima R$ 5,31, ...",
+            "data": {
+                "moeda": "USD",
+                "minimo": 5.21,
+                "maximo": 5.31,
+                "media": 5.26,
+                "variacao_percentual": 0.38,
+                ...
+            }
+        }
+    """
+    try:
+        moeda_upper = moeda.upper().strip()
+
+        exchange_service = ExchangeService()
+        historico = exchange_service.get_rate_history(moeda_upper, horas)
 
-        # Calcular conversão
-        valor_brl = valor * cotacao.taxa
+        if historico is None:
+            return {
+                "success": False,
+                "message": f"Ainda nao ha historico de {moeda_upper} nas ultimas {horas:g}h.",
+                "data": None
+            }
 
-        # Formatar valores
-        valor_brl_formatado = f"R$ {valor_brl:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+        reais = formatar_moeda_br
+        variacao = f"{historico['variacao_percentual']:+.2f}%".replace(".", ",")
 
         return {
             "success": True,
-            "message": f"{valor} {moeda_upper} = {valor_brl_formatado}",
+            "message": (
+                f"{moeda_upper} nas ultimas {horas:g}h: minima {reais(historico['minimo'])}, "
+                f"maxima {reais(historico['maximo'])}, media {reais(historico['media'])}, "
+                f"variacao {variacao} (de {reais(historico['primeira'])} para {reais(historico['ultima'])})"
+            ),
             "data": {
-                "valor_origem": valor,
-                "moeda_origem": moeda_upper,
-                "valor_brl": valor_brl,
-                "valor_brl_formatado": valor_brl_formatado,
-                "taxa": cotacao.taxa
+                "moeda": moeda_upper,
+                "horas": horas,
+                "amostras": historico["amostras"],
+                "minimo": historico["minimo"],
+                "maximo": historico["maximo"],
+                "media": historico["media"],
+                "primeira": historico["primeira"],
+                "ultima": historico["ultima"],
+                "variacao": historico["variacao"],
+                "variacao_percentual": historico["variacao_percentual"],
+                "inicio": formatar_data_br(historico["inicio"]),
+                "fim": formatar_data_br(historico["fim"]),
+                "ultimas": [
+                    {"data_hora": formatar_data_br(data_hora), "taxa": taxa}
+                    for data_hora, taxa in historico["ultimas"]
+                ]
             }
         }
 
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Erro ao consultar historico: {str(e)}",
+            "data": None
+        }
+
+
+# ==============================================================================
+# VERSOES ASSINCRONAS
+# Usadas automaticamente quando o agente é executado com ainvoke/astream,
+# permitindo sobrepor consultas de cotação com outras tarefas.
+# ==============================================================================
+
+async def _aget_exchange_rate(moeda: str = "USD") -> Dict[str, Any]:
+    """Versão assíncrona de get_exchange_rate."""
+    try:
+        cotacao = await AsyncExchangeService().get_rate(moeda.upper().strip())
+        return _resposta_cotacao(cotacao)
+
+    except ExchangeAPIError as e:
+        return {
+            "success": False,
+            "message": f"Erro ao consultar cotacao: {e.message}",
+            "data": None
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Erro inesperado: {str(e)}",
+            "data": None
+        }
+
+
+async def _aget_multiple_exchange_rates(moedas: str) -> Dict[str, Any]:
+    """Versão assíncrona de get_multiple_exchange_rates."""
+    try:
+        lista_moedas = [m.strip().upper() for m in moedas.split(",")]
+        cotacoes = await AsyncExchangeService().get_multiple_rates(lista_moedas)
+        return _resposta_multiplas(cotacoes)
+
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Erro ao consultar cotacoes: {str(e)}",
+            "data": None
+        }
+
+
+async def _aconvert_currency(valor: float, moeda_origem: str = "USD", moeda_destino: str = "BRL") -> Dict[str, Any]:
+    """Versão assíncrona de convert_currency."""
+    try:
+        origem = moeda_origem.upper().strip()
+        destino = moeda_destino.upper().strip()
+        valor_convertido, taxa, desatualizada_desde = await AsyncExchangeService().convert(valor, origem, destino)
+        return _resposta_conversao(valor, origem, destino, valor_convertido, taxa, desatualizada_desde)
+
     except Exception as e:
         return {
             "success": False,
             "message": f"Erro ao converter: {str(e)}",
             "data": None
         }
+
+
+get_exchange_rate.coroutine = _aget_exchange_rate
+get_multiple_exchange_rates.coroutine = _aget_multiple_exchange_rates
+convert_currency.coroutine = _aconvert_currency
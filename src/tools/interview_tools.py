@@ -3,7 +3,7 @@
 from langchain.tools import tool
 from typing import Dict, Any, Annotated
 
-from src.services.data_service import DataService
+from src.services.data_service import get_data_service
 from src.services.score_service import ScoreService
 from src.models.schemas import DadosFinanceiros
 from src.utils.validators import limpar_cpf
@@ -72,7 +72,7 @@ def calculate_new_score(
         cpf_limpo = limpar_cpf(cpf)
 
         # Buscar cliente
-        data_service = DataService()
+        data_service = get_data_service()
         cliente = data_service.get_client_by_cpf(cpf_limpo)
 
         if cliente is None:
@@ -193,7 +193,7 @@ def update_client_score(cpf: str, novo_score: int) -> Dict[str, Any]:
         cpf_limpo = limpar_cpf(cpf)
 
         # Buscar cliente para pegar score anterior
-        data_service = DataService()
+        data_service = get_data_service()
         cliente = data_service.get_client_by_cpf(cpf_limpo)
 
         if cliente is None:
@@ -0,0 +1,166 @@
+"""Circuit breaker para chamadas a serviços externos."""
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+# Estados do circuito
+FECHADO = "fechado"
+ABERTO = "aberto"
+MEIO_ABERTO = "meio_aberto"
+
+
+class CircuitBreaker:
+    """
+    Interrompe chamadas a um serviço externo depois de falhas seguidas.
+
+    - Fechado: chamadas passam normalmente. Após `limite_falhas` falhas
+      consecutivas, o circuito abre.
+    - Aberto: chamadas são recusadas na hora (sem rede) durante
+      `tempo_aberto` segundos.
+    - Meio-aberto: passado esse tempo, uma única chamada de teste é
+      liberada; sucesso fecha o circuito, falha o abre de novo.
+
+    Também guarda o resultado da última chamada, usado como estado de
+    saúde em cache (veja `saudavel`).
+
+    Example:
+        >>> disjuntor = CircuitBreaker(limite_falhas=3, tempo_aberto=30)
+        >>> if disjuntor.permitir():
+        ...     try:
+        ...         chamar_servico()
+        ...         disjuntor.registrar_sucesso()
+        ...     except Exception:
+        ...         disjuntor.registrar_falha()
+    """
+
+    def __init__(self, limite_falhas: int, tempo_aberto: float):
+        """
+        Args:
+            limite_falhas: Falhas consecutivas que abrem o circuito
+            tempo_aberto: Segundos que o circuito fica aberto antes do teste
+        """
+        self.limite_falhas = max(1, limite_falhas)
+        self.tempo_aberto = tempo_aberto
+
+        self._estado = FECHADO
+        self._falhas_seguidas = 0
+        self._aberto_em = 0.0
+        self._teste_em: Optional[float] = None
+        self._ultimo_resultado: Optional[bool] = None
+        self._ultimo_resultado_em = 0.0
+        self._lock = threading.Lock()
+
+        self.recusadas = 0
+        self.aberturas = 0
+
+    @property
+    def estado(self) -> str:
+        """Estado atual (FECHADO, ABERTO ou MEIO_ABERTO)."""
+        with self._lock:
+            return self._estado
+
+    def permitir(self) -> bool:
+        """
+        Indica se uma chamada pode ser feita agora.
+
+        Com o circuito aberto e o tempo esgotado, passa para meio-aberto e
+        libera apenas o chamador atual como teste. Um teste que não
+        registrou resultado em `tempo_aberto` segundos é considerado
+        perdido e outro é liberado.
+
+        Returns:
+            False se a chamada deve falhar imediatamente
+        """
+        with self._lock:
+            agora = time.monotonic()
+
+            if self._estado == FECHADO:
+                return True
+
+            if self._estado == ABERTO and agora - self._aberto_em >= self.tempo_aberto:
+                self._estado = MEIO_ABERTO
+                self._teste_em = agora
+                return True
+
+            if self._estado == MEIO_ABERTO and agora - self._teste_em >= self.tempo_aberto:
+                self._teste_em = agora
+                return True
+
+            self.recusadas += 1
+            return False
+
+    def recusando(self) -> bool:
+        """
+        Indica, sem liberar teste, se o circuito está recusando chamadas.
+
+        Útil para falhar antes de qualquer espera (filas, agrupamento).
+
+        Returns:
+            True se o circuito está aberto e o tempo aberto não se esgotou
+        """
+        with self._lock:
+            if self._estado == ABERTO and time.monotonic() - self._aberto_em < self.tempo_aberto:
+                self.recusadas += 1
+                return True
+            return False
+
+    def registrar_sucesso(self) -> None:
+        """Registra uma chamada bem-sucedida (fecha o circuito)."""
+        with self._lock:
+            self._estado = FECHADO
+            self._falhas_seguidas = 0
+            self._teste_em = None
+            self._ultimo_resultado = True
+            self._ultimo_resultado_em = time.monotonic()
+
+    def registrar_falha(self) -> None:
+        """Registra uma falha (pode abrir o circuito)."""
+        with self._lock:
+            agora = time.monotonic()
+            self._falhas_seguidas += 1
+            self._ultimo_resultado = False
+            self._ultimo_resultado_em = agora
+
+            if self._estado == MEIO_ABERTO or self._falhas_seguidas >= self.limite_falhas:
+                if self._estado != ABERTO:
+                    self.aberturas += 1
+                self._estado = ABERTO
+                self._aberto_em = agora
+                self._teste_em = None
+
+    def saudavel(self, ttl: float) -> Optional[bool]:
+        """
+        Estado de saúde em cache, sem chamar o serviço.
+
+        Args:
+            ttl: Idade máxima (segundos) do último resultado para ser usado
+
+        Returns:
+            False se o circuito está aberto; o resultado da última chamada
+            se tiver até `ttl` segundos; None se é preciso consultar
+        """
+        with self._lock:
+            if self._estado == ABERTO and time.monotonic() - self._aberto_em < self.tempo_aberto:
+                return False
+
+            if self._ultimo_resultado is not None and time.monotonic() - self._ultimo_resultado_em <= ttl:
+                return self._ultimo_resultado
+
+            return None
+
+    def estatisticas(self) -> Dict:
+        """
+        Retorna o estado e os contadores do circuito.
+
+        Returns:
+            Dict com estado, falhas_seguidas, aberturas e recusadas
+        """
+        with self._lock:
+            return {
+                "estado": self._estado,
+                "falhas_seguidas": self._falhas_seguidas,
+                "aberturas": self.aberturas,
+                "recusadas": self.recusadas
+            }
@@ -60,10 +60,11 @@ class LimitRequestError(BankingException):
 class ExchangeAPIError(BankingException):
     """Erro ao consultar API de câmbio."""
 
-    def __init__(self, message: str = "Erro ao consultar cotação", moeda: str = None):
+    def __init__(self, message: str = "Erro ao consultar cotação", moeda: str = None,
+                 status_code: int = None):
         super().__init__(
             message=message,
-            details={"moeda": moeda}
+            details={"moeda": moeda, "status_code": status_code}
         )
 
 
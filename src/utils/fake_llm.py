@@ -0,0 +1,137 @@
+"""LLM falso para benchmarks e execução sem chamadas à OpenAI."""
+
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+# Recebe as mensagens enviadas ao modelo e devolve o texto ou a AIMessage da resposta
+Responder = Callable[[List[BaseMessage]], Union[str, AIMessage]]
+
+
+# Passo de um roteiro: texto da resposta ou {"tool": nome, "args": {...}}
+Passo = Union[str, Dict[str, Any]]
+
+
+class RespostasRoteirizadas:
+    """
+    Responder que devolve respostas predeterminadas, na ordem.
+
+    Cada chamada ao modelo consome um passo: um texto (resposta final) ou
+    {"tool": nome, "args": {...}}, que vira uma chamada de função, como a
+    OpenAI faria. Acabados os passos, responde `padrao`.
+
+    Example:
+        >>> roteiro = RespostasRoteirizadas([
+        ...     {"tool": "get_credit_limit", "args": {"cpf": "12345678900"}},
+        ...     "Seu limite é de R$ 5.000,00.",
+        ... ])
+        >>> llm = FakeChatModel(responder=roteiro)
+    """
+
+    def __init__(self, passos: Iterable[Passo] = (), padrao: str = "Posso ajudar com mais alguma coisa?"):
+        self.padrao = padrao
+        self._passos = deque(passos)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def de_arquivo(cls, caminho: Union[str, Path]) -> "RespostasRoteirizadas":
+        """Carrega os passos de um arquivo JSON (lista de passos)."""
+        return cls(json.loads(Path(caminho).read_text(encoding="utf-8")))
+
+    def carregar(self, passos: Iterable[Passo]) -> None:
+        """Substitui os passos restantes (ex.: os de um novo turno)."""
+        with self._lock:
+            self._passos = deque(passos)
+
+    def restantes(self) -> int:
+        """Número de passos ainda não consumidos."""
+        with self._lock:
+            return len(self._passos)
+
+    def __call__(self, mensagens: List[BaseMessage]) -> Union[str, AIMessage]:
+        with self._lock:
+            passo = self._passos.popleft() if self._passos else self.padrao
+
+        if isinstance(passo, dict):
+            return AIMessage(
+                content="",
+                additional_kwargs={"function_call": {
+                    "name": passo["tool"],
+                    "arguments": json.dumps(passo.get("args", {}))
+                }}
+            )
+        return passo
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model que responde com uma função Python, sem rede.
+
+    Compatível com create_openai_functions_agent: para chamar uma tool, o
+    responder devolve uma AIMessage com additional_kwargs["function_call"].
+
+    Com streaming=True, respostas em texto são entregues palavra a palavra
+    (esperando atraso_token segundos entre elas), como o ChatOpenAI.
+
+    Example:
+        >>> llm = FakeChatModel(responder=lambda mensagens: "Olá!")
+        >>> llm.invoke("oi").content
+        'Olá!'
+    """
+
+    responder: Responder = lambda mensagens: "ok"
+    streaming: bool = False
+    atraso_token: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        resposta = self.responder(messages)
+        if isinstance(resposta, str):
+            resposta = AIMessage(content=resposta)
+
+        return ChatResult(generations=[ChatGeneration(message=resposta)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        resposta = self.responder(messages)
+        if isinstance(resposta, AIMessage):
+            # Chamada de tool: um único chunk, como o function_call da OpenAI
+            if resposta.additional_kwargs.get("function_call") or not resposta.content:
+                yield ChatGenerationChunk(message=AIMessageChunk(
+                    content=resposta.content,
+                    additional_kwargs=resposta.additional_kwargs
+                ))
+                return
+            resposta = resposta.content
+
+        palavras = resposta.split(" ")
+        for i, palavra in enumerate(palavras):
+            if self.atraso_token:
+                time.sleep(self.atraso_token)
+            token = palavra if i == len(palavras) - 1 else palavra + " "
+            if run_manager:
+                run_manager.on_llm_new_token(token)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
@@ -0,0 +1,150 @@
+"""Funções de escrita em arquivos de dados."""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# umask do processo, lida uma vez: ler exige trocá-la, o que não é seguro
+# entre threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def file_lock(filepath: Path) -> Iterator[None]:
+    """
+    Lock exclusivo entre processos (e threads) para um arquivo de dados.
+
+    Usa um arquivo auxiliar "<arquivo>.lock" para que o arquivo de dados
+    possa ser substituído por rename enquanto o lock está ativo.
+
+    Args:
+        filepath: Arquivo de dados a proteger
+
+    Example:
+        >>> with file_lock(Path("data/clientes.csv")):
+        ...     ...  # ler, alterar e gravar
+    """
+    lock_path = Path(f"{filepath}.lock")
+
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.01)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write_text(filepath: Path, conteudo: str, encoding: str = "utf-8") -> None:
+    """
+    Grava um arquivo de forma atômica (arquivo temporário + rename).
+
+    Leitores concorrentes veem sempre a versão antiga ou a nova completa;
+    uma falha no meio da escrita nunca deixa o arquivo truncado. O arquivo
+    mantém as permissões do original (ou as padrão, se for novo), e não
+    as 0600 do temporário.
+
+    Args:
+        filepath: Arquivo de destino
+        conteudo: Conteúdo completo do arquivo
+        encoding: Codificação do texto
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=filepath.parent,
+        prefix=f".{filepath.name}.",
+        suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if filepath.exists():
+            shutil.copymode(filepath, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def append_csv_row(
+    filepath: Path,
+    colunas: Sequence[str],
+    valores: Sequence[Any],
+    fsync: bool = False
+) -> None:
+    """
+    Anexa uma linha a um CSV sem reler nem reescrever o arquivo.
+
+    Se o arquivo não existir (ou estiver vazio), o cabeçalho é escrito
+    antes da linha. O custo é O(1) independente do tamanho do arquivo.
+
+    Args:
+        filepath: Caminho do CSV
+        colunas: Nomes das colunas (usados como cabeçalho)
+        valores: Valores da linha, na mesma ordem de colunas
+        fsync: Se True, força a gravação em disco antes de retornar
+
+    Example:
+        >>> append_csv_row(Path("data/log.csv"), ["a", "b"], [1, 2])
+    """
+    if len(colunas) != len(valores):
+        raise ValueError("Numero de valores diferente do numero de colunas")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    with open(filepath, "a+b") as f:
+        tamanho = f.seek(0, os.SEEK_END)
+
+        if tamanho == 0:
+            writer.writerow(colunas)
+        else:
+            # Garantir que a linha anterior terminou com quebra de linha
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) not in (b"\n", b"\r"):
+                buffer.write("\n")
+
+        writer.writerow(valores)
+
+        # Uma única escrita; em modo append ela sempre vai para o fim
+        f.write(buffer.getvalue().encode("utf-8"))
+        f.flush()
+
+        if fsync:
+            os.fsync(f.fileno())
@@ -0,0 +1,201 @@
+"""Histórico da conversa com janela de turnos, resumo e limite de tokens."""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Mensagem do histórico: (papel, texto), como em estado["historico"]
+Mensagem = Tuple[str, str]
+
+# Recebe o resumo atual e as mensagens que saíram da janela; devolve o novo resumo
+Resumidor = Callable[[str, List[Mensagem]], str]
+
+# Tamanho máximo de cada mensagem no resumo de reserva (sem LLM)
+MAX_CARACTERES_RESUMO_RESERVA = 160
+
+
+@lru_cache(maxsize=4)
+def _codificador(modelo: str):
+    """Tokenizador tiktoken do modelo, ou None se indisponível (offline, sem pacote)."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(modelo)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Arquivo de vocabulário não baixado e sem rede
+        return None
+
+
+def contar_tokens(texto: str, modelo: str = "gpt-4o-mini") -> int:
+    """
+    Conta tokens com o tiktoken; sem ele, estima em ~4 caracteres por token.
+
+    Example:
+        >>> contar_tokens("Qual meu limite de crédito?") > 0
+        True
+    """
+    if not texto:
+        return 0
+
+    codificador = _codificador(modelo)
+    if codificador is None:
+        return (len(texto) + 3) // 4
+    return len(codificador.encode(texto))
+
+
+def resumo_de_reserva(resumo: str, mensagens: List[Mensagem]) -> str:
+    """Resumo sem LLM: acrescenta as mensagens antigas, truncadas, ao resumo atual."""
+    linhas = [resumo] if resumo else []
+    for papel, texto in mensagens:
+        autor = "Cliente" if papel == "user" else "Assistente"
+        texto = " ".join(texto.split())
+        if len(texto) > MAX_CARACTERES_RESUMO_RESERVA:
+            texto = texto[:MAX_CARACTERES_RESUMO_RESERVA - 3] + "..."
+        linhas.append(f"{autor}: {texto}")
+    return "\n".join(linhas)
+
+
+@dataclass
+class ContextoHistorico:
+    """Histórico preparado para um turno."""
+
+    mensagens: List[Mensagem]  # O que vai para o prompt (resumo + janela)
+    historico: List[Mensagem]  # Janela literal, a guardar no estado
+    resumo: str                # Resumo das mensagens anteriores à janela
+    tokens: Dict[str, int] = field(default_factory=dict)
+
+
+class GerenciadorHistorico:
+    """
+    Mantém o histórico enviado aos agentes com tamanho limitado.
+
+    - Os últimos `max_turnos` turnos (pergunta + resposta) vão literais.
+    - Os turnos que saem da janela são incorporados a um resumo, guardado
+      no estado; ele só é recalculado (de forma incremental, a partir do
+      resumo anterior) quando a janela anda.
+    - A janela anda em lotes: ela cresce até `max_turnos + lote_resumo - 1`
+      turnos e então volta a `max_turnos`, com um único resumo para os
+      `lote_resumo` turnos que saíram (e não um resumo a cada turno).
+    - Se resumo + janela passarem de `max_tokens`, os turnos mais antigos
+      da janela também vão para o resumo (a janela sempre mantém o último
+      turno, mesmo que ele sozinho passe do limite).
+
+    Não guarda estado próprio: tudo vem e volta pelo estado da sessão.
+
+    Example:
+        >>> gerenciador = GerenciadorHistorico(max_turnos=6, max_tokens=2000, lote_resumo=4)
+        >>> contexto = gerenciador.preparar(estado["historico"], estado.get("resumo_historico", ""))
+        >>> agente.processar(mensagem, contexto.mensagens, variaveis)
+    """
+
+    def __init__(
+        self,
+        max_turnos: int,
+        max_tokens: int,
+        resumir: Optional[Resumidor] = None,
+        lote_resumo: int = 1,
+        modelo: str = "gpt-4o-mini"
+    ):
+        """
+        Args:
+            max_turnos: Turnos mantidos literalmente (0 = sem limite)
+            max_tokens: Limite de tokens de resumo + janela (0 = sem limite)
+            resumir: Função que atualiza o resumo. Se None ou se falhar,
+                usa resumo_de_reserva
+            lote_resumo: Turnos que saem da janela de uma vez (1 = a cada turno)
+            modelo: Modelo usado na contagem de tokens
+        """
+        self.max_turnos = max_turnos
+        self.max_tokens = max_tokens
+        self.resumir = resumir
+        self.lote_resumo = max(1, lote_resumo)
+        self.modelo = modelo
+
+    def _tokens(self, mensagens: List[Mensagem]) -> int:
+        return sum(contar_tokens(texto, self.modelo) for _, texto in mensagens)
+
+    def _atualizar_resumo(self, resumo: str, mensagens: List[Mensagem]) -> str:
+        novo_resumo = None
+        if self.resumir is not None:
+            try:
+                novo_resumo = self.resumir(resumo, mensagens).strip()
+            except Exception:
+                pass  # Resumo de reserva abaixo; o turno não pode falhar por isso
+        if not novo_resumo:
+            novo_resumo = resumo_de_reserva(resumo, mensagens)
+
+        # O resumo ocupa no máximo metade do limite: descarta as linhas mais antigas
+        if self.max_tokens > 0:
+            linhas = novo_resumo.splitlines()
+            while len(linhas) > 1 and contar_tokens("\n".join(linhas), self.modelo) > self.max_tokens // 2:
+                linhas.pop(0)
+            novo_resumo = "\n".join(linhas)
+
+        return novo_resumo
+
+    def preparar(self, historico: List[Mensagem], resumo: str = "", mensagem: str = "") -> ContextoHistorico:
+        """
+        Aplica a janela e o limite de tokens ao histórico de um turno.
+
+        Args:
+            historico: Histórico ainda não resumido (estado["historico"])
+            resumo: Resumo atual (estado["resumo_historico"])
+            mensagem: Mensagem do turno (só para a contagem de tokens)
+
+        Returns:
+            ContextoHistorico com as mensagens do prompt, a nova janela, o
+            resumo e as contagens de tokens do turno
+        """
+        janela = list(historico)
+        saindo: List[Mensagem] = []
+
+        # Janela de turnos (cada turno = mensagem do cliente + resposta),
+        # que só anda quando acumula um lote inteiro além de max_turnos
+        if self.max_turnos > 0 and len(janela) >= 2 * (self.max_turnos + self.lote_resumo):
+            excesso = len(janela) - 2 * self.max_turnos
+            saindo, janela = janela[:excesso], janela[excesso:]
+
+        # Limite de tokens: tira da janela os turnos mais antigos. Havendo
+        # resumo, metade do limite fica reservada para ele (veja _atualizar_resumo)
+        if self.max_tokens > 0:
+            tokens_janela = self._tokens(janela)
+            while len(janela) > 2:
+                reserva_resumo = self.max_tokens // 2 if (resumo or saindo) else 0
+                if tokens_janela <= self.max_tokens - reserva_resumo:
+                    break
+                tokens_janela -= self._tokens(janela[:2])
+                saindo, janela = saindo + janela[:2], janela[2:]
+
+            # Já que vai resumir, aproveita e volta a janela a max_turnos
+            if saindo and self.max_turnos > 0 and len(janela) > 2 * self.max_turnos:
+                excesso = len(janela) - 2 * self.max_turnos
+                saindo, janela = saindo + janela[:excesso], janela[excesso:]
+
+        if saindo:
+            resumo = self._atualizar_resumo(resumo, saindo)
+
+        mensagens = ([("system", f"Resumo da conversa até aqui:\n{resumo}")] if resumo else []) + janela
+
+        tokens_resumo = contar_tokens(resumo, self.modelo)
+        tokens_janela = self._tokens(janela)
+        tokens_mensagem = contar_tokens(mensagem, self.modelo)
+
+        return ContextoHistorico(
+            mensagens=mensagens,
+            historico=janela,
+            resumo=resumo,
+            tokens={
+                "mensagem": tokens_mensagem,
+                "resumo": tokens_resumo,
+                "janela": tokens_janela,
+                "total": tokens_mensagem + tokens_resumo + tokens_janela,
+                "turnos_janela": len(janela) // 2,
+                "turnos_resumidos": len(saindo) // 2
+            }
+        )
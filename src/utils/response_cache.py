@@ -0,0 +1,145 @@
+"""Cache de respostas para perguntas que não dependem do cliente."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from src.intent_router import normalizar
+
+
+# Tipos de acerto
+EXATO = "exato"
+NORMALIZADO = "normalizado"
+
+_PONTUACAO = re.compile(r"[^\w\s]")
+
+
+def normalizar_pergunta(mensagem: str) -> str:
+    """
+    Forma canônica da pergunta: minúsculas, sem acentos, sem pontuação e
+    com espaços simples.
+
+    Example:
+        >>> normalizar_pergunta("  Quais serviços vocês oferecem?? ")
+        'quais servicos voces oferecem'
+    """
+    return " ".join(_PONTUACAO.sub(" ", normalizar(mensagem)).split())
+
+
+class CacheRespostas:
+    """
+    Cache LRU com TTL de respostas dos agentes.
+
+    A chave é (agente, mensagem, contexto), onde contexto são os campos do
+    estado que mudam a resposta (ex.: autenticado). Cada resposta é
+    guardada com duas chaves: a mensagem exata e a normalizada; a busca
+    tenta a exata primeiro. Quem decide o que pode ser guardado (e quando
+    o cache deve ser ignorado) é o orquestrador.
+
+    Example:
+        >>> cache = CacheRespostas(capacidade=512, ttl=3600)
+        >>> cache.guardar("triagem", "Quais serviços vocês oferecem?", (True,), "Oferecemos...")
+        >>> cache.obter("triagem", "quais servicos voces oferecem", (True,))
+        ('Oferecemos...', 'normalizado')
+    """
+
+    def __init__(self, capacidade: int, ttl: float):
+        """
+        Args:
+            capacidade: Máximo de chaves mantidas (as menos usadas saem primeiro)
+            ttl: Segundos de validade de cada resposta
+        """
+        self.capacidade = max(1, capacidade)
+        self.ttl = ttl
+
+        self._entradas: "OrderedDict[Tuple, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._consultas = 0
+        self._acertos = {EXATO: 0, NORMALIZADO: 0}
+        self._ignoradas = 0
+        self._guardadas = 0
+
+    def _buscar(self, chave: Tuple, agora: float) -> Optional[str]:
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            return None
+
+        resposta, expira_em = entrada
+        if agora >= expira_em:
+            del self._entradas[chave]
+            return None
+
+        self._entradas.move_to_end(chave)
+        return resposta
+
+    def obter(self, agente: str, mensagem: str, contexto: Hashable) -> Optional[Tuple[str, str]]:
+        """
+        Busca uma resposta guardada.
+
+        Args:
+            agente: Agente que responderia a mensagem
+            mensagem: Mensagem do cliente
+            contexto: Campos do estado que fazem parte da chave
+
+        Returns:
+            Tupla (resposta, EXATO | NORMALIZADO) ou None
+        """
+        agora = time.monotonic()
+
+        with self._lock:
+            self._consultas += 1
+
+            for tipo, texto in ((EXATO, mensagem.strip()), (NORMALIZADO, normalizar_pergunta(mensagem))):
+                resposta = self._buscar((tipo, agente, contexto, texto), agora)
+                if resposta is not None:
+                    self._acertos[tipo] += 1
+                    return resposta, tipo
+
+        return None
+
+    def guardar(self, agente: str, mensagem: str, contexto: Hashable, resposta: str) -> None:
+        """Guarda a resposta com as chaves exata e normalizada."""
+        expira_em = time.monotonic() + self.ttl
+
+        with self._lock:
+            for tipo, texto in ((EXATO, mensagem.strip()), (NORMALIZADO, normalizar_pergunta(mensagem))):
+                chave = (tipo, agente, contexto, texto)
+                self._entradas[chave] = (resposta, expira_em)
+                self._entradas.move_to_end(chave)
+
+            while len(self._entradas) > self.capacidade:
+                self._entradas.popitem(last=False)
+
+            self._guardadas += 1
+
+    def registrar_ignorada(self) -> None:
+        """Conta um turno em que o cache não pôde ser usado."""
+        with self._lock:
+            self._ignoradas += 1
+
+    def limpar(self) -> None:
+        """Descarta todas as respostas guardadas (mantém as estatísticas)."""
+        with self._lock:
+            self._entradas.clear()
+
+    def estatisticas(self) -> Dict:
+        """
+        Returns:
+            Dict com consultas, acertos (total, exatos, normalizados),
+            taxa_acerto, ignoradas, guardadas e tamanho
+        """
+        with self._lock:
+            acertos = sum(self._acertos.values())
+            return {
+                "consultas": self._consultas,
+                "acertos": acertos,
+                "acertos_exatos": self._acertos[EXATO],
+                "acertos_normalizados": self._acertos[NORMALIZADO],
+                "taxa_acerto": acertos / self._consultas if self._consultas else 0.0,
+                "ignoradas": self._ignoradas,
+                "guardadas": self._guardadas,
+                "tamanho": len(self._entradas)
+            }